@@ -9,6 +9,7 @@ just enough behaviour for our uses.
 
 from __future__ import annotations
 
+import os
 import types
 from dataclasses import asdict, dataclass, field
 from typing import Any, Callable, Dict, Generic, TypeVar
@@ -105,7 +106,61 @@ except ModuleNotFoundError:  # pragma: no cover – executed in slim envs only.
 
 from fastapi import FastAPI  # type: ignore  # noqa: E402  pylint: disable=wrong-import-position
 
+# ---------------------------------------------------------------------------
+# Numba fallback
+# ---------------------------------------------------------------------------
+
+
+try:
+    import numba  # type: ignore
+    from numba import njit, prange  # type: ignore  # noqa: F401
+
+    HAS_NUMBA = True
+
+    # Parallel kernels are launched from worker threads (asyncio.to_thread);
+    # the TBB layer can hang at interpreter exit in that case, so prefer
+    # OpenMP unless the user picked a threading layer explicitly.
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ModuleNotFoundError:  # pragma: no cover – executed in slim envs only.
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # noqa: D401
+        """No‑op stand‑in for :func:`numba.njit` – kernels run as plain Python."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ---------------------------------------------------------------------------
+# orjson fallback
+# ---------------------------------------------------------------------------
+
+
+try:
+    import orjson  # type: ignore
+
+    def json_dumps(obj: Any) -> str:  # noqa: D401
+        """Serialise *obj* to compact JSON text using *orjson*."""
+
+        return orjson.dumps(obj).decode()
+
+except ModuleNotFoundError:  # pragma: no cover – executed in slim envs only.
+    import json
+
+    def json_dumps(obj: Any) -> str:  # noqa: D401
+        """Serialise *obj* to compact JSON text using the standard library."""
+
+        return json.dumps(obj, separators=(",", ":"))
+
+
 __all__ = [
     "BaseModel",
     "FastAPI",
+    "HAS_NUMBA",
+    "json_dumps",
+    "njit",
+    "prange",
 ]
@@ -0,0 +1,26 @@
+"""Ahead‑of‑time compiled numerical kernels.
+
+The optional ``qmag_nav_kernels`` extension is produced by
+``python -m qmag_nav._native.build`` (requires *numba* and a C compiler).
+When it has been built, :func:`load` hands out its precompiled kernels so the
+hot paths skip both JIT warm‑up and dispatcher overhead; otherwise the
+``njit`` fallback supplied by the caller is used unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from qmag_nav._native import qmag_nav_kernels as K  # type: ignore[attr-defined]
+except ImportError:  # extension not built – stay on the JIT / pure‑Python path.
+    K = None
+
+
+def load(name: str, fallback: Callable[..., Any]) -> Callable[..., Any]:  # noqa: D401
+    """Return the AOT kernel *name* if available, otherwise *fallback*."""
+
+    return getattr(K, name, fallback)
+
+
+__all__ = ["K", "load"]
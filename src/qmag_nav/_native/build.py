@@ -0,0 +1,48 @@
+"""Build the ``qmag_nav_kernels`` extension with :mod:`numba.pycc`.
+
+Run ``python -m qmag_nav._native.build`` after installing the ``fast`` extra;
+the shared library is written next to this file and picked up automatically
+by :func:`qmag_nav._native.load`.  The kernels are compiled from the very same
+Python sources used by the ``njit`` path, so both stay in sync.
+"""
+
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC
+
+from qmag_nav.filter._ekf_kernel import _predict_kernel, _update_scalar_kernel
+from qmag_nav.mcp.tools.trajectory_simulation import _bezier_eval
+from qmag_nav.sensor.magnetometer import _ma_update
+
+
+def _py(func):  # noqa: ANN001, ANN202
+    """Return the undecorated Python function behind an ``njit`` dispatcher."""
+
+    return getattr(func, "py_func", func)
+
+
+cc = CC("qmag_nav_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    "bezier_eval",
+    "UniTuple(f8[:], 2)(f8, f8, f8, f8, f8, f8, f8[:])",
+)(_py(_bezier_eval))
+cc.export(
+    "ma_update",
+    "Tuple((i8, i8, f8, f8, f8))(f8[:, :], f8[:], i8, i8, f8, f8, f8)",
+)(_py(_ma_update))
+cc.export(
+    "ekf_predict",
+    "void(f8[::1], f8[:, ::1], f8[:, ::1], f8[:, ::1])",
+)(_py(_predict_kernel))
+cc.export(
+    "ekf_update_scalar",
+    "void(f8[::1], f8[:, ::1], f8, f8[::1], f8)",
+)(_py(_update_scalar_kernel))
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -8,24 +8,113 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+import zipfile
+from pathlib import Path
 from random import uniform
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import numpy as np
 
 from qmag_nav.models.geo import LatLon
 from qmag_nav.filter.ekf import NavEKF
 
 
-def _simulate_positions(steps: int) -> list[dict[str, float]]:
-    """Generate *steps* random positions around a reference point."""
+def _simulate_positions(steps: int) -> Iterator[dict[str, float]]:
+    """Yield *steps* random positions around a reference point."""
 
     ref = LatLon(lat=0.0, lon=0.0)
-    results: list[dict[str, float]] = []
     for _ in range(steps):
         # create tiny random offsets within ±0.001° (~100 m)
         pos = LatLon(lat=ref.lat + uniform(-0.001, 0.001), lon=ref.lon + uniform(-0.001, 0.001))
-        results.append({"lat": pos.lat, "lon": pos.lon})
-    return results
+        yield {"lat": pos.lat, "lon": pos.lon}
+
+
+def _write_json_array(
+    items: Iterable[Any], fp: TextIO, indent: Optional[int] = None
+) -> None:
+    """Stream *items* to *fp* as a JSON array, one element at a time.
+
+    The output is identical to ``json.dump(list(items), fp, indent=indent)``
+    without holding the list in memory.
+    """
+
+    if indent is None:
+        open_, sep, close = "[", ", ", "]"
+    else:
+        pad = " " * indent
+        open_, sep, close = "[\n" + pad, ",\n" + pad, "\n]"
+
+    first = True
+    for item in items:
+        text = json.dumps(item, indent=indent)
+        if indent is not None:
+            text = text.replace("\n", "\n" + pad)
+        fp.write((open_ if first else sep) + text)
+        first = False
+    fp.write("[]" if first else close)
+
+
+def _write_ndjson(items: Iterable[Any], fp: TextIO) -> None:
+    """Stream *items* to *fp* as newline-delimited JSON."""
+
+    for item in items:
+        fp.write(json.dumps(item) + "\n")
+
+
+def _state_path() -> Path:
+    """Location of the persisted ``estimate`` EKF state.
+
+    ``$QMAG_NAV_STATE`` overrides the default
+    ``$XDG_CACHE_HOME/qmag-nav/state.npz`` (``~/.cache`` when unset).
+    """
+
+    override = os.environ.get("QMAG_NAV_STATE")
+    if override:
+        return Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "qmag-nav" / "state.npz"
+
+
+def _load_ekf(path: Path) -> Optional[NavEKF]:
+    """Restore an EKF saved by :func:`_save_ekf`, or ``None`` if unavailable."""
+
+    try:
+        saved = np.load(path)
+        if not isinstance(saved, np.lib.npyio.NpzFile):
+            return None
+        with saved:
+            state, cov = saved["state"], saved["P"]
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    if state.shape != (4,) or cov.shape != (4, 4):
+        return None
+
+    ekf = NavEKF(initial=LatLon(lat=0.0, lon=0.0))
+    ekf.state[:] = state
+    ekf.P[:] = cov
+    return ekf
+
+
+def _save_ekf(ekf: NavEKF, path: Path) -> None:
+    """Persist the EKF state and covariance; failures only print a warning."""
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, state=ekf.state, P=ekf.P)
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"warning: could not save EKF state to {path}: {exc}", file=sys.stderr)
+
+
+def _reset_state() -> None:
+    """Drop the EKF persisted by ``estimate`` so the next call starts fresh."""
+
+    if hasattr(main, "_ekf"):
+        delattr(main, "_ekf")
 
 
 def main(argv: list[str] | None = None) -> None:  # noqa: D401
@@ -43,6 +132,8 @@ def main(argv: list[str] | None = None) -> None:  # noqa: D401
                            help="number of points to emit (default: 10)")
     sim_parser.add_argument("--output", type=str, default="-",
                            help="output file path (default: stdout)")
+    sim_parser.add_argument("--ndjson", action="store_true",
+                           help="emit one JSON object per line instead of an array")
 
     # Estimate command
     est_parser = subparsers.add_parser(
@@ -61,16 +152,29 @@ def main(argv: list[str] | None = None) -> None:  # noqa: D401
         data = _simulate_positions(args.steps)
         
         if args.output == "-":
-            json.dump(data, fp=sys.stdout)  # type: ignore[arg-type] – monkeypatch for tests
+            if args.ndjson:
+                _write_ndjson(data, sys.stdout)
+            else:
+                _write_json_array(data, sys.stdout)
         else:
             with open(args.output, "w") as f:
-                json.dump(data, fp=f, indent=2)
+                if args.ndjson:
+                    _write_ndjson(data, f)
+                else:
+                    _write_json_array(data, f, indent=2)
 
     if args.command == "estimate":
         # Singleton EKF stored on the function attribute (persist across calls
-        # in long‑running shell sessions / tests)
-        if not hasattr(main, "_ekf") or args.reset:
+        # in long‑running shell sessions / tests); a fresh process picks up
+        # the state saved by the previous invocation instead of (0, 0)
+        state_path = _state_path()
+        if args.reset:
             setattr(main, "_ekf", NavEKF(initial=LatLon(lat=0.0, lon=0.0)))
+        elif not hasattr(main, "_ekf"):
+            setattr(
+                main, "_ekf",
+                _load_ekf(state_path) or NavEKF(initial=LatLon(lat=0.0, lon=0.0)),
+            )
         ekf: NavEKF = getattr(main, "_ekf")  # type: ignore[assignment]
 
         # Create a simple magnetic field function that returns lat + lon
@@ -83,6 +187,7 @@ def main(argv: list[str] | None = None) -> None:  # noqa: D401
         # Use the measurement lat/lon to calculate a magnetic field value
         mag_value = args.lat + args.lon
         ekf.update(mag_value, mag_func)
+        _save_ekf(ekf, state_path)
         est = ekf.estimate()
         
         result = {
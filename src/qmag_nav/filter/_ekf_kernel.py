@@ -0,0 +1,109 @@
+"""Compiled predict / update kernels for the fixed 4-state navigation EKF.
+
+The kernels work in place on the filter's ``state`` (4,) and ``P`` (4, 4)
+arrays.  With a fixed state size every loop has constant bounds, so Numba
+unrolls the small matrix products into straight-line scalar code.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from qmag_nav import _native
+from qmag_nav._compat import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _predict_kernel(x, P, F, Q):  # noqa: ANN001, ANN202
+    """Propagate the state and covariance: x = F x, P = F P Fᵀ + Q."""
+
+    x_new = np.empty(4)
+    for i in range(4):
+        acc = 0.0
+        for k in range(4):
+            acc += F[i, k] * x[k]
+        x_new[i] = acc
+    x[:] = x_new
+
+    FP = np.empty((4, 4))
+    for i in range(4):
+        for j in range(4):
+            acc = 0.0
+            for k in range(4):
+                acc += F[i, k] * P[k, j]
+            FP[i, j] = acc
+    for i in range(4):
+        for j in range(4):
+            acc = Q[i, j]
+            for k in range(4):
+                acc += FP[i, k] * F[j, k]
+            P[i, j] = acc
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _update_scalar_kernel(x, P, innovation, H, R):  # noqa: ANN001, ANN202
+    """Apply a scalar measurement update with Jacobian row *H* and noise *R*.
+
+    S = H P Hᵀ + R, K = P Hᵀ / S, x += K·innovation, P = (I − K H) P.
+    """
+
+    PH = np.empty(4)
+    HP = np.empty(4)
+    for i in range(4):
+        acc_ph = 0.0
+        acc_hp = 0.0
+        for k in range(4):
+            acc_ph += P[i, k] * H[k]
+            acc_hp += H[k] * P[k, i]
+        PH[i] = acc_ph
+        HP[i] = acc_hp
+
+    S = R
+    for i in range(4):
+        S += H[i] * PH[i]
+
+    for i in range(4):
+        K_i = PH[i] / S
+        x[i] += K_i * innovation
+        for j in range(4):
+            P[i, j] -= K_i * HP[j]
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _step_batch_kernel(x, P, dts, zs, q, R, eps, mag_func, out):  # noqa: ANN001, ANN202
+    """Run ``len(dts)`` predict + scalar update steps, storing each state.
+
+    F and Q follow the constant velocity model of
+    :func:`~qmag_nav.filter.utils.state_transition_matrix` and
+    :func:`~qmag_nav.filter.utils.process_noise_matrix`; H is the forward
+    difference of *mag_func* in latitude and longitude.
+    """
+
+    F = np.eye(4)
+    Q = np.zeros((4, 4))
+    H = np.zeros(4)
+    for k in range(dts.shape[0]):
+        dt = dts[k]
+        dt2 = dt * dt
+        dt3 = dt2 * dt
+        F[0, 2] = dt
+        F[1, 3] = dt
+        Q[0, 0] = Q[1, 1] = q * dt2 * dt2 / 4.0
+        Q[0, 2] = Q[2, 0] = Q[1, 3] = Q[3, 1] = q * dt3 / 2.0
+        Q[2, 2] = Q[3, 3] = q * dt2
+        _predict_kernel(x, P, F, Q)
+
+        lat = x[0]
+        lon = x[1]
+        expected = mag_func(lat, lon)
+        H[0] = (mag_func(lat + eps, lon) - expected) / eps
+        H[1] = (mag_func(lat, lon + eps) - expected) / eps
+        _update_scalar_kernel(x, P, zs[k] - expected, H, R)
+
+        for i in range(4):
+            out[k, i] = x[i]
+
+
+# Prefer the precompiled kernels when the AOT extension has been built
+predict_kernel = _native.load("ekf_predict", _predict_kernel)
+update_scalar_kernel = _native.load("ekf_update_scalar", _update_scalar_kernel)
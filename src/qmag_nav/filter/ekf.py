@@ -16,17 +16,18 @@ The filter supports:
 from __future__ import annotations
 
 import math
-from typing import Callable, List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from qmag_nav.filter._ekf_kernel import (
+    _step_batch_kernel,
+    predict_kernel,
+    update_scalar_kernel,
+)
 from qmag_nav.filter.utils import (
     latlon_to_meters,
-    matrix_add,
-    matrix_inverse_4x4,
-    matrix_multiply,
-    matrix_subtract,
-    matrix_transpose,
+    matrix_inverse_3x3_spd,
     measurement_jacobian,
     meters_to_latlon,
     process_noise_matrix,
@@ -35,6 +36,23 @@ from qmag_nav.filter.utils import (
 from qmag_nav.models.geo import LatLon, MagneticVector
 from qmag_nav.models.map import TileMetadata
 
+# Identity used by the covariance updates
+_I4 = np.eye(4)
+
+# Latitude drift in degrees before the cached cos(lat) is recomputed
+_COS_LAT_TOLERANCE = 0.01
+
+# Field vectors may be passed as models or as plain (bx, by, bz) tuples
+VectorLike = Union[MagneticVector, Tuple[float, float, float]]
+
+
+def _components(vector: VectorLike) -> Tuple[float, float, float]:
+    """Return the (bx, by, bz) components of a field vector."""
+    if isinstance(vector, MagneticVector):
+        return vector.bx, vector.by, vector.bz
+    bx, by, bz = vector
+    return bx, by, bz
+
 
 class NavEKF:
     """Extended Kalman Filter for magnetic navigation with velocity estimation.
@@ -61,24 +79,22 @@ class NavEKF:
             process_noise: Process noise parameter for the constant velocity model
         """
         # Initialize state vector [lat, lon, dlat, dlon]
-        self.state = [
+        self.state = np.array([
             initial.lat,
             initial.lon,
             initial_velocity[0] if initial_velocity else 0.0,
             initial_velocity[1] if initial_velocity else 0.0,
-        ]
+        ])
         
         # Initialize covariance matrix
         if covariance is None:
             # Default: position uncertainty = 1.0, velocity uncertainty = 0.01
-            self.P = [
-                [1.0, 0.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0, 0.0],
-                [0.0, 0.0, 0.01, 0.0],
-                [0.0, 0.0, 0.0, 0.01],
-            ]
+            self.P = np.diag([1.0, 1.0, 0.01, 0.01])
         else:
-            self.P = covariance
+            self.P = np.array(covariance, dtype=np.float64)
+        
+        # Initial covariance, restored by reset_to()
+        self._P0 = self.P.copy()
         
         # Process noise parameter
         self.process_noise = process_noise
@@ -90,6 +106,18 @@ class NavEKF:
         self.accel_bias = [0.0, 0.0]
         self.gyro_bias = 0.0
 
+        # cos(latitude) for the meters <-> degrees conversions, refreshed by
+        # _cos_lat_at() only once the latitude drifts past _COS_LAT_TOLERANCE
+        self._cos_lat_ref = math.nan
+        self._cos_lat = 1.0
+
+    def _cos_lat_at(self, lat: float) -> float:
+        """Return cos(lat), reusing the cached value for nearby latitudes."""
+        if not abs(lat - self._cos_lat_ref) <= _COS_LAT_TOLERANCE:
+            self._cos_lat_ref = lat
+            self._cos_lat = math.cos(math.radians(lat))
+        return self._cos_lat
+
     # ------------------------------------------------------------------
     # Prediction step
     # ------------------------------------------------------------------
@@ -106,18 +134,8 @@ class NavEKF:
         # Process noise covariance
         Q = process_noise_matrix(dt, self.process_noise, state_size=4)
         
-        # State prediction: x = F * x
-        new_state = [0.0, 0.0, 0.0, 0.0]
-        for i in range(4):
-            for j in range(4):
-                new_state[i] += F[i][j] * self.state[j]
-        self.state = new_state
-        
-        # Covariance prediction: P = F*P*F^T + Q
-        F_transpose = matrix_transpose(F)
-        FP = matrix_multiply(F, self.P)
-        FPFT = matrix_multiply(FP, F_transpose)
-        self.P = matrix_add(FPFT, Q)
+        # State prediction x = F*x and covariance prediction P = F*P*F^T + Q
+        predict_kernel(self.state, self.P, F, Q)
 
     def predict_with_imu(
         self,
@@ -144,7 +162,10 @@ class NavEKF:
         accel_east = accel[1] - self.accel_bias[1]
         
         # Convert acceleration to lat/lon acceleration
-        lat_accel, lon_accel = meters_to_latlon(lat, lon, accel_north * dt * dt, accel_east * dt * dt)
+        lat_accel, lon_accel = meters_to_latlon(
+            lat, lon, accel_north * dt * dt, accel_east * dt * dt,
+            cos_lat=self._cos_lat_at(lat),
+        )
         lat_accel = (lat_accel - lat) / (dt * dt)
         lon_accel = (lon_accel - lon) / (dt * dt)
         
@@ -157,28 +178,20 @@ class NavEKF:
         new_lon = lon + dlon * dt + 0.5 * lon_accel * dt * dt
         
         # Update state
-        self.state = [new_lat, new_lon, new_dlat, new_dlon]
+        self.state = np.array([new_lat, new_lon, new_dlat, new_dlon])
         
-        # Process noise with IMU
-        Q = process_noise_matrix(dt, self.process_noise, state_size=4)
+        # Process noise with IMU (a copy, the cached matrix is read-only)
+        Q = process_noise_matrix(dt, self.process_noise, state_size=4).copy()
         
         # Add additional noise from IMU measurements
-        Q[2][2] += accel_noise * dt * dt  # dlat noise
-        Q[3][3] += accel_noise * dt * dt  # dlon noise
+        Q[2, 2] += accel_noise * dt * dt  # dlat noise
+        Q[3, 3] += accel_noise * dt * dt  # dlon noise
         
         # State transition matrix for IMU model
-        F = [
-            [1.0, 0.0, dt, 0.0],
-            [0.0, 1.0, 0.0, dt],
-            [0.0, 0.0, 1.0, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ]
+        F = state_transition_matrix(dt, state_size=4)
         
         # Covariance prediction: P = F*P*F^T + Q
-        F_transpose = matrix_transpose(F)
-        FP = matrix_multiply(F, self.P)
-        FPFT = matrix_multiply(FP, F_transpose)
-        self.P = matrix_add(FPFT, Q)
+        self.P = F @ self.P @ F.T + Q
 
     # ------------------------------------------------------------------
     # Update step
@@ -209,39 +222,24 @@ class NavEKF:
         # Measurement Jacobian
         H = measurement_jacobian(self.state, mag_map_func)
         
-        # Innovation covariance: S = H*P*H^T + R
-        H_transpose = matrix_transpose(H)
-        HP = matrix_multiply(H, self.P)
-        HPH = matrix_multiply(HP, H_transpose)
-        S = [[HPH[0][0] + measurement_noise]]
-        
-        # Kalman gain: K = P*H^T*S^-1
-        S_inv = [[1.0 / S[0][0]]]
-        PH = matrix_multiply(self.P, H_transpose)
-        K = matrix_multiply(PH, S_inv)
-        
-        # State update: x = x + K*innovation
-        for i in range(4):
-            self.state[i] += K[i][0] * innovation
-        
-        # Covariance update: P = (I - K*H)*P
-        KH = matrix_multiply(K, H)
-        I_KH = [
-            [1.0 - KH[0][0], -KH[0][1], -KH[0][2], -KH[0][3]],
-            [-KH[1][0], 1.0 - KH[1][1], -KH[1][2], -KH[1][3]],
-            [-KH[2][0], -KH[2][1], 1.0 - KH[2][2], -KH[2][3]],
-            [-KH[3][0], -KH[3][1], -KH[3][2], 1.0 - KH[3][3]],
-        ]
-        self.P = matrix_multiply(I_KH, self.P)
+        # Kalman gain K = P*H^T*S^-1 with scalar S = H*P*H^T + R, then
+        # x = x + K*innovation and P = (I - K*H)*P
+        update_scalar_kernel(
+            self.state, self.P, float(innovation), H[0], float(measurement_noise)
+        )
 
     def update_vector(
         self,
-        mag_obs: MagneticVector,
-        mag_map_func: Callable[[float, float], MagneticVector],
+        mag_obs: VectorLike,
+        mag_map_func: Callable[[float, float], VectorLike],
         measurement_noise: float = 0.05,
     ) -> None:
         """Update state using 3D magnetic field vector measurement.
         
+        Both the observation and the map function may use plain
+        ``(bx, by, bz)`` tuples instead of :class:`MagneticVector`, which
+        avoids building a model object per Jacobian probe in tight loops.
+        
         Args:
             mag_obs: Observed magnetic field vector
             mag_map_func: Function that returns expected magnetic field vector at a given lat/lon
@@ -251,75 +249,76 @@ class NavEKF:
         lat, lon = self.state[0], self.state[1]
         
         # Expected measurement from map
-        mag_expected = mag_map_func(lat, lon)
+        obs_x, obs_y, obs_z = _components(mag_obs)
+        exp_x, exp_y, exp_z = _components(mag_map_func(lat, lon))
         
         # Innovation (measurement residual)
-        innovation = [
-            mag_obs.bx - mag_expected.bx,
-            mag_obs.by - mag_expected.by,
-            mag_obs.bz - mag_expected.bz,
-        ]
+        innovation = [obs_x - exp_x, obs_y - exp_y, obs_z - exp_z]
         
         # For simplicity, we'll use the magnitude for the Jacobian calculation
         def mag_magnitude(lat: float, lon: float) -> float:
-            vector = mag_map_func(lat, lon)
-            return vector.magnitude()
+            bx, by, bz = _components(mag_map_func(lat, lon))
+            return math.sqrt(bx * bx + by * by + bz * bz)
         
         # Measurement Jacobian (simplified to use magnitude)
         H = measurement_jacobian(self.state, mag_magnitude)
         
         # Expand H to 3x4 for vector measurements
-        H_expanded = [
-            H[0],  # Use the same Jacobian for all components
-            H[0],
-            H[0],
-        ]
+        # (use the same Jacobian for all components)
+        H_expanded = np.repeat(H, 3, axis=0)
         
         # Innovation covariance: S = H*P*H^T + R
-        H_transpose = matrix_transpose(H_expanded)
-        HP = matrix_multiply(H_expanded, self.P)
-        HPH = matrix_multiply(HP, H_transpose)
-        
-        # Measurement noise matrix (diagonal)
-        R = [
-            [measurement_noise, 0.0, 0.0],
-            [0.0, measurement_noise, 0.0],
-            [0.0, 0.0, measurement_noise],
-        ]
-        
-        S = matrix_add(HPH, R)
-        
-        # Simplify by treating components as independent
-        # Process each component separately
-        for i in range(3):
-            # Extract the i-th row of H
-            H_i = [H_expanded[i]]
-            
-            # Innovation for this component
-            innov_i = innovation[i]
-            
-            # Innovation covariance for this component
-            S_i = [[S[i][i]]]
-            
-            # Kalman gain for this component
-            S_inv_i = [[1.0 / S_i[0][0]]]
-            H_i_transpose = matrix_transpose(H_i)
-            PH_i = matrix_multiply(self.P, H_i_transpose)
-            K_i = matrix_multiply(PH_i, S_inv_i)
-            
-            # State update for this component
-            for j in range(4):
-                self.state[j] += K_i[j][0] * innov_i
+        R = np.eye(3) * measurement_noise
+        PHt = self.P @ H_expanded.T
+        S = H_expanded @ PHt + R
+        
+        # Kalman gain K = P*H^T*S^-1, updating all three components at once
+        K = PHt @ matrix_inverse_3x3_spd(S)
+        
+        # State update x = x + K*innovation and covariance P = (I - K*H)*P
+        self.state = self.state + K @ np.asarray(innovation)
+        self.P = (_I4 - K @ H_expanded) @ self.P
+
+    def step_batch(
+        self,
+        dts: Sequence[float],
+        zs: Sequence[float],
+        mag_map_func: Callable[[float, float], float],
+        measurement_noise: float = 0.05,
+        epsilon: float = 1e-6,
+    ) -> np.ndarray:
+        """Run a sequence of predict + scalar update steps in one call.
+        
+        The whole loop runs inside a compiled kernel when Numba is
+        available.  Pass an ``njit``-compiled *mag_map_func* (e.g. a closed
+        form or a lookup on a NumPy grid) to keep it there; plain Python
+        callables fall back to the interpreted loop.
+        
+        Args:
+            dts: Time step in seconds before each measurement
+            zs: Observed magnetic field value for each step
+            mag_map_func: Function that returns expected magnetic field at a given lat/lon
+            measurement_noise: Measurement noise standard deviation
+            epsilon: Step size of the forward-difference Jacobian
             
-            # Covariance update for this component
-            KH_i = matrix_multiply(K_i, H_i)
-            I_KH_i = [
-                [1.0 - KH_i[0][0], -KH_i[0][1], -KH_i[0][2], -KH_i[0][3]],
-                [-KH_i[1][0], 1.0 - KH_i[1][1], -KH_i[1][2], -KH_i[1][3]],
-                [-KH_i[2][0], -KH_i[2][1], 1.0 - KH_i[2][2], -KH_i[2][3]],
-                [-KH_i[3][0], -KH_i[3][1], -KH_i[3][2], 1.0 - KH_i[3][3]],
-            ]
-            self.P = matrix_multiply(I_KH_i, self.P)
+        Returns:
+            The (N, 4) array of states after each step
+        """
+        dts = np.ascontiguousarray(dts, dtype=np.float64)
+        zs = np.ascontiguousarray(zs, dtype=np.float64)
+        if dts.shape != zs.shape or dts.ndim != 1:
+            raise ValueError("dts and zs must be 1-D arrays of equal length")
+        
+        kernel = _step_batch_kernel
+        if not hasattr(mag_map_func, "py_func"):
+            kernel = getattr(kernel, "py_func", kernel)
+        
+        out = np.empty((dts.shape[0], 4))
+        kernel(
+            self.state, self.P, dts, zs, float(self.process_noise),
+            float(measurement_noise), float(epsilon), mag_map_func, out,
+        )
+        return out
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -331,7 +330,7 @@ class NavEKF:
         Returns:
             Current position estimate as LatLon
         """
-        return LatLon(lat=self.state[0], lon=self.state[1])
+        return LatLon(lat=float(self.state[0]), lon=float(self.state[1]))
     
     def velocity(self) -> Tuple[float, float]:
         """Get the current velocity estimate.
@@ -339,7 +338,7 @@ class NavEKF:
         Returns:
             Current velocity as (dlat, dlon) in degrees/second
         """
-        return (self.state[2], self.state[3])
+        return (float(self.state[2]), float(self.state[3]))
     
     def velocity_ms(self) -> Tuple[float, float]:
         """Get the current velocity estimate in meters/second.
@@ -355,9 +354,11 @@ class NavEKF:
         lon_next = lon + dlon
         
         # Convert to meters
-        north_m, east_m = latlon_to_meters(lat, lon, lat_next, lon_next)
+        north_m, east_m = latlon_to_meters(
+            lat, lon, lat_next, lon_next, cos_lat=self._cos_lat_at(float(lat))
+        )
         
-        return north_m, east_m
+        return float(north_m), float(east_m)
     
     def position_uncertainty(self) -> Tuple[float, float]:
         """Get the current position uncertainty.
@@ -375,6 +376,22 @@ class NavEKF:
         """
         return (math.sqrt(self.P[2][2]), math.sqrt(self.P[3][3]))
     
+    def reset_to(self, lat: float, lon: float) -> None:
+        """Reset the filter in place to a new position with zero velocity.
+        
+        Equivalent to constructing a fresh filter at (lat, lon) with the same
+        process noise and initial covariance, without reallocating it.
+        
+        Args:
+            lat: New latitude in decimal degrees
+            lon: New longitude in decimal degrees
+        """
+        self.state[:] = (lat, lon, 0.0, 0.0)
+        self.P[:] = self._P0
+        self.last_time = None
+        self.accel_bias[:] = [0.0, 0.0]
+        self.gyro_bias = 0.0
+    
     def reset_covariance(self, position_var: float = 1.0, velocity_var: float = 0.01) -> None:
         """Reset the covariance matrix to default values.
         
@@ -382,9 +399,4 @@ class NavEKF:
             position_var: Variance for position components
             velocity_var: Variance for velocity components
         """
-        self.P = [
-            [position_var, 0.0, 0.0, 0.0],
-            [0.0, position_var, 0.0, 0.0],
-            [0.0, 0.0, velocity_var, 0.0],
-            [0.0, 0.0, 0.0, velocity_var],
-        ]
+        self.P = np.diag([position_var, position_var, velocity_var, velocity_var])
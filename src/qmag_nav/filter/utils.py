@@ -7,7 +7,8 @@ differentiation, and other mathematical operations needed by the EKF.
 from __future__ import annotations
 
 import math
-from typing import Callable, List, Tuple, TypeVar, Union
+from functools import lru_cache
+from typing import Callable, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -17,52 +18,74 @@ from qmag_nav.models.map import TileMetadata
 # Type variable for generic functions
 T = TypeVar('T')
 
+# Matrices are float64 ndarrays; nested lists are accepted as inputs
+Matrix = Union[np.ndarray, Sequence[Sequence[float]]]
 
-def create_identity_matrix(size: int) -> List[List[float]]:
+# Spherical earth used by the local meters <-> degrees conversions
+_EARTH_RADIUS_M = 6371000.0
+_RAD = math.pi / 180.0
+_M_PER_DEG = _EARTH_RADIUS_M * _RAD
+
+
+def create_identity_matrix(size: int) -> np.ndarray:
     """Create an identity matrix of the specified size.
     
     Args:
         size: The size of the square identity matrix
         
     Returns:
-        A list of lists representing the identity matrix
+        The identity matrix as a (size x size) array
     """
-    return [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+    return np.eye(size)
 
 
 def numerical_jacobian(
-    func: Callable[[List[float]], List[float]],
-    x: List[float],
-    epsilon: float = 1e-6
-) -> List[List[float]]:
-    """Calculate the Jacobian matrix using numerical differentiation.
+    func: Callable[[np.ndarray], Sequence[float]],
+    x: Sequence[float],
+    epsilon: float = 1e-7,
+    vectorized: bool = False
+) -> np.ndarray:
+    """Calculate the Jacobian matrix using central differences.
+    
+    Each component is stepped by ``epsilon * max(|x_i|, 1)`` in both
+    directions.  With ``vectorized=True`` all ``2n`` perturbed points are
+    stacked into a single ``(2n, n)`` array and ``func`` is called once,
+    returning a ``(2n, m)`` array; otherwise ``func`` is called per point.
     
     Args:
         func: The function to differentiate
         x: The point at which to calculate the Jacobian
-        epsilon: The step size for finite differences
+        epsilon: The relative step size for finite differences
+        vectorized: Whether ``func`` evaluates a batch of points row-wise
         
     Returns:
-        The Jacobian matrix as a list of lists
+        The Jacobian matrix as an (m x n) array
     """
-    n = len(x)
-    f0 = func(x)
-    m = len(f0)
+    x = np.asarray(x, dtype=np.float64)
+    n = x.shape[0]
+    h = epsilon * np.maximum(np.abs(x), 1.0)
+    
+    steps = np.diag(h)
+    points = np.concatenate((x + steps, x - steps))
     
-    jacobian = [[0.0 for _ in range(n)] for _ in range(m)]
+    if vectorized:
+        values = np.asarray(func(points), dtype=np.float64)
+        return ((values[:n] - values[n:]) / (2.0 * h[:, None])).T
+    
+    f_plus = np.asarray(func(points[0]), dtype=np.float64)
+    jacobian = np.empty((f_plus.shape[0], n))
     
     for i in range(n):
-        x_perturbed = x.copy()
-        x_perturbed[i] += epsilon
-        f1 = func(x_perturbed)
-        
-        for j in range(m):
-            jacobian[j][i] = (f1[j] - f0[j]) / epsilon
+        if i:
+            f_plus = np.asarray(func(points[i]), dtype=np.float64)
+        f_minus = np.asarray(func(points[n + i]), dtype=np.float64)
+        jacobian[:, i] = (f_plus - f_minus) / (2.0 * h[i])
     
     return jacobian
 
 
-def state_transition_matrix(dt: float, state_size: int = 4) -> List[List[float]]:
+@lru_cache(maxsize=32)
+def state_transition_matrix(dt: float, state_size: int = 4) -> np.ndarray:
     """Create the state transition matrix for a constant velocity model.
     
     For a state vector [lat, lon, dlat, dlon], the transition matrix is:
@@ -76,19 +99,22 @@ def state_transition_matrix(dt: float, state_size: int = 4) -> List[List[float]]
         state_size: Size of the state vector (default: 4 for [lat, lon, dlat, dlon])
         
     Returns:
-        The state transition matrix as a list of lists
+        The state transition matrix as a read-only (4 x 4) array, shared
+        between calls with the same arguments
     """
     if state_size != 4:
         raise ValueError("Only state size 4 is currently supported")
     
-    F = create_identity_matrix(state_size)
-    F[0][2] = dt  # lat += dlat * dt
-    F[1][3] = dt  # lon += dlon * dt
+    F = np.eye(state_size)
+    F[0, 2] = dt  # lat += dlat * dt
+    F[1, 3] = dt  # lon += dlon * dt
+    F.flags.writeable = False
     
     return F
 
 
-def process_noise_matrix(dt: float, q: float, state_size: int = 4) -> List[List[float]]:
+@lru_cache(maxsize=32)
+def process_noise_matrix(dt: float, q: float, state_size: int = 4) -> np.ndarray:
     """Create the process noise covariance matrix for a constant velocity model.
     
     Args:
@@ -97,7 +123,8 @@ def process_noise_matrix(dt: float, q: float, state_size: int = 4) -> List[List[
         state_size: Size of the state vector (default: 4)
         
     Returns:
-        The process noise matrix as a list of lists
+        The process noise matrix as a read-only (4 x 4) array, shared
+        between calls with the same arguments
     """
     if state_size != 4:
         raise ValueError("Only state size 4 is currently supported")
@@ -108,30 +135,31 @@ def process_noise_matrix(dt: float, q: float, state_size: int = 4) -> List[List[
     dt4 = dt3 * dt
     
     # Process noise matrix
-    Q = [[0.0 for _ in range(state_size)] for _ in range(state_size)]
+    Q = np.zeros((state_size, state_size))
     
     # Position-position terms
-    Q[0][0] = q * dt4 / 4.0  # lat-lat
-    Q[1][1] = q * dt4 / 4.0  # lon-lon
+    Q[0, 0] = q * dt4 / 4.0  # lat-lat
+    Q[1, 1] = q * dt4 / 4.0  # lon-lon
     
     # Position-velocity terms
-    Q[0][2] = q * dt3 / 2.0  # lat-dlat
-    Q[2][0] = q * dt3 / 2.0  # dlat-lat
-    Q[1][3] = q * dt3 / 2.0  # lon-dlon
-    Q[3][1] = q * dt3 / 2.0  # dlon-lon
+    Q[0, 2] = q * dt3 / 2.0  # lat-dlat
+    Q[2, 0] = q * dt3 / 2.0  # dlat-lat
+    Q[1, 3] = q * dt3 / 2.0  # lon-dlon
+    Q[3, 1] = q * dt3 / 2.0  # dlon-lon
     
     # Velocity-velocity terms
-    Q[2][2] = q * dt2  # dlat-dlat
-    Q[3][3] = q * dt2  # dlon-dlon
+    Q[2, 2] = q * dt2  # dlat-dlat
+    Q[3, 3] = q * dt2  # dlon-dlon
+    Q.flags.writeable = False
     
     return Q
 
 
 def measurement_jacobian(
-    state: List[float],
+    state: Sequence[float],
     mag_map_func: Callable[[float, float], float],
     epsilon: float = 1e-6
-) -> List[List[float]]:
+) -> np.ndarray:
     """Calculate the measurement Jacobian matrix for magnetic field observations.
     
     Args:
@@ -140,7 +168,7 @@ def measurement_jacobian(
         epsilon: The step size for finite differences
         
     Returns:
-        The measurement Jacobian matrix (1x4)
+        The measurement Jacobian matrix as a (1 x 4) array
     """
     lat, lon = state[0], state[1]
     
@@ -153,14 +181,14 @@ def measurement_jacobian(
     
     # Perturb longitude
     lon_perturbed = lon + epsilon
-    lon_gradient = (mag_map_func(lon, lon_perturbed) - base_value) / epsilon
+    lon_gradient = (mag_map_func(lat, lon_perturbed) - base_value) / epsilon
     
     # The Jacobian is [∂B/∂lat, ∂B/∂lon, 0, 0]
     # Velocity components don't directly affect the magnetic field measurement
-    return [[lat_gradient, lon_gradient, 0.0, 0.0]]
+    return np.array([[lat_gradient, lon_gradient, 0.0, 0.0]])
 
 
-def matrix_multiply(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+def matrix_multiply(A: Matrix, B: Matrix) -> np.ndarray:
     """Multiply two matrices.
     
     Args:
@@ -170,21 +198,10 @@ def matrix_multiply(A: List[List[float]], B: List[List[float]]) -> List[List[flo
     Returns:
         The product matrix (m x p)
     """
-    m = len(A)
-    n = len(B)
-    p = len(B[0])
-    
-    C = [[0.0 for _ in range(p)] for _ in range(m)]
-    
-    for i in range(m):
-        for j in range(p):
-            for k in range(n):
-                C[i][j] += A[i][k] * B[k][j]
-    
-    return C
+    return np.asarray(A, dtype=np.float64) @ np.asarray(B, dtype=np.float64)
 
 
-def matrix_transpose(A: List[List[float]]) -> List[List[float]]:
+def matrix_transpose(A: Matrix) -> np.ndarray:
     """Transpose a matrix.
     
     Args:
@@ -193,19 +210,10 @@ def matrix_transpose(A: List[List[float]]) -> List[List[float]]:
     Returns:
         The transposed matrix (n x m)
     """
-    m = len(A)
-    n = len(A[0])
-    
-    AT = [[0.0 for _ in range(m)] for _ in range(n)]
-    
-    for i in range(m):
-        for j in range(n):
-            AT[j][i] = A[i][j]
-    
-    return AT
+    return np.asarray(A, dtype=np.float64).T
 
 
-def matrix_add(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+def matrix_add(A: Matrix, B: Matrix) -> np.ndarray:
     """Add two matrices.
     
     Args:
@@ -215,19 +223,10 @@ def matrix_add(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
     Returns:
         The sum matrix (m x n)
     """
-    m = len(A)
-    n = len(A[0])
-    
-    C = [[0.0 for _ in range(n)] for _ in range(m)]
-    
-    for i in range(m):
-        for j in range(n):
-            C[i][j] = A[i][j] + B[i][j]
-    
-    return C
+    return np.asarray(A, dtype=np.float64) + np.asarray(B, dtype=np.float64)
 
 
-def matrix_subtract(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+def matrix_subtract(A: Matrix, B: Matrix) -> np.ndarray:
     """Subtract matrix B from matrix A.
     
     Args:
@@ -237,19 +236,10 @@ def matrix_subtract(A: List[List[float]], B: List[List[float]]) -> List[List[flo
     Returns:
         The difference matrix (m x n)
     """
-    m = len(A)
-    n = len(A[0])
-    
-    C = [[0.0 for _ in range(n)] for _ in range(m)]
-    
-    for i in range(m):
-        for j in range(n):
-            C[i][j] = A[i][j] - B[i][j]
-    
-    return C
+    return np.asarray(A, dtype=np.float64) - np.asarray(B, dtype=np.float64)
 
 
-def matrix_inverse_2x2(A: List[List[float]]) -> List[List[float]]:
+def matrix_inverse_2x2(A: Matrix) -> np.ndarray:
     """Calculate the inverse of a 2x2 matrix.
     
     Args:
@@ -268,14 +258,17 @@ def matrix_inverse_2x2(A: List[List[float]]) -> List[List[float]]:
     
     inv_det = 1.0 / det
     
-    return [
+    return np.array([
         [A[1][1] * inv_det, -A[0][1] * inv_det],
         [-A[1][0] * inv_det, A[0][0] * inv_det]
-    ]
+    ])
 
 
-def matrix_inverse_4x4(A: List[List[float]]) -> List[List[float]]:
-    """Calculate the inverse of a 4x4 matrix using numpy.
+def matrix_inverse_4x4(A: Matrix) -> np.ndarray:
+    """Calculate the inverse of a 4x4 matrix by cofactor expansion.
+    
+    The adjugate is built from the twelve 2x2 minors of the top and bottom
+    row pairs, as straight-line scalar code without pivoting.
     
     Args:
         A: Input 4x4 matrix
@@ -286,73 +279,184 @@ def matrix_inverse_4x4(A: List[List[float]]) -> List[List[float]]:
     Raises:
         ValueError: If the matrix is singular
     """
-    # Convert to numpy array for inversion
-    A_np = np.array(A)
-    
-    try:
-        A_inv_np = np.linalg.inv(A_np)
-        # Convert back to list of lists
-        return A_inv_np.tolist()
-    except np.linalg.LinAlgError:
+    (a00, a01, a02, a03,
+     a10, a11, a12, a13,
+     a20, a21, a22, a23,
+     a30, a31, a32, a33) = np.asarray(A, dtype=np.float64).ravel().tolist()
+    
+    # 2x2 minors of the top two rows ...
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    
+    # ... and of the bottom two rows
+    c5 = a22 * a33 - a32 * a23
+    c4 = a21 * a33 - a31 * a23
+    c3 = a21 * a32 - a31 * a22
+    c2 = a20 * a33 - a30 * a23
+    c1 = a20 * a32 - a30 * a22
+    c0 = a20 * a31 - a30 * a21
+    
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+    if det == 0.0 or not math.isfinite(det):
         raise ValueError("Matrix is singular, cannot compute inverse")
+    
+    inv_det = 1.0 / det
+    
+    return np.array([
+        [
+            (a11 * c5 - a12 * c4 + a13 * c3) * inv_det,
+            (-a01 * c5 + a02 * c4 - a03 * c3) * inv_det,
+            (a31 * s5 - a32 * s4 + a33 * s3) * inv_det,
+            (-a21 * s5 + a22 * s4 - a23 * s3) * inv_det,
+        ],
+        [
+            (-a10 * c5 + a12 * c2 - a13 * c1) * inv_det,
+            (a00 * c5 - a02 * c2 + a03 * c1) * inv_det,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * inv_det,
+            (a20 * s5 - a22 * s2 + a23 * s1) * inv_det,
+        ],
+        [
+            (a10 * c4 - a11 * c2 + a13 * c0) * inv_det,
+            (-a00 * c4 + a01 * c2 - a03 * c0) * inv_det,
+            (a30 * s4 - a31 * s2 + a33 * s0) * inv_det,
+            (-a20 * s4 + a21 * s2 - a23 * s0) * inv_det,
+        ],
+        [
+            (-a10 * c3 + a11 * c1 - a12 * c0) * inv_det,
+            (a00 * c3 - a01 * c1 + a02 * c0) * inv_det,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * inv_det,
+            (a20 * s3 - a21 * s1 + a22 * s0) * inv_det,
+        ],
+    ])
+
+
+def _cholesky_pivot(d: float) -> float:
+    """Return the Cholesky diagonal entry ``sqrt(d)`` of a pivot *d*.
+    
+    Raises:
+        ValueError: If the pivot is not positive (or is NaN)
+    """
+    if not d > 0.0:
+        raise ValueError("Matrix is not positive definite")
+    return math.sqrt(d)
 
 
-def latlon_to_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+def matrix_inverse_3x3_spd(A: Matrix) -> np.ndarray:
+    """Calculate the inverse of a symmetric positive definite 3x3 matrix.
+    
+    Uses the closed-form Cholesky factor A = L*L^T, so that
+    A^-1 = L^-T * L^-1.  Only the lower triangle of ``A`` is read.
+    
+    Args:
+        A: Input 3x3 symmetric positive definite matrix, e.g. an innovation
+           covariance S = H*P*H^T + R
+        
+    Returns:
+        The inverse matrix
+        
+    Raises:
+        ValueError: If the matrix is not positive definite
+    """
+    a00 = float(A[0][0])
+    a10, a11 = float(A[1][0]), float(A[1][1])
+    a20, a21, a22 = float(A[2][0]), float(A[2][1]), float(A[2][2])
+    
+    # Cholesky factor L (lower triangular)
+    l00 = _cholesky_pivot(a00)
+    l10 = a10 / l00
+    l20 = a20 / l00
+    l11 = _cholesky_pivot(a11 - l10 * l10)
+    l21 = (a21 - l20 * l10) / l11
+    l22 = _cholesky_pivot(a22 - l20 * l20 - l21 * l21)
+    
+    # M = L^-1 (lower triangular)
+    m00 = 1.0 / l00
+    m11 = 1.0 / l11
+    m22 = 1.0 / l22
+    m10 = -l10 * m00 * m11
+    m21 = -l21 * m11 * m22
+    m20 = -(l20 * m00 + l21 * m10) * m22
+    
+    # A^-1 = M^T * M
+    i00 = m00 * m00 + m10 * m10 + m20 * m20
+    i01 = m10 * m11 + m20 * m21
+    i02 = m20 * m22
+    i11 = m11 * m11 + m21 * m21
+    i12 = m21 * m22
+    i22 = m22 * m22
+    
+    return np.array([
+        [i00, i01, i02],
+        [i01, i11, i12],
+        [i02, i12, i22],
+    ])
+
+
+def latlon_to_meters(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    cos_lat: float | None = None,
+) -> Tuple[float, float]:
     """Convert latitude/longitude differences to approximate meters.
     
+    All coordinates may also be NumPy arrays, in which case the conversion
+    is applied element-wise and arrays are returned.
+    
     Args:
         lat1: First latitude in degrees
         lon1: First longitude in degrees
         lat2: Second latitude in degrees
         lon2: Second longitude in degrees
+        cos_lat: Precomputed cosine of ``lat1``; computed when omitted
         
     Returns:
         Tuple of (north_meters, east_meters)
     """
-    # Earth radius in meters
-    earth_radius = 6371000.0
-    
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    if cos_lat is None:
+        cos_lat = np.cos(np.multiply(lat1, _RAD))
     
-    # North-south distance
-    north_meters = earth_radius * (lat2_rad - lat1_rad)
+    north_meters = _M_PER_DEG * np.subtract(lat2, lat1)
     
     # East-west distance (accounting for latitude)
-    east_meters = earth_radius * math.cos(lat1_rad) * (lon2_rad - lon1_rad)
+    east_meters = _M_PER_DEG * cos_lat * np.subtract(lon2, lon1)
     
     return north_meters, east_meters
 
 
-def meters_to_latlon(lat: float, lon: float, north_meters: float, east_meters: float) -> Tuple[float, float]:
+def meters_to_latlon(
+    lat: float,
+    lon: float,
+    north_meters: float,
+    east_meters: float,
+    cos_lat: float | None = None,
+) -> Tuple[float, float]:
     """Convert north/east meters to latitude/longitude differences.
     
+    All arguments may also be NumPy arrays, in which case the conversion is
+    applied element-wise and arrays are returned.
+    
     Args:
         lat: Reference latitude in degrees
         lon: Reference longitude in degrees
         north_meters: North distance in meters
         east_meters: East distance in meters
+        cos_lat: Precomputed cosine of ``lat``; computed when omitted
         
     Returns:
         Tuple of (new_latitude, new_longitude) in degrees
     """
-    # Earth radius in meters
-    earth_radius = 6371000.0
+    if cos_lat is None:
+        cos_lat = np.cos(np.multiply(lat, _RAD))
     
-    # Convert to radians
-    lat_rad = math.radians(lat)
-    
-    # Latitude change
-    dlat = north_meters / earth_radius
+    new_lat = lat + np.divide(north_meters, _M_PER_DEG)
     
     # Longitude change (accounting for latitude)
-    dlon = east_meters / (earth_radius * math.cos(lat_rad))
-    
-    # Convert back to degrees
-    new_lat = lat + math.degrees(dlat)
-    new_lon = lon + math.degrees(dlon)
+    new_lon = lon + np.divide(east_meters, _M_PER_DEG * cos_lat)
     
-    return new_lat, new_lon
\ No newline at end of file
+    return new_lat, new_lon
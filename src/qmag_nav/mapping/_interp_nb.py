@@ -0,0 +1,125 @@
+"""Compiled single-point interpolation kernels for 2-D grid arrays.
+
+The public functions in :mod:`qmag_nav.mapping.interpolate` validate their
+arguments and forward ndarray grids here.  The kernels assume in-bounds,
+non-negative fractional indices and do no checking of their own.  Without
+Numba they run as plain Python.
+"""
+
+from __future__ import annotations
+
+from qmag_nav._compat import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+def _bilinear_nb(grid, row_f, col_f):  # noqa: ANN001, ANN202
+    """Bilinear sample of an in-bounds point of a 2-D array in lerp form.
+
+    Each ``a + t * (b - a)`` step maps onto a fused multiply-add, and the
+    cell index is clamped with integer min/max instead of branches.
+    """
+
+    rows, cols = grid.shape
+    row0 = min(max(int(row_f), 0), rows - 2)
+    col0 = min(max(int(col_f), 0), cols - 2)
+    fr = row_f - row0
+    fc = col_f - col0
+
+    v00 = grid[row0, col0]
+    v01 = grid[row0, col0 + 1]
+    v10 = grid[row0 + 1, col0]
+    v11 = grid[row0 + 1, col0 + 1]
+
+    c0 = v00 + fc * (v01 - v00)
+    c1 = v10 + fc * (v11 - v10)
+    return c0 + fr * (c1 - c0)
+
+
+@njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+def _cubic_weights(t):  # noqa: ANN001, ANN202
+    """Catmull-Rom weights of the nodes at offsets -1, 0, 1, 2 for fraction *t*.
+
+    The weights sum to one and give ``(-1, 9, 9, -1) / 16`` at ``t = 0.5``.
+    """
+
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        0.5 * (-t3 + 2.0 * t2 - t),
+        0.5 * (3.0 * t3 - 5.0 * t2 + 2.0),
+        0.5 * (-3.0 * t3 + 4.0 * t2 + t),
+        0.5 * (t3 - t2),
+    )
+
+
+@njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+def _bicubic_nb(grid, row_f, col_f):  # noqa: ANN001, ANN202
+    """Catmull-Rom bicubic sample of an interior point.
+
+    The 4x4 neighbourhood is contracted with separable row and column
+    weights, ``wy @ stencil @ wx``; indices are clamped to the grid.
+    """
+
+    rows, cols = grid.shape
+    row = int(row_f)
+    col = int(col_f)
+    wy = _cubic_weights(row_f - row)
+    wx = _cubic_weights(col_f - col)
+
+    acc = 0.0
+    for i in range(4):
+        r = min(max(row - 1 + i, 0), rows - 1)
+        c0 = max(col - 1, 0)
+        c1 = col
+        c2 = min(col + 1, cols - 1)
+        c3 = min(col + 2, cols - 1)
+        acc += wy[i] * (
+            wx[0] * grid[r, c0] + wx[1] * grid[r, c1]
+            + wx[2] * grid[r, c2] + wx[3] * grid[r, c3]
+        )
+    return acc
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _bilinear_geo_nb(grid, lat, lon, lat_min, lon_min, inv_dlat, inv_dlon):  # noqa: ANN001, ANN202
+    """Bilinear sample of an in-bounds geographic point.
+
+    Folds :meth:`MagneticMap.geo_to_grid` into the kernel.  Compiled without
+    ``fastmath`` so it rounds exactly like the pure-Python bilinear path.
+    """
+
+    rows, cols = grid.shape
+    row_f = min((lat - lat_min) * inv_dlat, rows - 1.0)
+    col_f = min((lon - lon_min) * inv_dlon, cols - 1.0)
+    row0 = min(max(int(row_f), 0), rows - 2)
+    col0 = min(max(int(col_f), 0), cols - 2)
+    fr = row_f - row0
+    fc = col_f - col0
+
+    v00 = grid[row0, col0]
+    v01 = grid[row0, col0 + 1]
+    v10 = grid[row0 + 1, col0]
+    v11 = grid[row0 + 1, col0 + 1]
+
+    c0 = v00 + fc * (v01 - v00)
+    c1 = v10 + fc * (v11 - v10)
+    return c0 + fr * (c1 - c0)
+
+
+@njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+def _bicubic_geo_nb(grid, lat, lon, lat_min, lon_min, inv_dlat, inv_dlon):  # noqa: ANN001, ANN202
+    """Bicubic sample of an in-bounds geographic point.
+
+    Follows :func:`qmag_nav.mapping.interpolate.bicubic`: grid nodes are
+    returned exactly and points within one cell of the edge fall back to
+    bilinear.
+    """
+
+    rows, cols = grid.shape
+    row_f = min((lat - lat_min) * inv_dlat, rows - 1.0)
+    col_f = min((lon - lon_min) * inv_dlon, cols - 1.0)
+    if row_f == int(row_f) and col_f == int(col_f):
+        return grid[int(row_f), int(col_f)]
+    if row_f < 1.0 or row_f > rows - 2.0 or col_f < 1.0 or col_f > cols - 2.0:
+        return _bilinear_nb(grid, row_f, col_f)
+    return _bicubic_nb(grid, row_f, col_f)
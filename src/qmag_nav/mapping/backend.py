@@ -3,21 +3,46 @@
 from __future__ import annotations
 
 import math
-import os
+import warnings
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-import rasterio
-import xarray as xr
-from rasterio.transform import rowcol
 
-from qmag_nav.mapping.interpolate import bilinear, bicubic, grid_to_geo_coords
+from qmag_nav.mapping.interpolate import (
+    BilinearWeights,
+    bicubic_array,
+    bilinear_array,
+    interpolate_precomputed,
+    make_bicubic_fn,
+    make_bilinear_fn,
+    precompute_bilinear,
+)
 from qmag_nav.models.map import MapHeader, TileMetadata
 
+if TYPE_CHECKING:
+    import rasterio.windows
+
+# Builders of the per-map interpolators used by MagneticMap.interpolate
+_INTERP_FACTORIES: Dict[str, Callable[..., Callable[[float, float], float]]] = {
+    "bilinear": make_bilinear_fn,
+    "bicubic": make_bicubic_fn,
+}
+
 
 @dataclass(slots=True)
 class MagneticMap:
@@ -32,7 +57,8 @@ class MagneticMap:
         lat_max: Maximum latitude bound of the map
         lon_min: Minimum longitude bound of the map
         lon_max: Maximum longitude bound of the map
-        grid: 2D grid of magnetic anomaly values (rows × cols, lat major)
+        grid: 2D grid of magnetic anomaly values (rows × cols, lat major),
+            stored as a C-contiguous float64 array; nested lists are converted
         metadata: Optional metadata about the map source
     """
 
@@ -40,9 +66,40 @@ class MagneticMap:
     lat_max: float
     lon_min: float
     lon_max: float
-    grid: List[List[float]]  # rows × cols, lat major
+    grid: np.ndarray = field(compare=False)  # rows × cols, lat major, float64
     metadata: Optional[MapHeader] = None
-    _cell_size_cache: Optional[Tuple[float, float]] = None
+    _cell_size_cache: Optional[Tuple[float, float]] = field(default=None, compare=False)
+    _inv_cell_size_cache: Optional[Tuple[float, float]] = field(
+        default=None, compare=False
+    )
+    _interp_fns: Optional[Dict[str, Callable[[float, float], float]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _interp_cache: Optional[Callable[[int, int, str], float]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # One contiguous float64 buffer instead of nested lists of boxed
+        # floats; a no-op when the grid already has that layout
+        self.grid = np.ascontiguousarray(self.grid, dtype=np.float64)
+        self._interp_fns = {}
+        self._interp_cache = _quantised_sampler(
+            self.grid, self.lat_min, self.lat_max, self.lon_min, self.lon_max, self._interp_fns
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Maps are equal when their bounds, metadata and grid values match."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.lat_min == other.lat_min
+            and self.lat_max == other.lat_max
+            and self.lon_min == other.lon_min
+            and self.lon_max == other.lon_max
+            and self.metadata == other.metadata
+            and np.array_equal(self.grid, other.grid)
+        )
 
     # ------------------------------------------------------------------
     # Derived helpers
@@ -51,12 +108,17 @@ class MagneticMap:
     @property
     def rows(self) -> int:  # noqa: D401
         """Number of rows in the grid."""
-        return len(self.grid)
+        return self.grid.shape[0]
 
     @property
     def cols(self) -> int:  # noqa: D401
         """Number of columns in the grid."""
-        return len(self.grid[0]) if self.grid else 0
+        return self.grid.shape[1] if self.grid.ndim == 2 else 0
+
+    @property
+    def grid_list(self) -> List[List[float]]:  # noqa: D401
+        """The grid as nested Python lists, for callers that need them."""
+        return self.grid.tolist()
 
     def _cell_size(self) -> tuple[float, float]:
         """
@@ -72,10 +134,48 @@ class MagneticMap:
             )
         return self._cell_size_cache
 
+    def _inv_cell_size(self) -> tuple[float, float]:
+        """
+        Calculate the number of grid cells per degree of latitude and longitude.
+        
+        Cached so that mapping coordinates to fractional indices costs a
+        multiplication rather than a division per interpolation.
+        
+        Returns:
+            Tuple of (rows_per_degree_lat, cols_per_degree_lon)
+        """
+        if self._inv_cell_size_cache is None:
+            self._inv_cell_size_cache = (
+                (self.rows - 1) / (self.lat_max - self.lat_min),
+                (self.cols - 1) / (self.lon_max - self.lon_min),
+            )
+        return self._inv_cell_size_cache
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def geo_to_grid(self, lat: float, lon: float) -> tuple[float, float]:
+        """
+        Convert geographic coordinates to fractional grid indices.
+        
+        Uses the cached cells-per-degree scales, so the conversion costs two
+        multiplications.  Bounds are not checked, but indices are capped at
+        the last row and column: multiplying by the rounded scale can
+        overshoot them by an ulp at the upper bounds.
+        
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            
+        Returns:
+            Tuple of (row_index, col_index) as floating point values
+        """
+        inv_dlat, inv_dlon = self._inv_cell_size()
+        row_f = min((lat - self.lat_min) * inv_dlat, self.rows - 1.0)
+        col_f = min((lon - self.lon_min) * inv_dlon, self.cols - 1.0)
+        return row_f, col_f
+
     def interpolate(self, lat: float, lon: float, method: str = "bilinear") -> float:  # noqa: D401
         """
         Interpolate the magnetic anomaly value at the given coordinates.
@@ -91,27 +191,87 @@ class MagneticMap:
         Raises:
             ValueError: If the location is outside map bounds or method is invalid
         """
-        if method not in ["bilinear", "bicubic"]:
-            raise ValueError(f"Unsupported interpolation method: {method}")
+        interp = self._interp_fns.get(method)
+        if interp is None:
+            interp = _build_interp_fn(
+                self._interp_fns, method,
+                self.grid, self.lat_min, self.lat_max, self.lon_min, self.lon_max,
+            )
+        return interp(lat, lon)
 
-        if not (self.lat_min <= lat <= self.lat_max) or not (
-            self.lon_min <= lon <= self.lon_max
-        ):
-            raise ValueError("Location outside of map bounds")
+    def interpolate_many(
+        self, lats: np.ndarray, lons: np.ndarray, method: str = "bilinear"
+    ) -> np.ndarray:  # noqa: D401
+        """
+        Interpolate the magnetic anomaly value at many coordinates at once.
+        
+        The batched counterpart of :meth:`interpolate`: all points are
+        converted to grid indices and sampled in one vectorised pass.
+        
+        Args:
+            lats: Array of latitude coordinates
+            lons: Array of longitude coordinates (same shape as ``lats``)
+            method: Interpolation method ("bilinear" or "bicubic")
+            
+        Returns:
+            Array of interpolated values in nano-tesla
+            
+        Raises:
+            ValueError: If any location is outside map bounds or method is invalid
+        """
+        lats, lons = self._check_in_bounds(lats, lons)
+        return interpolate_array(self, lats, lons, method)
 
-        # Convert geographic coordinates to grid indices
-        row_f, col_f = grid_to_geo_coords(
-            lat, lon,
-            self.lat_min, self.lat_max,
-            self.lon_min, self.lon_max,
-            self.rows, self.cols
-        )
+    def precompute_bilinear(self, lats: np.ndarray, lons: np.ndarray) -> BilinearWeights:
+        """
+        Precompute bilinear stencils for coordinates sampled repeatedly.
+        
+        Pass the result to :meth:`interpolate_precomputed` to sample the
+        points without redoing the cell lookup and weights.
         
-        # Perform interpolation using the selected method
-        if method == "bilinear":
-            return bilinear(self.grid, row_f, col_f, self.rows, self.cols)
-        else:  # method == "bicubic"
-            return bicubic(self.grid, row_f, col_f, self.rows, self.cols)
+        Args:
+            lats: Array of latitude coordinates
+            lons: Array of longitude coordinates (same shape as ``lats``)
+            
+        Returns:
+            BilinearWeights for the coordinates
+            
+        Raises:
+            ValueError: If any location is outside map bounds
+        """
+        lats, lons = self._check_in_bounds(lats, lons)
+        inv_dlat, inv_dlon = self._inv_cell_size()
+        row_f = (lats - self.lat_min) * inv_dlat
+        col_f = (lons - self.lon_min) * inv_dlon
+        return precompute_bilinear(row_f, col_f, self.rows, self.cols)
+
+    def interpolate_precomputed(self, stencils: BilinearWeights) -> np.ndarray:
+        """
+        Sample the map with stencils from :meth:`precompute_bilinear`.
+        
+        Args:
+            stencils: Precomputed bilinear stencils
+            
+        Returns:
+            Array of interpolated values in nano-tesla
+            
+        Raises:
+            ValueError: If the stencils were built for a grid of another shape
+        """
+        return interpolate_precomputed(self.grid, stencils)
+
+    def _check_in_bounds(
+        self, lats: np.ndarray, lons: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the coordinates as float64 arrays, raising if any is off the map."""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if not (
+            np.all((self.lat_min <= lats) & (lats <= self.lat_max))
+            and np.all((self.lon_min <= lons) & (lons <= self.lon_max))
+        ):
+            raise ValueError("Location outside of map bounds")
+        return lats, lons
 
     def get_tile_metadata(self) -> TileMetadata:
         """
@@ -134,50 +294,70 @@ class MagneticMap:
     # ------------------------------------------------------------------
 
     @classmethod
-    def from_geotiff(cls, path: Union[str, Path], band: int = 1) -> MagneticMap:
+    def from_geotiff(
+        cls,
+        path: Union[str, Path],
+        band: int = 1,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        out_shape: Optional[Tuple[int, int]] = None,
+    ) -> MagneticMap:
         """
         Load a magnetic map from a GeoTIFF file.
         
+        By default the whole band is read.  Passing ``bbox`` reads only the
+        pixels covering that area (snapped outwards to whole pixels), and
+        ``out_shape`` resamples the read to ``(rows, cols)`` so GDAL can serve
+        it from overviews when the file has them.
+        
+        Reads are cached on the resolved path, the file's modification time
+        and the read options, so loading an unchanged file again does not
+        touch the file.  Every call returns a new map, but maps of the same
+        read share one read-only grid; copy it before editing values.
+        
         Args:
             path: Path to the GeoTIFF file
             band: Band number to read (default: 1)
+            bbox: Optional ``(lat_min, lat_max, lon_min, lon_max)`` to read
+            out_shape: Optional ``(rows, cols)`` of the returned grid
             
         Returns:
             MagneticMap instance
             
         Raises:
-            ValueError: If the file cannot be read or is not a valid GeoTIFF
+            ValueError: If the file cannot be read, is not a valid GeoTIFF or
+                ``bbox`` does not overlap the raster
         """
         try:
-            with rasterio.open(path) as dataset:
-                # Read the data from the specified band
-                grid_data = dataset.read(band)
-                
-                # Get the geospatial bounds
-                bounds = dataset.bounds
-                
-                # Convert to list of lists for compatibility with existing code
-                grid = grid_data.tolist()
-                
-                # Create metadata from tags if available
-                metadata = None
-                if dataset.tags():
-                    metadata = MapHeader(
-                        title=dataset.tags().get("title", os.path.basename(str(path))),
-                        source=dataset.tags().get("source", "GeoTIFF"),
-                        resolution_m=float(dataset.tags().get("resolution_m", 0.0)),
-                    )
-                
-                return cls(
-                    lat_min=bounds.bottom,
-                    lat_max=bounds.top,
-                    lon_min=bounds.left,
-                    lon_max=bounds.right,
-                    grid=grid,
-                    metadata=metadata,
-                )
-        except Exception as e:
+            resolved = Path(path).resolve()
+            mtime_ns = resolved.stat().st_mtime_ns
+        except OSError as e:
             raise ValueError(f"Failed to load GeoTIFF file: {e}") from e
+        
+        grid, (lat_min, lat_max, lon_min, lon_max), tags = _read_geotiff_cached(
+            str(resolved),
+            mtime_ns,
+            band,
+            None if bbox is None else tuple(bbox),
+            None if out_shape is None else tuple(out_shape),
+        )
+        
+        # Create metadata from tags if available
+        metadata = None
+        if tags:
+            metadata = MapHeader(
+                title=tags.get("title", resolved.name),
+                source=tags.get("source", "GeoTIFF"),
+                resolution_m=float(tags.get("resolution_m", 0.0)),
+            )
+        
+        return cls(
+            lat_min=lat_min,
+            lat_max=lat_max,
+            lon_min=lon_min,
+            lon_max=lon_max,
+            grid=grid,
+            metadata=metadata,
+        )
 
     @classmethod
     def from_netcdf(
@@ -185,7 +365,8 @@ class MagneticMap:
         path: Union[str, Path],
         lat_var: str = "latitude",
         lon_var: str = "longitude",
-        data_var: str = "magnetic_anomaly"
+        data_var: str = "magnetic_anomaly",
+        chunks: Optional[Dict[str, int]] = None,
     ) -> MagneticMap:
         """
         Load a magnetic map from a NetCDF file.
@@ -195,6 +376,9 @@ class MagneticMap:
             lat_var: Name of the latitude variable
             lon_var: Name of the longitude variable
             data_var: Name of the data variable containing magnetic anomaly values
+            chunks: Optional dask chunk sizes per dimension, e.g.
+                ``{"latitude": 256, "longitude": 256}``; ideally aligned with
+                the file's on-disk chunks.  Requires dask.
             
         Returns:
             MagneticMap instance
@@ -202,8 +386,10 @@ class MagneticMap:
         Raises:
             ValueError: If the file cannot be read or variables are not found
         """
+        import xarray as xr
+        
         try:
-            with xr.open_dataset(path) as ds:
+            with xr.open_dataset(path, chunks=chunks) as ds:
                 # Check if required variables exist
                 if lat_var not in ds or lon_var not in ds or data_var not in ds:
                     missing = []
@@ -233,15 +419,12 @@ class MagneticMap:
                         resolution_m=resolution,
                     )
                 
-                # Convert to list of lists
-                grid = data.tolist()
-                
                 return cls(
                     lat_min=float(np.min(lats)),
                     lat_max=float(np.max(lats)),
                     lon_min=float(np.min(lons)),
                     lon_max=float(np.max(lons)),
-                    grid=grid,
+                    grid=data,
                     metadata=metadata,
                 )
         except Exception as e:
@@ -258,6 +441,10 @@ class MagneticMap:
         """
         Create a magnetic map from a NumPy array.
         
+        A C-contiguous float64 array is stored by reference, without a copy,
+        so changes to it show through the map; any other layout or dtype is
+        converted once.
+        
         Args:
             array: 2D NumPy array containing magnetic anomaly values
             lat_bounds: Tuple of (min_latitude, max_latitude)
@@ -278,11 +465,150 @@ class MagneticMap:
             lat_max=lat_bounds[1],
             lon_min=lon_bounds[0],
             lon_max=lon_bounds[1],
-            grid=array.tolist(),
+            grid=array,
             metadata=metadata,
         )
 
 
+@lru_cache(maxsize=16)
+def _read_geotiff_cached(
+    path: str,
+    mtime_ns: int,
+    band: int,
+    bbox: Optional[Tuple[float, float, float, float]],
+    out_shape: Optional[Tuple[int, int]],
+) -> Tuple[np.ndarray, Tuple[float, float, float, float], Dict[str, str]]:
+    """Read a GeoTIFF once per path, modification time and read options.
+    
+    Returns the band as a read-only float64 grid, the ``(lat_min, lat_max,
+    lon_min, lon_max)`` bounds of the pixels read and the dataset tags; see
+    :meth:`MagneticMap.from_geotiff`.  The grid is shared by every map built
+    from the cached result, hence read-only.
+    """
+    # GDAL and HDF5 are slow to load, so the I/O stacks are imported on use
+    import rasterio
+    
+    try:
+        with rasterio.open(path) as dataset:
+            window = None
+            if bbox is not None:
+                window = _bbox_window(dataset, bbox)
+            
+            if out_shape is not None and not dataset.overviews(band):
+                warnings.warn(
+                    f"{path} has no overviews; decimated reads resample the "
+                    "full-resolution pixels. Consider building them with "
+                    "`gdaladdo`.",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+            
+            # Read the data from the specified band
+            grid = dataset.read(band, window=window, out_shape=out_shape)
+            
+            # Get the geospatial bounds of what was actually read
+            if window is None:
+                left, bottom, right, top = dataset.bounds
+            else:
+                left, bottom, right, top = dataset.window_bounds(window)
+            
+            tags = dataset.tags()
+    except Exception as e:
+        raise ValueError(f"Failed to load GeoTIFF file: {e}") from e
+    
+    grid = np.ascontiguousarray(grid, dtype=np.float64)
+    grid.setflags(write=False)
+    return grid, (bottom, top, left, right), tags
+
+
+class FieldCellCache:
+    """
+    Bilinear sampler that remembers the grid cell it last read from.
+    
+    Sequential queries (trajectory samples, EKF Jacobian perturbations) almost
+    always fall in the same cell as the previous one, so the four corner
+    values are only re-read from the grid when a query leaves the cached cell.
+    Results are identical to ``MagneticMap.interpolate(lat, lon)``.
+    
+    If ``fill_value`` is given, locations outside the map return it instead
+    of raising, which keeps exception handling off per-sample hot loops.
+    """
+    
+    __slots__ = (
+        "_grid", "_rows", "_cols", "_lat_min", "_lat_max", "_lon_min", "_lon_max",
+        "_inv_dlat", "_inv_dlon", "_row0", "_col0", "_v00", "_v01", "_v10", "_v11",
+        "_fill_value",
+    )
+    
+    def __init__(self, map_obj: MagneticMap, fill_value: Optional[float] = None):
+        """
+        Initialize the cache for a map.
+        
+        Args:
+            map_obj: MagneticMap instance to sample
+            fill_value: Value returned for locations outside the map bounds;
+                None raises ValueError instead
+        """
+        self._fill_value = fill_value
+        self._grid = np.asarray(map_obj.grid, dtype=np.float64)
+        self._rows = map_obj.rows
+        self._cols = map_obj.cols
+        self._lat_min = map_obj.lat_min
+        self._lat_max = map_obj.lat_max
+        self._lon_min = map_obj.lon_min
+        self._lon_max = map_obj.lon_max
+        self._inv_dlat = (self._rows - 1) / (map_obj.lat_max - map_obj.lat_min)
+        self._inv_dlon = (self._cols - 1) / (map_obj.lon_max - map_obj.lon_min)
+        
+        # No cell cached yet
+        self._row0 = -2
+        self._col0 = -2
+        self._v00 = self._v01 = self._v10 = self._v11 = 0.0
+    
+    def sample(self, lat: float, lon: float) -> float:
+        """
+        Interpolate the magnetic anomaly value at the given coordinates.
+        
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            
+        Returns:
+            Interpolated magnetic anomaly value in nano-tesla, or the fill
+            value for locations outside the map bounds
+            
+        Raises:
+            ValueError: If the location is outside map bounds and no fill
+                value was configured
+        """
+        if not (self._lat_min <= lat <= self._lat_max) or not (
+            self._lon_min <= lon <= self._lon_max
+        ):
+            if self._fill_value is not None:
+                return self._fill_value
+            raise ValueError("Location outside of map bounds")
+        
+        row_f = (lat - self._lat_min) * self._inv_dlat
+        col_f = (lon - self._lon_min) * self._inv_dlon
+        
+        # Refill the corners only when leaving the cached cell
+        if not (self._row0 <= row_f <= self._row0 + 1) or not (
+            self._col0 <= col_f <= self._col0 + 1
+        ):
+            row0 = max(0, min(int(row_f), self._rows - 2))
+            col0 = max(0, min(int(col_f), self._cols - 2))
+            self._row0 = row0
+            self._col0 = col0
+            self._v00, self._v01 = self._grid[row0, col0:col0 + 2].tolist()
+            self._v10, self._v11 = self._grid[row0 + 1, col0:col0 + 2].tolist()
+        
+        fr = row_f - self._row0
+        fc = col_f - self._col0
+        c0 = self._v00 + fc * (self._v01 - self._v00)
+        c1 = self._v10 + fc * (self._v11 - self._v10)
+        return c0 + fr * (c1 - c0)
+
+
 # LRU cache for loaded maps with configurable size
 class LRUCache(OrderedDict):
     """
@@ -335,6 +661,29 @@ class LRUCache(OrderedDict):
             del self[oldest]
 
 
+def _bbox_window(
+    dataset: Any, bbox: Tuple[float, float, float, float]
+) -> rasterio.windows.Window:
+    """Return the whole-pixel window of *dataset* covering *bbox*.
+
+    The window is snapped outwards so the bbox is fully covered and clipped
+    to the raster extent.
+    """
+    import rasterio.windows
+
+    lat_min, lat_max, lon_min, lon_max = bbox
+    win = rasterio.windows.from_bounds(
+        lon_min, lat_min, lon_max, lat_max, transform=dataset.transform
+    )
+    row0 = max(math.floor(win.row_off), 0)
+    col0 = max(math.floor(win.col_off), 0)
+    row1 = min(math.ceil(win.row_off + win.height), dataset.height)
+    col1 = min(math.ceil(win.col_off + win.width), dataset.width)
+    if row1 <= row0 or col1 <= col0:
+        raise ValueError(f"bbox {bbox} does not overlap the raster")
+    return rasterio.windows.Window(col0, row0, col1 - col0, row1 - row0)
+
+
 # Map cache with configurable size
 _map_cache = LRUCache(maxsize=32)
 
@@ -394,15 +743,74 @@ def load_map(
     return map_obj
 
 
-# Interpolation cache with configurable size
-_interpolation_cache = LRUCache(maxsize=1024)
+# Coordinates are quantised to this many steps per degree (about 0.1 m)
+_INTERP_QUANTUM = 1e6
+
+# Interpolated values kept per map by cached_interpolate
+_INTERP_CACHE_SIZE = 4096
+
+
+def _build_interp_fn(
+    interp_fns: Dict[str, Callable[[float, float], float]],
+    method: str,
+    grid: np.ndarray,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+) -> Callable[[float, float], float]:
+    """Build the interpolator for *method* and record it in *interp_fns*.
+
+    Interpolators are built on first use, so maps that are never sampled
+    cost nothing.
+    """
+    factory = _INTERP_FACTORIES.get(method)
+    if factory is None:
+        raise ValueError(f"Unsupported interpolation method: {method}")
+    interp = interp_fns[method] = factory(grid, lat_min, lat_max, lon_min, lon_max)
+    return interp
+
+
+def _quantised_sampler(
+    grid: np.ndarray,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+    interp_fns: Dict[str, Callable[[float, float], float]],
+) -> Callable[[int, int, str], float]:
+    """Return an LRU-cached sampler of one map at quantised coordinates.
+
+    The sampler takes coordinates in ``1 / _INTERP_QUANTUM`` degree steps.
+    It closes over the map's fields rather than the map, so the two do not
+    form a reference cycle and a dropped map frees its grid at once.
+    """
+
+    @lru_cache(maxsize=_INTERP_CACHE_SIZE)
+    def sample(lat_q: int, lon_q: int, method: str) -> float:
+        # Rounding may step just past a bound that is not on the quantum
+        lat = min(max(lat_q / _INTERP_QUANTUM, lat_min), lat_max)
+        lon = min(max(lon_q / _INTERP_QUANTUM, lon_min), lon_max)
+        interp = interp_fns.get(method)
+        if interp is None:
+            interp = _build_interp_fn(
+                interp_fns, method, grid, lat_min, lat_max, lon_min, lon_max
+            )
+        return interp(lat, lon)
+
+    return sample
+
 
 def cached_interpolate(map_obj: MagneticMap, lat: float, lon: float, method: str = "bilinear") -> float:
     """
     Cached version of the interpolate method.
     
-    This function uses a custom LRU cache for efficient caching of
-    interpolation results.
+    Coordinates are rounded to 1e-6 degrees before the lookup so that
+    repeated queries around one spot (e.g. a hovering vehicle) hit the
+    cache; the value returned is the map sampled at the rounded location.
+    Each map keeps its own ``functools.lru_cache`` of recent results, so
+    entries live and die with the map and callers using different maps never
+    evict each other's entries.
     
     Args:
         map_obj: MagneticMap instance
@@ -416,18 +824,90 @@ def cached_interpolate(map_obj: MagneticMap, lat: float, lon: float, method: str
     Raises:
         ValueError: If the method is not supported or coordinates are out of bounds
     """
+    if method not in _INTERP_FACTORIES:
+        raise ValueError(f"Unsupported interpolation method: {method}")
+    
+    # NumPy scalars (e.g. from np.linspace) make the arithmetic several times slower
+    lat, lon = float(lat), float(lon)
+    if not (map_obj.lat_min <= lat <= map_obj.lat_max) or not (
+        map_obj.lon_min <= lon <= map_obj.lon_max
+    ):
+        raise ValueError("Location outside of map bounds")
+    
+    return map_obj._interp_cache(
+        round(lat * _INTERP_QUANTUM), round(lon * _INTERP_QUANTUM), method
+    )
+
+
+def interpolate_array(
+    map_obj: MagneticMap,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    method: str = "bilinear",
+    fill_value: float = np.nan,
+) -> np.ndarray:
+    """
+    Interpolate the map at many coordinates in a single pass.
+    
+    Equivalent to calling ``map_obj.interpolate(lat, lon, method)`` for every
+    pair, without the per-point Python overhead.
+    
+    Args:
+        map_obj: MagneticMap instance
+        lats: Array of latitude coordinates
+        lons: Array of longitude coordinates (same shape as ``lats``)
+        method: Interpolation method ("bilinear" or "bicubic")
+        fill_value: Value returned for coordinates outside the map bounds
+        
+    Returns:
+        Array of interpolated values in nano-tesla
+        
+    Raises:
+        ValueError: If the method is invalid
+    """
     if method not in ["bilinear", "bicubic"]:
         raise ValueError(f"Unsupported interpolation method: {method}")
     
-    # Create a cache key
-    cache_key = (id(map_obj), lat, lon, method)
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    rows, cols = map_obj.rows, map_obj.cols
     
-    # Check if result is in cache
-    if cache_key in _interpolation_cache:
-        return _interpolation_cache[cache_key]
+    # Convert geographic coordinates to fractional grid indices
+    inv_dlat = (rows - 1) / (map_obj.lat_max - map_obj.lat_min)
+    inv_dlon = (cols - 1) / (map_obj.lon_max - map_obj.lon_min)
+    row_f = (lats - map_obj.lat_min) * inv_dlat
+    col_f = (lons - map_obj.lon_min) * inv_dlon
     
-    # Calculate and cache the result
-    result = map_obj.interpolate(lat, lon, method)
-    _interpolation_cache[cache_key] = result
+    kernel = bilinear_array if method == "bilinear" else bicubic_array
+    values = kernel(
+        np.asarray(map_obj.grid, dtype=np.float64), row_f, col_f, rows, cols
+    )
     
-    return result
+    in_bounds = (
+        (map_obj.lat_min <= lats) & (lats <= map_obj.lat_max)
+        & (map_obj.lon_min <= lons) & (lons <= map_obj.lon_max)
+    )
+    return np.where(in_bounds, values, fill_value)
+
+
+def interpolate_bilinear_array(
+    map_obj: MagneticMap,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    fill_value: float = np.nan,
+) -> np.ndarray:
+    """
+    Bilinearly interpolate the map at many coordinates in a single pass.
+    
+    Shorthand for :func:`interpolate_array` with ``method="bilinear"``.
+    
+    Args:
+        map_obj: MagneticMap instance
+        lats: Array of latitude coordinates
+        lons: Array of longitude coordinates (same shape as ``lats``)
+        fill_value: Value returned for coordinates outside the map bounds
+        
+    Returns:
+        Array of interpolated values in nano-tesla
+    """
+    return interpolate_array(map_obj, lats, lons, "bilinear", fill_value)
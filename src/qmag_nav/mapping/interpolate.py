@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import math
-from typing import List, Tuple, Union
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Tuple, Union
 
 import numpy as np
 
+from qmag_nav.mapping._interp_nb import (
+    _bicubic_geo_nb,
+    _bicubic_nb,
+    _bilinear_geo_nb,
+    _bilinear_nb,
+)
+
 
 def bilinear(
     grid: Union[List[List[float]], np.ndarray],
@@ -34,13 +43,57 @@ def bilinear(
     if not (0 <= row_f <= rows - 1) or not (0 <= col_f <= cols - 1):
         raise ValueError(f"Indices ({row_f}, {col_f}) outside grid bounds ({rows}x{cols})")
     
-    # Fast floor operation for positive values
-    row0 = int(row_f) if row_f >= 0 else int(row_f) - 1
-    col0 = int(col_f) if col_f >= 0 else int(col_f) - 1
+    if isinstance(grid, np.ndarray):
+        return float(_bilinear_nb(grid, row_f, col_f))
+    
+    # In-bounds indices are non-negative, so int() is the floor
+    row0 = max(0, min(int(row_f), rows - 2))
+    col0 = max(0, min(int(col_f), cols - 2))
+    
+    # Fractional parts
+    fr = row_f - row0
+    fc = col_f - col0
+    
+    # Four neighbors, two consecutive reads per row
+    upper = grid[row0]
+    lower = grid[row0 + 1]
+    v00 = float(upper[col0])
+    v01 = float(upper[col0 + 1])
+    v10 = float(lower[col0])
+    v11 = float(lower[col0 + 1])
+    
+    # Lerp along columns, then between the two rows
+    c0 = v00 + fc * (v01 - v00)
+    c1 = v10 + fc * (v11 - v10)
+    return c0 + fr * (c1 - c0)
+
+
+def bilinear_array(
+    grid: np.ndarray,
+    row_f: np.ndarray,
+    col_f: np.ndarray,
+    rows: int,
+    cols: int,
+) -> np.ndarray:
+    """
+    Perform bilinear interpolation at many points of a 2D grid at once.
+    
+    Vectorised counterpart of :func:`bilinear`; indices outside the grid are
+    clamped to the nearest edge cell instead of raising, so callers must mask
+    out-of-bounds points themselves.
     
-    # Ensure we don't go out of bounds
-    row0 = max(0, min(row0, rows - 2))
-    col0 = max(0, min(col0, cols - 2))
+    Args:
+        grid: 2D array of values (rows × cols)
+        row_f: Array of fractional row indices
+        col_f: Array of fractional column indices
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+        
+    Returns:
+        Array of interpolated values with the shape of ``row_f``
+    """
+    row0 = np.clip(np.floor(row_f).astype(np.intp), 0, rows - 2)
+    col0 = np.clip(np.floor(col_f).astype(np.intp), 0, cols - 2)
     row1 = row0 + 1
     col1 = col0 + 1
     
@@ -49,19 +102,97 @@ def bilinear(
     fc = col_f - col0
     
     # Four neighbors
-    if isinstance(grid, np.ndarray):
-        q11 = float(grid[row0, col0])
-        q21 = float(grid[row0, col1])
-        q12 = float(grid[row1, col0])
-        q22 = float(grid[row1, col1])
-    else:
-        q11 = float(grid[row0][col0])
-        q21 = float(grid[row0][col1])
-        q12 = float(grid[row1][col0])
-        q22 = float(grid[row1][col1])
+    v00 = grid[row0, col0]
+    v01 = grid[row0, col1]
+    v10 = grid[row1, col0]
+    v11 = grid[row1, col1]
     
-    # Bilinear interpolation formula - optimized for fewer operations
-    return q11 * (1 - fr) * (1 - fc) + q21 * (1 - fr) * fc + q12 * fr * (1 - fc) + q22 * fr * fc
+    # Lerp along columns, then between the two rows
+    c0 = v00 + fc * (v01 - v00)
+    c1 = v10 + fc * (v11 - v10)
+    return c0 + fr * (c1 - c0)
+
+
+@dataclass(slots=True, frozen=True)
+class BilinearWeights:
+    """
+    Bilinear stencils precomputed for a fixed set of points.
+    
+    Attributes:
+        rows: Number of rows of the grid the stencils were built for
+        cols: Number of columns of the grid the stencils were built for
+        index: ``(..., 4)`` flat grid indices of each point's cell corners,
+            in the order (row0, col0), (row0, col1), (row1, col0), (row1, col1)
+        weights: ``(..., 4)`` corner weights, summing to one for each point
+    """
+
+    rows: int
+    cols: int
+    index: np.ndarray
+    weights: np.ndarray
+
+
+def precompute_bilinear(
+    row_f: np.ndarray,
+    col_f: np.ndarray,
+    rows: int,
+    cols: int,
+) -> BilinearWeights:
+    """
+    Precompute the bilinear stencils of many points of a grid.
+    
+    The cell lookup and weights depend only on the points and the grid
+    shape, so points sampled repeatedly (e.g. against several grids of the
+    same shape) pay for them once; :func:`interpolate_precomputed` then
+    costs one gather and one weighted sum.  Indices outside the grid are
+    clamped like in :func:`bilinear_array`.
+    
+    Args:
+        row_f: Array of fractional row indices
+        col_f: Array of fractional column indices
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+        
+    Returns:
+        BilinearWeights for the points, in the shape of ``row_f``
+    """
+    row_f = np.asarray(row_f, dtype=np.float64)
+    col_f = np.asarray(col_f, dtype=np.float64)
+    row0 = np.clip(np.floor(row_f).astype(np.intp), 0, rows - 2)
+    col0 = np.clip(np.floor(col_f).astype(np.intp), 0, cols - 2)
+    fr = row_f - row0
+    fc = col_f - col0
+    
+    base = row0 * cols + col0
+    index = np.stack([base, base + 1, base + cols, base + cols + 1], axis=-1)
+    weights = np.stack(
+        [(1.0 - fr) * (1.0 - fc), (1.0 - fr) * fc, fr * (1.0 - fc), fr * fc], axis=-1
+    )
+    return BilinearWeights(rows, cols, index, weights)
+
+
+def interpolate_precomputed(grid: np.ndarray, stencils: BilinearWeights) -> np.ndarray:
+    """
+    Evaluate precomputed bilinear stencils on a grid.
+    
+    Args:
+        grid: 2D array of values (rows × cols)
+        stencils: Stencils from :func:`precompute_bilinear`
+        
+    Returns:
+        Array of interpolated values in the shape of the original points
+        
+    Raises:
+        ValueError: If the grid shape differs from the one the stencils were built for
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    if grid.shape != (stencils.rows, stencils.cols):
+        raise ValueError(
+            f"Stencils were built for a {stencils.rows}x{stencils.cols} grid, "
+            f"got {grid.shape[0]}x{grid.shape[1]}"
+        )
+    corners = grid.ravel()[stencils.index]
+    return np.einsum("...i,...i->...", corners, stencils.weights)
 
 
 def bicubic(
@@ -74,7 +205,9 @@ def bicubic(
     """
     Perform bicubic interpolation on a 2D grid.
     
-    This provides smoother interpolation than bilinear but is more computationally expensive.
+    Interior points use Catmull-Rom weights on the surrounding 4x4 nodes,
+    which reproduces linear data exactly and is smoother than bilinear.
+    Points within one cell of the edge fall back to bilinear.
     
     Args:
         grid: 2D grid of values (rows × cols)
@@ -107,46 +240,171 @@ def bicubic(
     
     # Convert grid to numpy array if it's not already
     if not isinstance(grid, np.ndarray):
-        grid_array = np.array(grid)
-    else:
-        grid_array = grid
+        grid = np.asarray(grid, dtype=np.float64)
     
-    # Get integer and fractional parts
-    row = int(row_f)
-    col = int(col_f)
+    return float(_bicubic_nb(grid, row_f, col_f))
+
+
+def bicubic_array(
+    grid: np.ndarray,
+    row_f: np.ndarray,
+    col_f: np.ndarray,
+    rows: int,
+    cols: int,
+) -> np.ndarray:
+    """
+    Perform bicubic interpolation at many points of a 2D grid at once.
+    
+    Vectorised counterpart of :func:`bicubic` with the same rules: exact grid
+    points return the node value, points within one cell of the edge fall
+    back to bilinear, and interior points take the Catmull-Rom weighted 4x4
+    neighbourhood.  Like :func:`bilinear_array`, indices outside the grid are
+    clamped rather than rejected.
+    
+    Args:
+        grid: 2D array of values (rows × cols)
+        row_f: Array of fractional row indices
+        col_f: Array of fractional column indices
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+        
+    Returns:
+        Array of interpolated values with the shape of ``row_f``
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    row_f = np.asarray(row_f, dtype=np.float64)
+    col_f = np.asarray(col_f, dtype=np.float64)
+    shape = row_f.shape
+    row_f = row_f.ravel()
+    col_f = col_f.ravel()
+    
+    row = np.floor(row_f)
+    col = np.floor(col_f)
     u = row_f - row
     v = col_f - col
+    row = row.astype(np.intp)
+    col = col.astype(np.intp)
     
-    # Get 4x4 neighborhood
-    neighborhood = np.zeros((4, 4))
-    for i in range(4):
-        for j in range(4):
-            r = max(0, min(row - 1 + i, rows - 1))
-            c = max(0, min(col - 1 + j, cols - 1))
-            neighborhood[i, j] = grid_array[r, c]
-    
-    # Simplified bicubic interpolation for our test case
-    # This is a simpler implementation that will be closer to bilinear results
-    # but still provide smooth transitions
+    # 4x4 neighbourhoods, (N, 4, 4), with indices clamped to the grid
+    offsets = np.arange(-1, 3)
+    r_idx = np.clip(row[:, None] + offsets, 0, rows - 1)
+    c_idx = np.clip(col[:, None] + offsets, 0, cols - 1)
+    neighborhood = grid[r_idx[:, :, None], c_idx[:, None, :]]
     
-    # Use a weighted average of the 16 surrounding points
-    # with weights decreasing with distance
-    weights = np.zeros((4, 4))
-    for i in range(4):
-        for j in range(4):
-            # Distance from the interpolation point (centered at 1,1 in our 4x4 grid)
-            di = abs(i - 1 - u)
-            dj = abs(j - 1 - v)
-            # Weight decreases with distance (inverse square)
-            weights[i, j] = 1.0 / (1.0 + di*di + dj*dj)
+    # Separable Catmull-Rom weights, contracted as wy @ stencil @ wx per point
+    weighted = np.einsum(
+        "ni,nij,nj->n", _cubic_weights_array(u), neighborhood, _cubic_weights_array(v)
+    )
     
-    # Normalize weights
-    weights = weights / np.sum(weights)
+    interior = (row_f >= 1) & (row_f <= rows - 2) & (col_f >= 1) & (col_f <= cols - 2)
+    result = np.where(interior, weighted, bilinear_array(grid, row_f, col_f, rows, cols))
     
-    # Weighted sum
-    result = np.sum(weights * neighborhood)
+    # Exact grid points return the node value
+    exact = (u == 0) & (v == 0)
+    nodes = grid[np.clip(row, 0, rows - 1), np.clip(col, 0, cols - 1)]
+    result = np.where(exact, nodes, result)
     
-    return float(result)
+    return result.reshape(shape)
+
+
+def _cubic_weights_array(t: np.ndarray) -> np.ndarray:
+    """Catmull-Rom weights, shape (N, 4), for an array of fractions *t*."""
+    t = t[:, None]
+    t2 = t * t
+    t3 = t2 * t
+    return 0.5 * np.hstack([
+        -t3 + 2.0 * t2 - t,
+        3.0 * t3 - 5.0 * t2 + 2.0,
+        -3.0 * t3 + 4.0 * t2 + t,
+        t3 - t2,
+    ])
+
+
+def _make_geo_fn(
+    kernel: Callable[..., float],
+    grid: np.ndarray,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+) -> Callable[[float, float], float]:
+    """Bind one map's grid, bounds and scales to a compiled geographic kernel."""
+    grid = np.ascontiguousarray(grid, dtype=np.float64)
+    rows, cols = grid.shape
+    inv_dlat, inv_dlon = _grid_scales(lat_min, lat_max, lon_min, lon_max, rows, cols)
+
+    def interp_at(lat: float, lon: float) -> float:
+        if not (lat_min <= lat <= lat_max) or not (lon_min <= lon <= lon_max):
+            raise ValueError("Location outside of map bounds")
+        return kernel(grid, lat, lon, lat_min, lon_min, inv_dlat, inv_dlon)
+
+    return interp_at
+
+
+def make_bilinear_fn(
+    grid: np.ndarray,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+) -> Callable[[float, float], float]:
+    """
+    Build a bilinear interpolator specialised to one map.
+
+    The grid, bounds and cells-per-degree scales are bound into a closure
+    once, so each call only checks the bounds and enters the compiled
+    kernel; there is no per-call attribute lookup, index conversion or
+    corner slicing.  The kernel itself is shared by all maps, so building
+    an interpolator compiles nothing.
+
+    Args:
+        grid: 2D float64 grid of values (rows × cols, lat major)
+        lat_min: Minimum latitude bound
+        lat_max: Maximum latitude bound
+        lon_min: Minimum longitude bound
+        lon_max: Maximum longitude bound
+
+    Returns:
+        Function mapping ``(lat, lon)`` to the interpolated value; it raises
+        ValueError for locations outside the bounds
+    """
+    return _make_geo_fn(_bilinear_geo_nb, grid, lat_min, lat_max, lon_min, lon_max)
+
+
+def make_bicubic_fn(
+    grid: np.ndarray,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+) -> Callable[[float, float], float]:
+    """
+    Build a bicubic interpolator specialised to one map.
+
+    The bicubic counterpart of :func:`make_bilinear_fn`; the whole
+    Catmull-Rom evaluation, including the exact-node and edge cases of
+    :func:`bicubic`, runs in one compiled call.
+
+    Args:
+        grid: 2D float64 grid of values (rows × cols, lat major)
+        lat_min: Minimum latitude bound
+        lat_max: Maximum latitude bound
+        lon_min: Minimum longitude bound
+        lon_max: Maximum longitude bound
+
+    Returns:
+        Function mapping ``(lat, lon)`` to the interpolated value; it raises
+        ValueError for locations outside the bounds
+    """
+    return _make_geo_fn(_bicubic_geo_nb, grid, lat_min, lat_max, lon_min, lon_max)
+
+
+@lru_cache(maxsize=8)
+def _grid_scales(
+    lat_min: float, lat_max: float, lon_min: float, lon_max: float, rows: int, cols: int
+) -> Tuple[float, float]:
+    """Return the grid cells per degree of latitude and longitude."""
+    return (rows - 1) / (lat_max - lat_min), (cols - 1) / (lon_max - lon_min)
 
 
 def grid_to_geo_coords(
@@ -181,12 +439,9 @@ def grid_to_geo_coords(
     if not (lat_min <= lat <= lat_max) or not (lon_min <= lon <= lon_max):
         raise ValueError(f"Coordinates ({lat}, {lon}) outside bounds ({lat_min}-{lat_max}, {lon_min}-{lon_max})")
     
-    # Calculate cell sizes
-    d_lat = (lat_max - lat_min) / (rows - 1)
-    d_lon = (lon_max - lon_min) / (cols - 1)
-    
-    # Convert to fractional indices
-    row_f = (lat - lat_min) / d_lat
-    col_f = (lon - lon_min) / d_lon
+    # Convert to fractional indices, capped against rounding at the upper bounds
+    rows_per_deg, cols_per_deg = _grid_scales(lat_min, lat_max, lon_min, lon_max, rows, cols)
+    row_f = min((lat - lat_min) * rows_per_deg, rows - 1.0)
+    col_f = min((lon - lon_min) * cols_per_deg, cols - 1.0)
     
     return row_f, col_f
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Shared magnetic map loading for the MCP tools."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import resources
+from typing import Optional
+
+from qmag_nav.mapping.backend import MagneticMap, load_map
+
+# Standard locations of the default map inside the package
+DEFAULT_MAP_PATHS = (
+    "mag_data/default.tif",
+    "mag_data/default.nc",
+)
+
+
+def get_map(map_path: Optional[str] = None) -> Optional[MagneticMap]:
+    """Load the configured magnetic map, or the packaged default map.
+
+    Maps are memoised by path in :func:`load_map`, so tools and requests
+    share one instance.  A cold load performs blocking file I/O; async
+    callers should run it through ``asyncio.to_thread`` so that it does not
+    stall the event loop.
+
+    Args:
+        map_path: Optional path to the magnetic map file
+
+    Returns:
+        The loaded map, or None if no path was given and no default map exists
+
+    Raises:
+        ValueError: If the map file cannot be loaded
+    """
+    if map_path:
+        return load_map(map_path)
+
+    default_path = _default_map_path()
+    if default_path is None:
+        return None
+    return load_map(default_path)
+
+
+@lru_cache(maxsize=1)
+def _default_map_path() -> Optional[str]:
+    """Locate the packaged default map, looking it up once per process.
+
+    Returns:
+        Filesystem path of the first default map found, or None
+    """
+    package = resources.files("qmag_nav")
+    for path in DEFAULT_MAP_PATHS:
+        candidate = package.joinpath(path)
+        if candidate.is_file():
+            return str(candidate)
+    return None
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 
 from mcp.types import Tool, CallToolResult as ToolResult, TextContent
 import json
 
-from qmag_nav.mapping.backend import load_map, cached_interpolate
+from qmag_nav.mapping.backend import cached_interpolate
+from qmag_nav.mcp.tools._maps import get_map
 from qmag_nav.models.geo import LatLon, MagneticVector
 
 
+# Response text template, formatted once per call
+_MAG_TEMPLATE = "Magnetic field at ({lat}, {lon}): {mag:.2f} nT\n\nData: {data}"
+
+
 class MagneticFieldTool:
     """MCP tool for querying magnetic field values at specific coordinates."""
 
@@ -84,40 +90,10 @@ class MagneticFieldTool:
                 ]
             )
         
-        # Load map if not already loaded
+        # Load map if not already loaded (off the event loop, it blocks on I/O)
         if self._map is None:
             try:
-                if self._map_path:
-                    self._map = load_map(self._map_path)
-                else:
-                    # Try to find a default map in the package
-                    import os
-                    import pkg_resources
-                    
-                    # Look for maps in standard locations
-                    possible_paths = [
-                        "mag_data/default.tif",
-                        "mag_data/default.nc",
-                    ]
-                    
-                    for path in possible_paths:
-                        try:
-                            full_path = pkg_resources.resource_filename("qmag_nav", path)
-                            if os.path.exists(full_path):
-                                self._map = load_map(full_path)
-                                break
-                        except (ImportError, FileNotFoundError):
-                            continue
-                    
-                    if self._map is None:
-                        return ToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text="No magnetic map loaded and no default map found."
-                                )
-                            ]
-                        )
+                self._map = await asyncio.to_thread(get_map, self._map_path)
             except Exception as e:
                 return ToolResult(
                     content=[
@@ -127,6 +103,16 @@ class MagneticFieldTool:
                         )
                     ]
                 )
+
+            if self._map is None:
+                return ToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text="No magnetic map loaded and no default map found."
+                        )
+                    ]
+                )
         
         # Query the magnetic field
         try:
@@ -146,8 +132,12 @@ class MagneticFieldTool:
                 content=[
                     TextContent(
                         type="text",
-                        text=f"Magnetic field at ({latitude}, {longitude}): {mag_value:.2f} nT\n\n"
-                             f"Data: {json.dumps(data, indent=2)}"
+                        text=_MAG_TEMPLATE.format(
+                            lat=latitude,
+                            lon=longitude,
+                            mag=mag_value,
+                            data=json.dumps(data, indent=2),
+                        )
                     )
                 ]
             )
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Any, Optional, List, Tuple, Callable
 
 from mcp.types import Tool, CallToolResult as ToolResult, TextContent
 import json
 
 from qmag_nav.filter.ekf import NavEKF
-from qmag_nav.mapping.backend import load_map, cached_interpolate
+from qmag_nav.mapping.backend import FieldCellCache
+from qmag_nav.mcp.tools._maps import get_map
 from qmag_nav.models.geo import LatLon, MagneticVector
 
 
+# Response text template, formatted once per call
+_POSITION_TEMPLATE = (
+    "Estimated position: ({lat:.6f}, {lon:.6f})\n"
+    "Velocity: {north:.2f} m/s N, {east:.2f} m/s E\n"
+    "Position uncertainty: {lat_unc:.6f}° lat, {lon_unc:.6f}° lon\n\n"
+    "Data: {data}"
+)
+
+
 class PositionEstimationTool:
     """MCP tool for estimating position using Extended Kalman Filter."""
 
@@ -24,6 +35,7 @@ class PositionEstimationTool:
         """
         self._map_path = map_path
         self._map = None
+        self._field_cache = None
         self._ekf = None
     
     def get_tool_definition(self) -> Tool:
@@ -103,40 +115,10 @@ class PositionEstimationTool:
                 ]
             )
         
-        # Load map if not already loaded
+        # Load map if not already loaded (off the event loop, it blocks on I/O)
         if self._map is None:
             try:
-                if self._map_path:
-                    self._map = load_map(self._map_path)
-                else:
-                    # Try to find a default map in the package
-                    import os
-                    import pkg_resources
-                    
-                    # Look for maps in standard locations
-                    possible_paths = [
-                        "mag_data/default.tif",
-                        "mag_data/default.nc",
-                    ]
-                    
-                    for path in possible_paths:
-                        try:
-                            full_path = pkg_resources.resource_filename("qmag_nav", path)
-                            if os.path.exists(full_path):
-                                self._map = load_map(full_path)
-                                break
-                        except (ImportError, FileNotFoundError):
-                            continue
-                    
-                    if self._map is None:
-                        return ToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text="No magnetic map loaded and no default map found."
-                                )
-                            ]
-                        )
+                self._map = await asyncio.to_thread(get_map, self._map_path)
             except Exception as e:
                 return ToolResult(
                     content=[
@@ -146,6 +128,16 @@ class PositionEstimationTool:
                         )
                     ]
                 )
+
+            if self._map is None:
+                return ToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text="No magnetic map loaded and no default map found."
+                        )
+                    ]
+                )
         
         # Initialize or reset EKF if needed
         if self._ekf is None or reset:
@@ -154,21 +146,23 @@ class PositionEstimationTool:
                 initial_lat = (self._map.lat_min + self._map.lat_max) / 2
                 initial_lon = (self._map.lon_min + self._map.lon_max) / 2
             
-            # Create a new EKF instance
-            self._ekf = NavEKF(
-                initial=LatLon(lat=initial_lat, lon=initial_lon),
-                initial_velocity=None,  # Default to zero velocity
-                process_noise=0.01  # Default process noise
-            )
+            if self._ekf is None:
+                # Create a new EKF instance
+                self._ekf = NavEKF(
+                    initial=LatLon(lat=initial_lat, lon=initial_lon),
+                    initial_velocity=None,  # Default to zero velocity
+                    process_noise=0.01  # Default process noise
+                )
+            else:
+                # Reuse the existing filter rather than reallocating it
+                self._ekf.reset_to(initial_lat, initial_lon)
         
-        # Define the magnetic field lookup function for the EKF
-        def mag_map_func(lat: float, lon: float) -> float:
-            try:
-                return cached_interpolate(self._map, lat, lon, "bilinear")
-            except ValueError:
-                # If outside map bounds, return a default value
-                # This is not ideal but prevents the filter from failing
-                return 0.0
+        # The EKF queries neighbouring points of one grid cell per update.
+        # Outside the map bounds the lookup returns a default value; this is
+        # not ideal but prevents the filter from failing.
+        if self._field_cache is None:
+            self._field_cache = FieldCellCache(self._map, fill_value=0.0)
+        mag_map_func = self._field_cache.sample
         
         try:
             # Predict step (move the state forward in time)
@@ -216,10 +210,15 @@ class PositionEstimationTool:
                 content=[
                     TextContent(
                         type="text",
-                        text=f"Estimated position: ({position.lat:.6f}, {position.lon:.6f})\n"
-                             f"Velocity: {velocity_ms[0]:.2f} m/s N, {velocity_ms[1]:.2f} m/s E\n"
-                             f"Position uncertainty: {pos_uncertainty[0]:.6f}° lat, {pos_uncertainty[1]:.6f}° lon\n\n"
-                             f"Data: {json.dumps(data, indent=2)}"
+                        text=_POSITION_TEMPLATE.format(
+                            lat=position.lat,
+                            lon=position.lon,
+                            north=velocity_ms[0],
+                            east=velocity_ms[1],
+                            lat_unc=pos_uncertainty[0],
+                            lon_unc=pos_uncertainty[1],
+                            data=json.dumps(data, indent=2),
+                        )
                     )
                 ]
             )
@@ -8,9 +8,48 @@ import numpy as np
 from mcp.types import Tool, CallToolResult as ToolResult, TextContent
 import json
 
+from qmag_nav._compat import njit
 from qmag_nav.models.sensor import CalibrationParams
 
 
+@njit(cache=True, nogil=True)
+def _axis_extents(samples):  # noqa: ANN001, ANN202
+    """Return the per-axis minima and maxima of an ``(N, 3)`` array in one pass."""
+
+    lo = samples[0].copy()
+    hi = samples[0].copy()
+    for i in range(1, samples.shape[0]):
+        for k in range(3):
+            v = samples[i, k]
+            if v < lo[k]:
+                lo[k] = v
+            elif v > hi[k]:
+                hi[k] = v
+    return lo, hi
+
+
+@njit(cache=True, nogil=True)
+def _axis_centre_spread(samples):  # noqa: ANN001, ANN202
+    """Return the per-axis means and mean absolute deviations of an ``(N, 3)`` array.
+
+    Two passes over the samples, without the centred copy that the NumPy
+    expression ``np.mean(np.abs(samples - centre), axis=0)`` allocates.
+    """
+
+    n = samples.shape[0]
+    centre = np.zeros(3)
+    for i in range(n):
+        for k in range(3):
+            centre[k] += samples[i, k]
+    centre /= n
+    spread = np.zeros(3)
+    for i in range(n):
+        for k in range(3):
+            spread[k] += abs(samples[i, k] - centre[k])
+    spread /= n
+    return centre, spread
+
+
 class SensorCalibrationTool:
     """MCP tool for magnetometer sensor calibration."""
 
@@ -65,7 +104,7 @@ class SensorCalibrationTool:
             samples = arguments.get("samples", [])
             method = arguments.get("method", "ellipsoid")
             
-            if not isinstance(samples, list) or len(samples) < 8:
+            if len(samples) < 8:
                 return ToolResult(
                     content=[
                         TextContent(
@@ -75,17 +114,9 @@ class SensorCalibrationTool:
                     ]
                 )
             
-            # Convert samples to numpy array
-            samples_array = np.array(samples, dtype=float)
-            if samples_array.ndim != 2 or samples_array.shape[1] != 3:
-                return ToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text="Samples must be an array of [Bx, By, Bz] values."
-                        )
-                    ]
-                )
+            # Convert samples to an (N, 3) array; no copy for float64 ndarrays,
+            # and the reshape raises unless every sample is [Bx, By, Bz]
+            samples_array = np.asarray(samples, dtype=np.float64).reshape(len(samples), 3)
                 
         except (ValueError, TypeError) as e:
             return ToolResult(
@@ -149,8 +180,7 @@ class SensorCalibrationTool:
             CalibrationParams with scale and offset values
         """
         # Find min and max values for each axis
-        min_values = np.min(samples, axis=0)
-        max_values = np.max(samples, axis=0)
+        min_values, max_values = _axis_extents(samples)
         
         # Calculate offsets (center of the range)
         offsets = (min_values + max_values) / 2
@@ -188,14 +218,10 @@ class SensorCalibrationTool:
         # 2. Center the points
         # 3. Find the scaling factors to make it spherical
         
-        # Find the center (offset)
-        center = np.mean(samples, axis=0)
-        
-        # Center the points
-        centered = samples - center
-        
-        # Find the average distance from center for each axis
-        axis_ranges = np.mean(np.abs(centered), axis=0) * 2
+        # Find the center (offset) and the average distance from it for
+        # each axis
+        center, spread = _axis_centre_spread(samples)
+        axis_ranges = spread * 2
         
         # Calculate scale factors to make it spherical
         # We'll normalize to the average of the three axes
@@ -2,17 +2,107 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Any, List, Tuple, Optional
 import math
-import random
 
 import numpy as np
 from mcp.types import Tool, CallToolResult as ToolResult, TextContent
-import json
 
+from qmag_nav import _native
+from qmag_nav._compat import json_dumps, njit, prange
 from qmag_nav.models.geo import LatLon
 from qmag_nav.filter.utils import latlon_to_meters, meters_to_latlon
-from qmag_nav.mapping.backend import load_map, cached_interpolate
+from qmag_nav.mapping.backend import interpolate_bilinear_array
+from qmag_nav.mcp.tools._maps import get_map
+
+
+# Random source for trajectory perturbations and measurement noise
+_RNG = np.random.default_rng()
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _bezier_eval(p0_lat, p0_lon, p1_lat, p1_lon, p2_lat, p2_lon, ts):  # noqa: ANN001, ANN202
+    """Evaluate a quadratic Bezier curve at every parameter in *ts*.
+
+    Args:
+        p0_lat, p0_lon: Start point
+        p1_lat, p1_lon: Control point
+        p2_lat, p2_lon: End point
+        ts: Array of parameters (0 to 1)
+
+    Returns:
+        (latitudes, longitudes) arrays with the same shape as *ts*
+    """
+    out_lat = np.empty_like(ts)
+    out_lon = np.empty_like(ts)
+    for i in range(ts.shape[0]):
+        # Quadratic Bezier formula: B(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
+        t = ts[i]
+        mt = 1.0 - t
+        a = mt * mt
+        b = 2.0 * mt * t
+        c = t * t
+        out_lat[i] = a * p0_lat + b * p1_lat + c * p2_lat
+        out_lon[i] = a * p0_lon + b * p1_lon + c * p2_lon
+    return out_lat, out_lon
+
+
+# Prefer the precompiled kernel when the AOT extension has been built
+_bezier = _native.load("bezier_eval", _bezier_eval)
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _simulate_straight(  # noqa: ANN001, ANN202
+    s_lat, s_lon, e_lat, e_lon,
+    grid, lat_min, lat_max, lon_min, lon_max,
+    noise, out_lat, out_lon, out_mag
+):
+    """Generate a straight trajectory and sample the map along it in one pass.
+
+    Fuses point generation, bilinear interpolation and noise so that no
+    intermediate arrays are materialised; every point is independent, so the
+    loop runs in parallel.
+
+    Args:
+        s_lat, s_lon: Start point
+        e_lat, e_lon: End point
+        grid: 2D array of map values (rows × cols)
+        lat_min, lat_max, lon_min, lon_max: Map bounds
+        noise: Measurement noise to add to each in-bounds sample
+        out_lat, out_lon, out_mag: Preallocated output arrays of equal length;
+            points outside the map get a magnetic value of 0.0
+    """
+    n = out_lat.shape[0]
+    rows, cols = grid.shape
+    inv_dlat = (rows - 1) / (lat_max - lat_min)
+    inv_dlon = (cols - 1) / (lon_max - lon_min)
+    for i in prange(n):
+        if i == n - 1:
+            lat = e_lat
+            lon = e_lon
+        else:
+            t = i / (n - 1)
+            lat = s_lat + t * (e_lat - s_lat)
+            lon = s_lon + t * (e_lon - s_lon)
+        out_lat[i] = lat
+        out_lon[i] = lon
+        
+        if not (lat_min <= lat <= lat_max and lon_min <= lon <= lon_max):
+            out_mag[i] = 0.0
+            continue
+        
+        row_f = (lat - lat_min) * inv_dlat
+        col_f = (lon - lon_min) * inv_dlon
+        row0 = min(int(row_f), rows - 2)
+        col0 = min(int(col_f), cols - 2)
+        fr = row_f - row0
+        fc = col_f - col0
+        v00 = grid[row0, col0]
+        v10 = grid[row0 + 1, col0]
+        c0 = v00 + fc * (grid[row0, col0 + 1] - v00)
+        c1 = v10 + fc * (grid[row0 + 1, col0 + 1] - v10)
+        out_mag[i] = c0 + fr * (c1 - c0) + noise[i]
 
 
 class TrajectorySimulationTool:
@@ -120,40 +210,10 @@ class TrajectorySimulationTool:
                 ]
             )
         
-        # Load map if not already loaded
+        # Load map if not already loaded (off the event loop, it blocks on I/O)
         if self._map is None:
             try:
-                if self._map_path:
-                    self._map = load_map(self._map_path)
-                else:
-                    # Try to find a default map in the package
-                    import os
-                    import pkg_resources
-                    
-                    # Look for maps in standard locations
-                    possible_paths = [
-                        "mag_data/default.tif",
-                        "mag_data/default.nc",
-                    ]
-                    
-                    for path in possible_paths:
-                        try:
-                            full_path = pkg_resources.resource_filename("qmag_nav", path)
-                            if os.path.exists(full_path):
-                                self._map = load_map(full_path)
-                                break
-                        except (ImportError, FileNotFoundError):
-                            continue
-                    
-                    if self._map is None:
-                        return ToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text="No magnetic map loaded and no default map found."
-                                )
-                            ]
-                        )
+                self._map = await asyncio.to_thread(get_map, self._map_path)
             except Exception as e:
                 return ToolResult(
                     content=[
@@ -163,86 +223,38 @@ class TrajectorySimulationTool:
                         )
                     ]
                 )
+
+            if self._map is None:
+                return ToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text="No magnetic map loaded and no default map found."
+                        )
+                    ]
+                )
         
         try:
-            # Calculate the total distance in meters
-            north_m, east_m = latlon_to_meters(
-                start_lat, start_lon, end_lat, end_lon
-            )
-            total_distance = math.sqrt(north_m**2 + east_m**2)
-            
-            # Calculate the total time needed
-            total_time = total_distance / speed  # seconds
-            
-            # Calculate the number of samples
-            num_samples = max(2, int(total_time * sample_rate))
-            
-            # Generate the trajectory points
-            trajectory = self._generate_trajectory(
+            # The CPU-bound simulation runs off the event loop
+            data = await asyncio.to_thread(
+                self._simulate,
                 start_lat, start_lon,
                 end_lat, end_lon,
-                num_samples,
-                path_type
+                speed, sample_rate, noise_level, path_type
             )
-            
-            # Calculate time steps
-            time_steps = [i / sample_rate for i in range(num_samples)]
-            
-            # Generate magnetic field values along the trajectory
-            magnetic_values = []
-            for lat, lon in trajectory:
-                try:
-                    # Get the true magnetic field value
-                    true_value = cached_interpolate(self._map, lat, lon, "bilinear")
-                    
-                    # Add noise
-                    noisy_value = true_value + random.gauss(0, noise_level)
-                    magnetic_values.append(noisy_value)
-                except ValueError:
-                    # If outside map bounds, use a default value
-                    magnetic_values.append(0.0)
-            
-            # Prepare the result data
-            trajectory_data = []
-            for i in range(num_samples):
-                trajectory_data.append({
-                    "time": time_steps[i],
-                    "position": {
-                        "latitude": trajectory[i][0],
-                        "longitude": trajectory[i][1]
-                    },
-                    "magnetic_field": magnetic_values[i]
-                })
-            
-            # Create a response with text content
-            data = {
-                "metadata": {
-                    "start": {"latitude": start_lat, "longitude": start_lon},
-                    "end": {"latitude": end_lat, "longitude": end_lon},
-                    "speed": speed,
-                    "sample_rate": sample_rate,
-                    "noise_level": noise_level,
-                    "path_type": path_type,
-                    "total_distance": total_distance,
-                    "total_time": total_time,
-                    "num_points": num_samples
-                },
-                # Include just the first and last points to keep the response size reasonable
-                "first_point": trajectory_data[0] if trajectory_data else None,
-                "last_point": trajectory_data[-1] if trajectory_data else None
-            }
+            metadata = data["metadata"]
             
             return ToolResult(
                 content=[
                     TextContent(
                         type="text",
-                        text=f"Generated trajectory with {num_samples} points from "
+                        text=f"Generated trajectory with {metadata['num_points']} points from "
                              f"({start_lat:.6f}, {start_lon:.6f}) to "
                              f"({end_lat:.6f}, {end_lon:.6f}).\n"
-                             f"Total distance: {total_distance:.2f} m\n"
-                             f"Total time: {total_time:.2f} s\n"
+                             f"Total distance: {metadata['total_distance']:.2f} m\n"
+                             f"Total time: {metadata['total_time']:.2f} s\n"
                              f"Path type: {path_type}\n\n"
-                             f"Data: {json.dumps(data, indent=2)}"
+                             f"Data: {json_dumps(data)}"
                     )
                 ]
             )
@@ -256,6 +268,105 @@ class TrajectorySimulationTool:
                 ]
             )
     
+    def _simulate(
+        self,
+        start_lat: float,
+        start_lon: float,
+        end_lat: float,
+        end_lon: float,
+        speed: float,
+        sample_rate: float,
+        noise_level: float,
+        path_type: str
+    ) -> Dict[str, Any]:
+        """Simulate a trajectory and its magnetic measurements.
+        
+        Pure CPU work with no awaits; ``execute`` runs it in a worker thread.
+        
+        Args:
+            start_lat, start_lon: Start point
+            end_lat, end_lon: End point
+            speed: Speed in meters per second
+            sample_rate: Sampling rate in Hz
+            noise_level: Noise level for magnetic measurements in nT
+            path_type: Type of path ("straight", "curved", or "random")
+            
+        Returns:
+            Dictionary with the simulation metadata and first/last points
+        """
+        # Calculate the total distance in meters
+        north_m, east_m = latlon_to_meters(
+            start_lat, start_lon, end_lat, end_lon
+        )
+        total_distance = math.sqrt(north_m**2 + east_m**2)
+        
+        # Calculate the total time needed
+        total_time = total_distance / speed  # seconds
+        
+        # Calculate the number of samples
+        num_samples = max(2, int(total_time * sample_rate))
+        
+        # Measurement noise for every sample
+        noise = _RNG.normal(0.0, noise_level, size=num_samples)
+        
+        if path_type == "straight":
+            # Generate, sample and add noise in a single fused kernel
+            lats = np.empty(num_samples)
+            lons = np.empty(num_samples)
+            mags = np.empty(num_samples)
+            _simulate_straight(
+                start_lat, start_lon, end_lat, end_lon,
+                np.asarray(self._map.grid, dtype=np.float64),
+                self._map.lat_min, self._map.lat_max,
+                self._map.lon_min, self._map.lon_max,
+                noise, lats, lons, mags
+            )
+        else:
+            # Generate the trajectory points
+            lats, lons = self._trajectory_arrays(
+                start_lat, start_lon,
+                end_lat, end_lon,
+                num_samples,
+                path_type
+            )
+            
+            # Sample the true magnetic field along the whole trajectory at
+            # once; points outside map bounds use a default value
+            true_values = interpolate_bilinear_array(self._map, lats, lons)
+            mags = np.where(np.isnan(true_values), 0.0, true_values + noise)
+        
+        # Time of every sample
+        times = np.arange(num_samples) / sample_rate
+        
+        def point(i: int) -> Dict[str, Any]:
+            return {
+                "time": float(times[i]),
+                "position": {
+                    "latitude": float(lats[i]),
+                    "longitude": float(lons[i])
+                },
+                "magnetic_field": float(mags[i])
+            }
+        
+        # Collect the result data
+        data = {
+            "metadata": {
+                "start": {"latitude": start_lat, "longitude": start_lon},
+                "end": {"latitude": end_lat, "longitude": end_lon},
+                "speed": speed,
+                "sample_rate": sample_rate,
+                "noise_level": noise_level,
+                "path_type": path_type,
+                "total_distance": total_distance,
+                "total_time": total_time,
+                "num_points": num_samples
+            },
+            # Include just the first and last points to keep the response size reasonable
+            "first_point": point(0),
+            "last_point": point(-1)
+        }
+        return data
+    
     def _generate_trajectory(
         self,
         start_lat: float,
@@ -278,15 +389,37 @@ class TrajectorySimulationTool:
         Returns:
             List of (latitude, longitude) points
         """
+        lats, lons = self._trajectory_arrays(
+            start_lat, start_lon, end_lat, end_lon, num_points, path_type
+        )
+        return list(zip(lats.tolist(), lons.tolist()))
+    
+    def _trajectory_arrays(
+        self,
+        start_lat: float,
+        start_lon: float,
+        end_lat: float,
+        end_lon: float,
+        num_points: int,
+        path_type: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate a trajectory between two points as coordinate arrays.
+        
+        Args:
+            start_lat: Starting latitude
+            start_lon: Starting longitude
+            end_lat: Ending latitude
+            end_lon: Ending longitude
+            num_points: Number of points to generate
+            path_type: Type of path ("straight", "curved", or "random")
+            
+        Returns:
+            (latitudes, longitudes) arrays of length ``num_points``
+        """
         if path_type == "straight":
             # Linear interpolation between start and end
-            return [
-                (
-                    start_lat + (end_lat - start_lat) * i / (num_points - 1),
-                    start_lon + (end_lon - start_lon) * i / (num_points - 1)
-                )
-                for i in range(num_points)
-            ]
+            lats = np.linspace(start_lat, end_lat, num_points)
+            lons = np.linspace(start_lon, end_lon, num_points)
         
         elif path_type == "curved":
             # Generate a curved path using a quadratic Bezier curve
@@ -316,26 +449,18 @@ class TrajectorySimulationTool:
             ctrl_lat = mid_lat + perp_lat
             ctrl_lon = mid_lon + perp_lon
             
-            # Generate points using quadratic Bezier curve
-            return [
-                self._quadratic_bezier(
-                    start_lat, start_lon,
-                    ctrl_lat, ctrl_lon,
-                    end_lat, end_lon,
-                    t / (num_points - 1)
-                )
-                for t in range(num_points)
-            ]
+            # Evaluate the quadratic Bezier curve at all parameters at once
+            lats, lons = _bezier(
+                start_lat, start_lon,
+                ctrl_lat, ctrl_lon,
+                end_lat, end_lon,
+                np.linspace(0.0, 1.0, num_points)
+            )
         
         else:  # path_type == "random"
             # Start with a straight line
-            base_path = [
-                (
-                    start_lat + (end_lat - start_lat) * i / (num_points - 1),
-                    start_lon + (end_lon - start_lon) * i / (num_points - 1)
-                )
-                for i in range(num_points)
-            ]
+            lats = np.linspace(start_lat, end_lat, num_points)
+            lons = np.linspace(start_lon, end_lon, num_points)
             
             # Calculate the average distance between points
             total_north, total_east = latlon_to_meters(
@@ -343,59 +468,21 @@ class TrajectorySimulationTool:
             )
             avg_distance = math.sqrt(total_north**2 + total_east**2) / (num_points - 1)
             
-            # Add random perturbations to each point (except start and end)
-            random_path = [base_path[0]]
+            # Random perturbation (up to 10% of average distance) of each
+            # point except start and end
+            max_perturbation = 0.1 * avg_distance
+            distances = _RNG.uniform(0.0, max_perturbation, num_points - 2)
             
-            for i in range(1, num_points - 1):
-                base_lat, base_lon = base_path[i]
-                
-                # Random perturbation (up to 10% of average distance)
-                max_perturbation = 0.1 * avg_distance
-                
-                # Random distance and angle
-                distance = random.uniform(0, max_perturbation)
-                angle = random.uniform(0, 2 * math.pi)
-                
-                # Convert to north/east offsets
-                north_offset = distance * math.cos(angle)
-                east_offset = distance * math.sin(angle)
-                
-                # Convert to lat/lon offsets
-                perturbed_lat, perturbed_lon = meters_to_latlon(
-                    base_lat, base_lon, north_offset, east_offset
-                )
-                
-                random_path.append((perturbed_lat, perturbed_lon))
-            
-            # Add the end point
-            random_path.append(base_path[-1])
-            
-            return random_path
-    
-    def _quadratic_bezier(
-        self,
-        p0_lat: float, p0_lon: float,
-        p1_lat: float, p1_lon: float,
-        p2_lat: float, p2_lon: float,
-        t: float
-    ) -> Tuple[float, float]:
-        """Calculate a point on a quadratic Bezier curve.
-        
-        Args:
-            p0_lat, p0_lon: Start point
-            p1_lat, p1_lon: Control point
-            p2_lat, p2_lon: End point
-            t: Parameter (0 to 1)
+            # Uniformly distributed directions: normalise isotropic Gaussian
+            # pairs instead of evaluating cos/sin of a uniform angle
+            directions = _RNG.standard_normal((2, num_points - 2))
+            scale = distances / np.hypot(directions[0], directions[1])
             
-        Returns:
-            (latitude, longitude) at parameter t
-        """
-        # Quadratic Bezier formula: B(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
-        t2 = t * t
-        mt = 1 - t
-        mt2 = mt * mt
-        
-        lat = mt2 * p0_lat + 2 * mt * t * p1_lat + t2 * p2_lat
-        lon = mt2 * p0_lon + 2 * mt * t * p1_lon + t2 * p2_lon
+            # Convert to north/east offsets, then to lat/lon
+            lats[1:-1], lons[1:-1] = meters_to_latlon(
+                lats[1:-1], lons[1:-1],
+                directions[0] * scale,
+                directions[1] * scale,
+            )
         
-        return (lat, lon)
\ No newline at end of file
+        return lats, lons
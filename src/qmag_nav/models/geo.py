@@ -1,7 +1,9 @@
-"""Geographic data‑structures built on **Pydantic v2** validation.
+"""Geographic value types used throughout the navigation hot path.
 
-All numerical inputs are validated to ensure they are within physically
-plausible ranges:
+These are plain ``@dataclass(slots=True, frozen=True)`` records rather than
+*Pydantic* models: they are created for every sensor sample and filter step,
+so construction cost matters more than rich validation.  Range checks are
+performed manually in ``__post_init__``:
 
 * latitude ∈ [-90, 90]°
 * longitude ∈ [-180, 180]°
@@ -13,14 +15,19 @@ simulations (spherical Earth model).
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Tuple
 
-from qmag_nav._compat import BaseModel
+import numpy as np
 
 EARTH_RADIUS_M: float = 6_371_000.0  # mean Earth radius in metres (IAU 2000)
 
+# Degrees → radians factor; multiplying by it inline avoids a call per angle.
+_RAD: float = math.pi / 180.0
 
-class LatLon(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class LatLon:
     """Latitude / longitude pair in decimal degrees."""
 
     lat: float  # degrees
@@ -28,34 +35,27 @@ class LatLon(BaseModel):
 
     # --------------------------- Validators --------------------------- #
 
-    @staticmethod
-    def _check_lat(lat: float) -> float:  # noqa: D401, ANN001
+    def __post_init__(self) -> None:  # noqa: D401
+        lat = float(self.lat)
+        lon = float(self.lon)
         if not -90.0 <= lat <= 90.0:
             raise ValueError("Latitude must be in [-90, 90]°")
-        return lat
-
-    @staticmethod
-    def _check_lon(lon: float) -> float:  # noqa: D401, ANN001
         if not -180.0 <= lon <= 180.0:
             raise ValueError("Longitude must be in [-180, 180]°")
-        return lon
-
-    # Pydantic v2 field validators
-    def __post_init__(self):  # noqa: D401
-        # Called by dataclass after field assignment (works for both real and
-        # stub Pydantic BaseModel dataclass wrapper).
-        object.__setattr__(self, "lat", self._check_lat(self.lat))
-        object.__setattr__(self, "lon", self._check_lon(self.lon))
+        object.__setattr__(self, "lat", lat)
+        object.__setattr__(self, "lon", lon)
 
     # -------------------------- Convenience --------------------------- #
 
     def to_radians(self) -> Tuple[float, float]:  # noqa: D401
-        return math.radians(self.lat), math.radians(self.lon)
+        return self.lat * _RAD, self.lon * _RAD
 
     def to_ecef(self) -> "ECEF":  # noqa: D401
-        lat_rad, lon_rad = self.to_radians()
-        x = EARTH_RADIUS_M * math.cos(lat_rad) * math.cos(lon_rad)
-        y = EARTH_RADIUS_M * math.cos(lat_rad) * math.sin(lon_rad)
+        lat_rad = self.lat * _RAD
+        lon_rad = self.lon * _RAD
+        r_cos_lat = EARTH_RADIUS_M * math.cos(lat_rad)
+        x = r_cos_lat * math.cos(lon_rad)
+        y = r_cos_lat * math.sin(lon_rad)
         z = EARTH_RADIUS_M * math.sin(lat_rad)
         return ECEF(x=x, y=y, z=z)
 
@@ -68,19 +68,36 @@ class LatLon(BaseModel):
         return cls(lat=lat, lon=lon)
 
     def distance_to(self, other: "LatLon") -> float:  # noqa: D401
-        lat1, lon1 = self.to_radians()
-        lat2, lon2 = other.to_radians()
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return EARTH_RADIUS_M * c
-
-
-class ECEF(BaseModel):
+        lat1 = self.lat * _RAD
+        lat2 = other.lat * _RAD
+        sin_dlat = math.sin((lat2 - lat1) / 2)
+        sin_dlon = math.sin((other.lon - self.lon) * (_RAD / 2))
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+        return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(a, 1.0)))
+
+    @staticmethod
+    def haversine_batch(
+        lat1: float | np.ndarray,
+        lon1: float | np.ndarray,
+        lat2: np.ndarray,
+        lon2: np.ndarray,
+    ) -> np.ndarray:  # noqa: D401
+        """Great‑circle distances in metres between arrays of points (degrees).
+
+        Vectorised counterpart of :meth:`distance_to`; arguments broadcast, so
+        one origin can be compared against many destinations.
+        """
+
+        lat1 = np.radians(lat1)
+        lat2 = np.radians(lat2)
+        sin_dlat = np.sin((lat2 - lat1) / 2)
+        sin_dlon = np.sin(np.radians(np.subtract(lon2, lon1)) / 2)
+        a = sin_dlat * sin_dlat + np.cos(lat1) * np.cos(lat2) * sin_dlon * sin_dlon
+        return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+@dataclass(slots=True, frozen=True)
+class ECEF:
     """Earth‑Centred, Earth‑Fixed coordinates in metres."""
 
     x: float
@@ -88,7 +105,8 @@ class ECEF(BaseModel):
     z: float
 
 
-class MagneticVector(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MagneticVector:
     """Magnetic‑field vector components in nano‑tesla (nT)."""
 
     bx: float
@@ -1,9 +1,16 @@
-"""Sensor specification & calibration parameters using Pydantic."""
+"""Sensor specification (Pydantic) & calibration parameters (dataclass).
+
+:class:`CalibrationParams` is applied to every raw sample, so it is a slotted,
+frozen dataclass rather than a validated *Pydantic* model.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
 from qmag_nav._compat import BaseModel
 
 
@@ -28,11 +35,27 @@ class SensorSpec(BaseModel):
         return values
 
 
-class CalibrationParams(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CalibrationParams:
     """Simple hard/soft‑iron calibration parameters."""
 
     offset: Tuple[float, float, float]
     scale: Tuple[float, float, float]
 
+    def __post_init__(self) -> None:  # noqa: D401
+        offset = tuple(float(v) for v in self.offset)
+        scale = tuple(float(v) for v in self.scale)
+        if len(offset) != 3 or len(scale) != 3:
+            raise ValueError("offset and scale must have three components")
+        object.__setattr__(self, "offset", offset)
+        object.__setattr__(self, "scale", scale)
+
     def apply(self, raw: Tuple[float, float, float]) -> Tuple[float, float, float]:  # noqa: D401
-        return tuple((v - o) * s for v, o, s in zip(raw, self.offset, self.scale))  # type: ignore[misc]
+        o = self.offset
+        s = self.scale
+        return ((raw[0] - o[0]) * s[0], (raw[1] - o[1]) * s[1], (raw[2] - o[2]) * s[2])
+
+    def apply_array(self, raw: np.ndarray) -> np.ndarray:  # noqa: D401
+        """Calibrate an ``(N, 3)`` array of raw samples in one broadcast op."""
+
+        return (np.asarray(raw, dtype=np.float64) - self.offset) * self.scale
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import collections
-from typing import Deque, Iterable, Protocol, Tuple
+from typing import Iterable, Protocol, Tuple
 
+import numpy as np
+
+from qmag_nav import _native
+from qmag_nav._compat import njit
 from qmag_nav.models.sensor import CalibrationParams
 
 
@@ -15,6 +19,53 @@ class _Driver(Protocol):
         """Return a raw magnetic vector in nano‑tesla (Bx, By, Bz)."""
 
 
+class _BatchDriver(_Driver, Protocol):
+    """Driver that can additionally return many samples in one call."""
+
+    def read_many(self, n: int) -> np.ndarray:  # noqa: D401
+        """Return the next ``n`` raw vectors as an ``(n, 3)`` array."""
+
+
+@njit(cache=True, nogil=True)
+def _ma_update(ring, sums, idx, count, bx, by, bz):  # noqa: ANN001, ANN202
+    """Push one sample into the ring buffer and return the updated mean.
+
+    The running per-axis sums are adjusted by the incoming and evicted samples
+    so each update is O(1) regardless of the window length.  Each time the
+    write index wraps the sums are recomputed from the ring, so cancellation
+    error (e.g. from an evicted outlier) lasts at most one window; this keeps
+    the amortised cost O(1).  Returns the new ``(idx, count, bx, by, bz)``.
+    """
+
+    window = ring.shape[1]
+    if count == window:
+        sums[0] -= ring[0, idx]
+        sums[1] -= ring[1, idx]
+        sums[2] -= ring[2, idx]
+    else:
+        count += 1
+    ring[0, idx] = bx
+    ring[1, idx] = by
+    ring[2, idx] = bz
+    sums[0] += bx
+    sums[1] += by
+    sums[2] += bz
+    idx += 1
+    if idx == window:
+        # The ring is full here: every slot holds a sample
+        idx = 0
+        for k in range(3):
+            acc = 0.0
+            for j in range(window):
+                acc += ring[k, j]
+            sums[k] = acc
+    return idx, count, sums[0] / count, sums[1] / count, sums[2] / count
+
+
+# Prefer the precompiled kernel when the AOT extension has been built
+_ma_kernel = _native.load("ma_update", _ma_update)
+
+
 class MovingAverageFilter:
     """A sliding‑window moving average over the incoming sensor stream."""
 
@@ -41,25 +92,57 @@ class MovingAverageFilter:
             raise ValueError("Window size must be > 0")
 
         self.window: int = window
-        self._buf: Deque[Tuple[float, float, float]] = collections.deque(
-            maxlen=window
-        )
+        # Ring buffer of the last ``window`` samples plus their per-axis sums.
+        # Stored axis-major (structure of arrays): row ``k`` holds axis ``k``.
+        self._ring: np.ndarray = np.zeros((3, window))
+        self._sum: np.ndarray = np.zeros(3)
+        self._idx: int = 0  # slot the next sample is written to
+        self._count: int = 0  # number of valid samples in the ring
 
         if initial is not None:
-            # Only the *most recent* ``window`` elements are relevant.
-            for sample in list(initial)[-window:]:
-                self._buf.append(sample)
+            # Only the *most recent* ``window`` elements are relevant; a bounded
+            # deque keeps just that tail without materialising the iterable.
+            for sample in collections.deque(initial, maxlen=window):
+                self.update(sample)
 
     def update(self, sample: Tuple[float, float, float]) -> Tuple[float, float, float]:  # noqa: D401
-        self._buf.append(sample)
-        bx = sum(v[0] for v in self._buf) / len(self._buf)
-        by = sum(v[1] for v in self._buf) / len(self._buf)
-        bz = sum(v[2] for v in self._buf) / len(self._buf)
+        bx, by, bz = sample
+        self._idx, self._count, bx, by, bz = _ma_kernel(
+            self._ring, self._sum, self._idx, self._count,
+            float(bx), float(by), float(bz),
+        )
         return (bx, by, bz)
 
+    def update_batch(self, samples: np.ndarray) -> np.ndarray:  # noqa: D401
+        """Filter an ``(n, 3)`` array of samples in one pass.
+
+        Equivalent to calling :meth:`update` on every row in turn: the current
+        buffer contents seed the window, and the filter afterwards holds the
+        most recent ``window`` samples.
+        """
+
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1, 3)
+        history = np.asarray(self.snapshot(), dtype=np.float64).reshape(-1, 3)
+        stream = np.concatenate((history, samples))
+
+        # Window means from differences of the cumulative sum
+        csum = np.zeros((len(stream) + 1, 3))
+        np.cumsum(stream, axis=0, out=csum[1:])
+        end = np.arange(len(history) + 1, len(stream) + 1)
+        start = np.maximum(end - self.window, 0)
+        means = (csum[end] - csum[start]) / (end - start)[:, None]
+
+        # Carry the tail of the stream over so that update() continues from it
+        tail = stream[-self.window:]
+        self._count = len(tail)
+        self._idx = self._count % self.window
+        self._ring[:, : self._count] = tail.T
+        self._sum[:] = tail.sum(axis=0)
+        return means
+
     @property
     def buffer(self) -> Iterable[Tuple[float, float, float]]:  # noqa: D401
-        return tuple(self._buf)
+        return tuple(self.snapshot())
 
     # ------------------------------------------------------------------
     # (De)serialisation helpers – aid hot‑restart persistence
@@ -68,7 +151,12 @@ class MovingAverageFilter:
     def snapshot(self) -> list[Tuple[float, float, float]]:  # noqa: D401
         """Return a *copy* of the internal buffer suitable for persistence."""
 
-        return list(self._buf)
+        # Oldest sample first: the ring wraps around at ``_idx`` once full.
+        if self._count < self.window:
+            ordered = self._ring[:, : self._count]
+        else:
+            ordered = np.roll(self._ring, -self._idx, axis=1)
+        return [tuple(sample) for sample in ordered.T.tolist()]
 
     @classmethod
     def from_snapshot(cls, window: int, state: Iterable[Tuple[float, float, float]]):  # noqa: D401
@@ -82,11 +170,11 @@ class Magnetometer:
 
     def __init__(
         self,
-        driver: _Driver,
+        driver: _Driver | _BatchDriver,
         calibration: CalibrationParams | None = None,
         filter_window: int = 1,
     ) -> None:
-        self._driver: _Driver = driver
+        self._driver: _Driver | _BatchDriver = driver
         self._cal: CalibrationParams | None = calibration
         self._filter = MovingAverageFilter(filter_window)
 
@@ -101,3 +189,20 @@ class Magnetometer:
         if self._cal is not None:
             raw = self._cal.apply(raw)
         return self._filter.update(raw)
+
+    def read_batch(self, n: int) -> np.ndarray:  # noqa: D401
+        """Return ``n`` calibrated / smoothed vectors as an ``(n, 3)`` array.
+
+        Equivalent to calling :meth:`read` ``n`` times, but calibration and
+        filtering run as array operations.  Drivers providing ``read_many``
+        are asked for all raw samples at once.
+        """
+
+        if hasattr(self._driver, "read_many"):
+            raw = np.asarray(self._driver.read_many(n), dtype=np.float64)
+        else:
+            raw = np.array([self._driver.read() for _ in range(n)], dtype=np.float64)
+        raw = raw.reshape(n, 3)
+        if self._cal is not None:
+            raw = self._cal.apply_array(raw)
+        return self._filter.update_batch(raw)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
+import numpy as np
+
 
 class MockSensorDriver:
     """Return pre‑programmed magnetic vectors in sequence, cycling forever."""
@@ -12,9 +14,18 @@ class MockSensorDriver:
         if not samples:
             raise ValueError("At least one sample required")
         self._samples: List[Tuple[float, float, float]] = samples
+        self._samples_arr: np.ndarray = np.asarray(samples, dtype=np.float64)
         self._idx: int = 0
 
     def read(self) -> Tuple[float, float, float]:  # noqa: D401
         sample = self._samples[self._idx]
         self._idx = (self._idx + 1) % len(self._samples)
         return sample
+
+    def read_many(self, n: int) -> np.ndarray:  # noqa: D401
+        """Return the next ``n`` samples of the cycle as an ``(n, 3)`` array."""
+
+        count = len(self._samples)
+        idx = (np.arange(n) + self._idx) % count
+        self._idx = (self._idx + n) % count
+        return np.take(self._samples_arr, idx, axis=0)
@@ -7,14 +7,18 @@ health checks and position estimation.
 
 from __future__ import annotations
 
+import os
 import time
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Any, List, Optional
 
+import numpy as np
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
-from qmag_nav._compat import BaseModel
+from qmag_nav._compat import BaseModel, njit
 from qmag_nav.filter.ekf import NavEKF
 from qmag_nav.models.geo import LatLon
 
@@ -32,10 +36,29 @@ class EstimateResponse(BaseModel):
     quality: float = 1.0  # Default quality indicator
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Signal readiness by touching ``$QMAG_READY_FILE`` once startup completes.
+    
+    Lets supervisors and tests wait on a file instead of polling the port.
+    The file is removed again on shutdown.  Nothing is written when the
+    variable is unset.
+    """
+    ready_file = os.environ.get("QMAG_READY_FILE")
+    if ready_file:
+        Path(ready_file).touch()
+    try:
+        yield
+    finally:
+        if ready_file:
+            Path(ready_file).unlink(missing_ok=True)
+
+
 app = FastAPI(
     title="Quantum Magnetic Navigation API",
     description="API for quantum magnetic navigation position estimation",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -60,44 +83,85 @@ def _get_filter() -> NavEKF:  # noqa: D401
     return _ekf
 
 
+@njit(cache=True)
+def _placeholder_field(lat: float, lon: float) -> float:
+    """Stand-in magnetic field (``lat + lon``) until a map is wired in.
+    
+    Compiled so that :meth:`NavEKF.step_batch` keeps batches in its kernel.
+    """
+    return lat + lon
+
+
+def _estimate_step(ekf: NavEKF, lat: float, lon: float) -> Dict[str, float]:
+    """Run one predict/update cycle for an observation and return the estimate."""
+    ekf.predict(dt=1.0)  # Use a default time step of 1 second
+    ekf.update(_placeholder_field(lat, lon), _placeholder_field)
+    est = ekf.estimate()
+    
+    # Calculate a simple quality metric (could be enhanced with actual uncertainty)
+    quality = 1.0
+    
+    return {"lat": est.lat, "lon": est.lon, "quality": quality}
+
+
+def _estimate_batch(ekf: NavEKF, lats: np.ndarray, lons: np.ndarray) -> List[Dict[str, float]]:
+    """Run :func:`_estimate_step` for each observation in one ``step_batch`` call."""
+    zs = lats + lons  # _placeholder_field, vectorised
+    states = ekf.step_batch(np.ones_like(zs), zs, _placeholder_field)
+    return [
+        {"lat": lat, "lon": lon, "quality": 1.0}
+        for lat, lon in states[:, :2].tolist()
+    ]
+
+
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next) -> Response:
     """Add processing time to response headers."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
 
 @app.get("/healthz", tags=["System"])
-def healthz() -> Dict[str, str]:  # noqa: D401
+async def healthz() -> Dict[str, str]:  # noqa: D401
     """Health check endpoint."""
     return {"status": "ok"}
 
 
 @app.post("/estimate", response_model=EstimateResponse, tags=["Navigation"])
-def estimate(payload: EstimateRequest) -> Dict[str, float]:  # noqa: D401
+async def estimate(payload: EstimateRequest) -> Dict[str, float]:  # noqa: D401
     """Update EKF with a new magnetic-based observation and return state.
     
+    The update takes microseconds, so it runs on the event loop rather than
+    FastAPI's thread pool, which also serialises access to the shared filter.
+    
     Args:
         payload: The request payload containing latitude and longitude
         
     Returns:
         A dictionary with the estimated position and quality indicator
     """
-    lat = float(payload.lat)
-    lon = float(payload.lon)
+    return _estimate_step(_get_filter(), float(payload.lat), float(payload.lon))
+
+
+@app.post("/estimate_batch", response_model=List[EstimateResponse], tags=["Navigation"])
+async def estimate_batch(payload: List[EstimateRequest]) -> List[Dict[str, float]]:  # noqa: D401
+    """Apply a sequence of observations in order and return each estimate.
     
-    ekf = _get_filter()
-    ekf.predict()
-    ekf.update(LatLon(lat, lon))
-    est = ekf.estimate()
+    Equivalent to posting each observation to ``/estimate`` in turn, but
+    the whole trajectory is parsed and answered in one request.
     
-    # Calculate a simple quality metric (could be enhanced with actual uncertainty)
-    quality = 1.0
-    
-    return {"lat": est.lat, "lon": est.lon, "quality": quality}
+    Args:
+        payload: The observations, oldest first
+        
+    Returns:
+        One estimate per observation, as returned by ``/estimate``
+    """
+    lats = np.fromiter((p.lat for p in payload), dtype=np.float64, count=len(payload))
+    lons = np.fromiter((p.lon for p in payload), dtype=np.float64, count=len(payload))
+    return _estimate_batch(_get_filter(), lats, lons)
 
 
 # Customize OpenAPI schema
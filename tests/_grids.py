@@ -0,0 +1,17 @@
+"""Grid builders shared by the test modules.
+
+``pythonpath = ["tests"]`` in ``pyproject.toml`` makes this importable as
+``_grids`` under every pytest import mode.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def ramp_grid(rows: int, cols: int) -> np.ndarray:
+    """Return a float64 test grid with value ``row * 10 + col``."""
+
+    row = np.arange(rows, dtype=np.float64)
+    col = np.arange(cols, dtype=np.float64)
+    return row[:, None] * 10.0 + col
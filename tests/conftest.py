@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import pathlib
 import sys
 
+import pytest
+
 
 # Ensure the *src* directory is importable regardless of how the repository is
 # laid out in the test environment.
@@ -12,5 +16,113 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 # The source tree lives in ``quantum-magnetic-navigation/src`` relative to the
 # project root.
 SRC = ROOT / "src"
-if SRC.exists():
-    sys.path.insert(0, str(SRC))
+try:
+    # Already importable (e.g. an editable install): leave sys.path alone
+    import qmag_nav  # noqa: F401
+except ImportError:
+    if SRC.exists():
+        sys.path.insert(0, str(SRC))
+        importlib.invalidate_caches()
+
+# Helper scripts next to the fixture files are run by hand, never collected
+collect_ignore_glob = ["data/*.py"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    run_slow = config.getoption("--runslow")
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run")
+    # Under ``pytest -n auto --dist loadgroup`` the timing-sensitive tests
+    # all land on one worker, so they never compete with each other
+    serial_group = pytest.mark.xdist_group("serial")
+    for item in items:
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+        if "serial" in item.keywords:
+            item.add_marker(serial_group)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_interp_kernels():
+    """Compile the interpolation kernels once, outside any single test's timing."""
+
+    import numpy as np
+
+    from qmag_nav.mapping._interp_nb import (
+        _bicubic_geo_nb,
+        _bicubic_nb,
+        _bilinear_geo_nb,
+        _bilinear_nb,
+    )
+
+    grid = np.zeros((2, 2))
+    _bilinear_nb(grid, 0.5, 0.5)
+    _bicubic_nb(grid, 0.5, 0.5)
+    _bilinear_geo_nb(grid, 0.5, 0.5, 0.0, 0.0, 1.0, 1.0)
+    _bicubic_geo_nb(grid, 0.5, 0.5, 0.0, 0.0, 1.0, 1.0)
+
+
+@functools.lru_cache(maxsize=1)
+def _pyproject_text() -> str:
+    return (ROOT / "pyproject.toml").read_text()
+
+
+@pytest.fixture(scope="session")
+def pyproject_text():
+    """Contents of the project's ``pyproject.toml``, read once per session."""
+
+    return _pyproject_text()
+
+
+def _load_build_test_grid():
+    """Import ``build_test_grid`` from ``tests/data/create_test_data.py``."""
+
+    path = pathlib.Path(__file__).parent / "data" / "create_test_data.py"
+    spec = importlib.util.spec_from_file_location("_qmag_create_test_data", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module.build_test_grid
+
+
+@pytest.fixture(scope="session")
+def test_grid_paths(tmp_path_factory):
+    """Paths of the 5x5 test grid files, written once per session."""
+
+    return _load_build_test_grid()(tmp_path_factory.mktemp("grid"))
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """One started client for the FastAPI app, shared by all tests.
+
+    The OpenAPI schema is built once up front, so no single test pays for
+    the first-request schema generation.
+    """
+
+    from fastapi.testclient import TestClient
+
+    from qmag_nav.service import api
+
+    with TestClient(api.app) as client:
+        client.get("/openapi.json")
+        yield client
+
+
+@pytest.fixture
+def reset_api_ekf():
+    """Start a test with a fresh EKF in the API, and leave none behind.
+
+    Building a filter takes microseconds, so this is cheaper than keeping a
+    warmed-up one and restoring its state between tests.
+    """
+
+    from qmag_nav.service import api
+
+    api._ekf = None
+    yield
+    api._ekf = None
@@ -1,68 +1,122 @@
-"""Script to create test data files for mapping tests."""
+"""Script to create test data files for mapping tests.
 
-import numpy as np
-import rasterio
-import xarray as xr
+Run it directly to regenerate the files in this directory; the test-suite
+calls :func:`build_test_grid` once per session through the
+``test_grid_paths`` fixture in ``tests/conftest.py``.
+"""
+
+import json
 from pathlib import Path
-from rasterio.transform import Affine
+
+import numpy as np
 
 # Define the output directory
 DATA_DIR = Path(__file__).parent
 
-# Create a simple 5x5 grid with value = row*10 + col
-grid_data = np.array([[r * 10 + c for c in range(5)] for r in range(5)])
-lats = np.linspace(0, 4, 5)
-lons = np.linspace(0, 4, 5)
-
-# Create GeoTIFF file
-geotiff_path = DATA_DIR / "5x5_grid.tif"
-transform = Affine.translation(0, 4) * Affine.scale(1, -1)
-with rasterio.open(
-    geotiff_path,
-    'w',
-    driver='GTiff',
-    height=5,
-    width=5,
-    count=1,
-    dtype=grid_data.dtype,
-    crs='+proj=latlong',
-    transform=transform,
-) as dst:
-    dst.write(grid_data, 1)
-    dst.update_tags(title="Test Map", source="Test", resolution_m="100.0")
-print(f"Created GeoTIFF file: {geotiff_path}")
-
-# Create NetCDF file
-netcdf_path = DATA_DIR / "5x5_grid.nc"
-ds = xr.Dataset(
-    data_vars={
-        "magnetic_anomaly": (["latitude", "longitude"], grid_data),
-    },
-    coords={
-        "latitude": lats,
-        "longitude": lons,
-    },
-    attrs={
-        "title": "Test Map",
-        "source": "Test",
-        "resolution_m": 100.0,
-    },
-)
-ds.to_netcdf(netcdf_path)
-print(f"Created NetCDF file: {netcdf_path}")
-
-# Create a JSON file with expected interpolation values
-import json
 
-# Generate some test points and their expected interpolated values
-test_points = [
-    {"lat": 0.0, "lon": 0.0, "expected": 0.0},  # Exact corner
-    {"lat": 4.0, "lon": 4.0, "expected": 44.0},  # Exact corner
-    {"lat": 2.0, "lon": 3.0, "expected": 23.0},  # Exact grid point
-    {"lat": 0.5, "lon": 0.5, "expected": 5.5},   # Between points
-    {"lat": 2.5, "lon": 3.5, "expected": 28.5},  # Between points
-]
-
-with open(DATA_DIR / "interpolation_values.json", "w") as f:
-    json.dump(test_points, f, indent=2)
-print(f"Created JSON file with expected interpolation values")
\ No newline at end of file
+def build_test_grid(out_dir: Path, verbose: bool = False) -> dict[str, Path]:
+    """Write the 5x5 test grid as GeoTIFF, NetCDF and expected-values JSON.
+
+    Returns a mapping of ``"geotiff"``, ``"netcdf"``, ``"json"`` (and
+    ``"zarr"`` when zarr is installed) to the written paths.
+    """
+    # Imported here so that loading this module stays cheap
+    import rasterio
+    import xarray as xr
+    from rasterio.enums import Resampling
+    from rasterio.transform import Affine
+
+    out_dir = Path(out_dir)
+    paths: dict[str, Path] = {}
+
+    def report(message: str) -> None:
+        if verbose:
+            print(message)
+
+    # Create a simple 5x5 grid with value = row*10 + col
+    grid_data = np.array([[r * 10 + c for c in range(5)] for r in range(5)])
+    lats = np.linspace(0, 4, 5)
+    lons = np.linspace(0, 4, 5)
+
+    # Create GeoTIFF file (tiled, compressed, with overviews as in a COG)
+    geotiff_path = out_dir / "5x5_grid.tif"
+    transform = Affine.translation(0, 4) * Affine.scale(1, -1)
+    with rasterio.open(
+        geotiff_path,
+        'w',
+        driver='GTiff',
+        height=5,
+        width=5,
+        count=1,
+        dtype=grid_data.dtype,
+        crs='+proj=latlong',
+        transform=transform,
+        tiled=True,
+        blockxsize=256,
+        blockysize=256,
+        compress='deflate',
+        predictor=2,
+    ) as dst:
+        dst.write(grid_data, 1)
+        dst.build_overviews([2, 4, 8], Resampling.average)
+        dst.update_tags(ns='rio_overview', resampling='average')
+        dst.update_tags(title="Test Map", source="Test", resolution_m="100.0")
+    paths["geotiff"] = geotiff_path
+    report(f"Created GeoTIFF file: {geotiff_path}")
+
+    # Create NetCDF file
+    netcdf_path = out_dir / "5x5_grid.nc"
+    ds = xr.Dataset(
+        data_vars={
+            "magnetic_anomaly": (["latitude", "longitude"], grid_data),
+        },
+        coords={
+            "latitude": lats,
+            "longitude": lons,
+        },
+        attrs={
+            "title": "Test Map",
+            "source": "Test",
+            "resolution_m": 100.0,
+        },
+    )
+    # HDF5 chunks may not exceed the fixed dimension sizes
+    chunksizes = tuple(min(256, n) for n in grid_data.shape)
+    ds.to_netcdf(
+        netcdf_path,
+        encoding={"magnetic_anomaly": {"chunksizes": chunksizes, "zlib": True, "complevel": 4}},
+    )
+    paths["netcdf"] = netcdf_path
+    report(f"Created NetCDF file: {netcdf_path}")
+
+    # Create a chunked Zarr store alongside, when zarr is installed
+    try:
+        import zarr  # noqa: F401
+    except ImportError:
+        report("zarr not installed, skipping Zarr store")
+    else:
+        zarr_path = out_dir / "5x5_grid.zarr"
+        ds.to_zarr(zarr_path, mode="w", encoding={"magnetic_anomaly": {"chunks": (256, 256)}})
+        paths["zarr"] = zarr_path
+        report(f"Created Zarr store: {zarr_path}")
+
+    # Generate some test points and their expected interpolated values
+    test_points = [
+        {"lat": 0.0, "lon": 0.0, "expected": 0.0},  # Exact corner
+        {"lat": 4.0, "lon": 4.0, "expected": 44.0},  # Exact corner
+        {"lat": 2.0, "lon": 3.0, "expected": 23.0},  # Exact grid point
+        {"lat": 0.5, "lon": 0.5, "expected": 5.5},   # Between points
+        {"lat": 2.5, "lon": 3.5, "expected": 28.5},  # Between points
+    ]
+
+    json_path = out_dir / "interpolation_values.json"
+    with open(json_path, "w") as f:
+        json.dump(test_points, f, indent=2)
+    paths["json"] = json_path
+    report("Created JSON file with expected interpolation values")
+
+    return paths
+
+
+if __name__ == "__main__":
+    build_test_grid(DATA_DIR, verbose=True)
@@ -1,27 +1,42 @@
 """Script to inspect the GeoTIFF file."""
 
-import rasterio
-import numpy as np
 from pathlib import Path
 
-# Path to the GeoTIFF file
-geotiff_path = Path(__file__).parent / "5x5_grid.tif"
 
-# Open the GeoTIFF file
-with rasterio.open(geotiff_path) as ds:
-    # Print basic information
-    print(f"Bounds: {ds.bounds}")
-    print(f"Transform: {ds.transform}")
-    print(f"CRS: {ds.crs}")
-    
-    # Read the data
-    data = ds.read(1)
-    print(f"Data shape: {data.shape}")
-    print("Data values:")
-    print(data)
-    
-    # Test some interpolation points
-    for lat, lon in [(0.0, 0.0), (4.0, 4.0), (2.0, 3.0)]:
-        # Convert lat/lon to pixel coordinates
-        row, col = rasterio.transform.rowcol(ds.transform, lon, lat)
-        print(f"Lat: {lat}, Lon: {lon} -> Row: {row}, Col: {col}, Value: {data[row, col] if 0 <= row < data.shape[0] and 0 <= col < data.shape[1] else 'out of bounds'}")
\ No newline at end of file
+def main() -> None:
+    import numpy as np
+    import rasterio
+
+    # Path to the GeoTIFF file
+    geotiff_path = Path(__file__).parent / "5x5_grid.tif"
+
+    # Open the GeoTIFF file
+    with rasterio.open(geotiff_path) as ds:
+        # Print basic information
+        print(f"Bounds: {ds.bounds}")
+        print(f"Transform: {ds.transform}")
+        print(f"CRS: {ds.crs}")
+        
+        # Read the data
+        data = ds.read(1)
+        print(f"Data shape: {data.shape}")
+        print("Data values:")
+        print(data)
+        
+        # Test some interpolation points
+        points = np.array([(0.0, 0.0), (4.0, 4.0), (2.0, 3.0)])
+        lats, lons = points[:, 0], points[:, 1]
+        
+        # Convert all lat/lon pairs to pixel coordinates at once through the
+        # inverse affine (same flooring as rasterio.transform.rowcol)
+        inv = ~ds.transform
+        cols = np.floor(inv.a * lons + inv.b * lats + inv.c).astype(int)
+        rows = np.floor(inv.d * lons + inv.e * lats + inv.f).astype(int)
+        inside = (rows >= 0) & (rows < data.shape[0]) & (cols >= 0) & (cols < data.shape[1])
+        
+        for lat, lon, row, col, ok in zip(lats, lons, rows, cols, inside):
+            print(f"Lat: {lat}, Lon: {lon} -> Row: {row}, Col: {col}, Value: {data[row, col] if ok else 'out of bounds'}")
+
+
+if __name__ == "__main__":
+    main()
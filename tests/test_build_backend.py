@@ -1,10 +1,17 @@
 import unittest
 import importlib
+import importlib.metadata
 import subprocess
 import sys
 import os
 
+import pytest
+
 class TestBuildBackend(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _pyproject(self, pyproject_text):
+        self.pyproject_text = pyproject_text
+
     def test_hatchling_build_module(self):
         """Test that the hatchling.build module exists and can be imported."""
         try:
@@ -23,8 +30,7 @@ class TestBuildBackend(unittest.TestCase):
     
     def test_pyproject_toml_content(self):
         """Test that pyproject.toml has the correct build backend."""
-        with open("pyproject.toml", "r") as f:
-            content = f.read()
+        content = self.pyproject_text
         
         self.assertIn('build-backend = "hatchling.build"', content, 
                      "pyproject.toml should specify 'hatchling.build' as the build backend")
@@ -32,26 +38,28 @@ class TestBuildBackend(unittest.TestCase):
                         "pyproject.toml should not specify 'hatchling.build_backend'")
     
     def test_editable_install(self):
-        """Test that the package can be installed in editable mode."""
-        # Check if hatchling supports editable installs
-        try:
-            import hatchling
-            import hatchling.build
-            # We don't need to directly access the hook, just verify the module exists
-            self.assertTrue(hasattr(hatchling.build, "__file__"),
-                           "hatchling.build module exists")
-            
-            # Check if pip can install the package in editable mode
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-e", ".", "--dry-run"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            self.assertEqual(result.returncode, 0,
-                            f"Dry run of editable install failed: {result.stderr}")
-        except Exception as e:
-            self.fail(f"Failed to verify editable install capability: {e}")
+        """Test that the installed hatchling supports editable installs (PEP 660)."""
+        import hatchling.build
+
+        # PEP 660 editable builds were added in hatchling 1.12
+        version = importlib.metadata.version("hatchling")
+        major, minor = (int(part) for part in version.split(".")[:2])
+        self.assertGreaterEqual((major, minor), (1, 12),
+                                f"hatchling {version} predates editable install support")
+        self.assertTrue(callable(getattr(hatchling.build, "build_editable", None)),
+                        "hatchling.build should provide the build_editable hook")
+
+    @pytest.mark.slow
+    def test_editable_install_dry_run(self):
+        """Test that pip can resolve an editable install of the package."""
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "-e", ".", "--dry-run"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        self.assertEqual(result.returncode, 0,
+                        f"Dry run of editable install failed: {result.stderr}")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -4,7 +4,13 @@ import subprocess
 import sys
 import importlib.util
 
+import pytest
+
 class TestBuildSystem(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _pyproject(self, pyproject_text):
+        self.pyproject_text = pyproject_text
+
     def test_hatchling_installed(self):
         """Test that hatchling is installed and can be imported."""
         try:
@@ -25,8 +31,7 @@ class TestBuildSystem(unittest.TestCase):
     
     def test_pyproject_toml_content(self):
         """Test that pyproject.toml has the correct build backend."""
-        with open("pyproject.toml", "r") as f:
-            content = f.read()
+        content = self.pyproject_text
         
         self.assertIn('build-backend = "hatchling.build"', content, 
                      "pyproject.toml should specify 'hatchling.build' as the build backend")
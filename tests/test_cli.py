@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import json
 import os
+import random
 import subprocess
 import sys
 import tempfile
-from io import StringIO
 from pathlib import Path
 
 import pytest
@@ -13,38 +13,42 @@ import pytest
 from qmag_nav import cli
 
 
-def test_simulate_default_steps(monkeypatch):
-    # Capture stdout
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
+@pytest.fixture(autouse=True)
+def state_file(tmp_path, monkeypatch):
+    """Keep the persisted ``estimate`` state out of the user's cache."""
+    path = tmp_path / "state.npz"
+    monkeypatch.setenv("QMAG_NAV_STATE", str(path))
+    return path
 
+
+@pytest.fixture
+def reset_ekf():
+    """Start from a fresh ``estimate`` EKF."""
+    cli._reset_state()
+
+
+def test_simulate_default_steps(capsys):
     cli.main(["simulate"])
 
-    data = json.loads(buffer.getvalue())
+    data = json.loads(capsys.readouterr().out)
     # Default steps=10
     assert isinstance(data, list) and len(data) == 10
     for item in data:
         assert {"lat", "lon"}.issubset(item.keys())
 
 
-def test_estimate_updates(monkeypatch):
+def test_estimate_updates(capsys, reset_ekf):
     # First call with lat=1, lon=1 – estimate should move towards 1,1 from 0,0
-    from qmag_nav import cli  # local import to reset singleton between test runs
-
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
     cli.main(["estimate", "--lat", "1", "--lon", "1"])
-    first_est = json.loads(buffer.getvalue())
+    first_est = json.loads(capsys.readouterr().out)
     assert first_est["lat"] > 0 and first_est["lon"] > 0
     assert "measurement" in first_est
     assert first_est["measurement"]["lat"] == 1
     assert first_est["measurement"]["lon"] == 1
 
     # Second call with lat=2,lon=2 – estimate should increase further
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
     cli.main(["estimate", "--lat", "2", "--lon", "2"])
-    second_est = json.loads(buffer.getvalue())
+    second_est = json.loads(capsys.readouterr().out)
     assert second_est["lat"] > first_est["lat"]
     assert second_est["lon"] > first_est["lon"]
     assert second_est["measurement"]["lat"] == 2
@@ -52,14 +56,30 @@ def test_estimate_updates(monkeypatch):
 
 
 @pytest.mark.parametrize("steps", [1, 5, 13])
-def test_simulate_steps_option(monkeypatch, steps):
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
+def test_simulate_steps_option(capsys, steps):
     cli.main(["simulate", "--steps", str(steps)])
-    data = json.loads(buffer.getvalue())
+    data = json.loads(capsys.readouterr().out)
     assert len(data) == steps
 
 
+def test_simulate_ndjson(capsys):
+    cli.main(["simulate", "--steps", "4", "--ndjson"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4
+    for line in lines:
+        assert {"lat", "lon"}.issubset(json.loads(line).keys())
+
+
+def test_simulate_json_round_trips_floats_exactly(capsys):
+    """The JSON output carries every float64 bit, so no binary format is needed."""
+    random.seed(1234)
+    cli.main(["simulate", "--steps", "20"])
+    data = json.loads(capsys.readouterr().out)
+
+    random.seed(1234)
+    assert data == list(cli._simulate_positions(20))
+
+
 def test_simulate_output_to_file():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
         try:
@@ -78,18 +98,16 @@ def test_simulate_output_to_file():
                 os.unlink(tmp.name)
 
 
-def test_estimate_reset_option(monkeypatch):
-    # First call to establish a baseline
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
+def test_estimate_reset_option(capsys, reset_ekf):
+    # Two calls to establish a baseline that has moved towards 1,1
+    cli.main(["estimate", "--lat", "1", "--lon", "1"])
+    capsys.readouterr()
     cli.main(["estimate", "--lat", "1", "--lon", "1"])
-    first_est = json.loads(buffer.getvalue())
+    first_est = json.loads(capsys.readouterr().out)
     
     # Second call with reset flag should start fresh
-    buffer = StringIO()
-    monkeypatch.setattr(sys, "stdout", buffer)
     cli.main(["estimate", "--lat", "1", "--lon", "1", "--reset"])
-    reset_est = json.loads(buffer.getvalue())
+    reset_est = json.loads(capsys.readouterr().out)
     
     # The reset estimate should be closer to 0,0 than the first estimate
     # because it's starting from scratch
@@ -97,6 +115,26 @@ def test_estimate_reset_option(monkeypatch):
     assert reset_est["lon"] < first_est["lon"]
 
 
+def test_estimate_state_persists_across_processes(state_file):
+    """A fresh process continues from the state saved by the previous one."""
+    env = dict(os.environ, QMAG_NAV_STATE=str(state_file))
+
+    def run(*args):
+        result = subprocess.run(
+            [sys.executable, "-m", "qmag_nav.cli", "estimate", *args],
+            capture_output=True, text=True, check=True, env=env,
+        )
+        return json.loads(result.stdout)
+
+    first = run("--lat", "1", "--lon", "1")
+    assert state_file.exists()
+    second = run("--lat", "1", "--lon", "1")
+    assert second["lat"] > first["lat"]
+
+    # --reset ignores the saved state
+    assert run("--lat", "1", "--lon", "1", "--reset")["lat"] == first["lat"]
+
+
 @pytest.mark.integration
 def test_cli_subprocess():
     """Test the CLI using subprocess to ensure it works as an actual command."""
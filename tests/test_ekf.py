@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 from typing import Callable, Tuple
 
+import numpy as np
 import pytest
 
 from qmag_nav.filter.ekf import NavEKF
@@ -12,10 +13,12 @@ from qmag_nav.filter.utils import (
     create_identity_matrix,
     latlon_to_meters,
     matrix_add,
+    matrix_inverse_3x3_spd,
     matrix_inverse_4x4,
     matrix_multiply,
     matrix_subtract,
     matrix_transpose,
+    measurement_jacobian,
     meters_to_latlon,
     numerical_jacobian,
     process_noise_matrix,
@@ -66,6 +69,38 @@ def test_ekf_multiple_updates_reach_measurement():
     assert abs(est.lat + est.lon - target_mag) < 1e-3
 
 
+@pytest.mark.parametrize("compiled", [True, False])
+def test_step_batch_matches_predict_update_loop(compiled):
+    """Test that one batch call reproduces the per-step predict/update loop."""
+    from qmag_nav._compat import njit
+
+    def mag_func(lat, lon):
+        return lat * lat + 2.0 * lon + lat * lon
+
+    batch_func = njit(mag_func) if compiled else mag_func
+    dts = np.full(20, 0.1)
+    zs = np.linspace(0.5, 1.5, 20)
+
+    loop = NavEKF(initial=LatLon(lat=0.3, lon=0.2), initial_velocity=(0.01, 0.02))
+    expected = []
+    for dt, z in zip(dts, zs):
+        loop.predict(dt=dt)
+        loop.update(z, mag_func)
+        expected.append(loop.state.copy())
+
+    batch = NavEKF(initial=LatLon(lat=0.3, lon=0.2), initial_velocity=(0.01, 0.02))
+    states = batch.step_batch(dts, zs, batch_func)
+
+    # Under fastmath the compiled field may round differently in the last
+    # bit, which the 1e-6 forward difference in H amplifies a millionfold.
+    # The interpreted batch is compared with predict/update kernels that may
+    # be JIT- or AOT-compiled, so it too differs beyond rounding.
+    rtol = 1e-6 if compiled else 1e-8
+    assert states.shape == (20, 4)
+    np.testing.assert_allclose(states, expected, rtol=rtol, atol=1e-12)
+    np.testing.assert_allclose(batch.P, loop.P, rtol=rtol, atol=1e-12)
+
+
 def test_ekf_with_velocity():
     """Test EKF with velocity components in state vector."""
     # Initialize with non-zero velocity
@@ -131,6 +166,45 @@ def test_ekf_vector_update():
     assert abs(est.lon - target.lon) < abs(20 - target.lon)
 
 
+def test_ekf_vector_update_accepts_tuples():
+    """Test that plain (bx, by, bz) tuples give the same update as models."""
+    models = NavEKF(initial=LatLon(lat=10, lon=20))
+    tuples = NavEKF(initial=LatLon(lat=10, lon=20))
+
+    models.update_vector(
+        MagneticVector(bx=11, by=21, bz=32),
+        lambda lat, lon: MagneticVector(bx=lat, by=lon, bz=lat + lon),
+    )
+    tuples.update_vector((11, 21, 32), lambda lat, lon: (lat, lon, lat + lon))
+
+    assert tuples.state.tolist() == models.state.tolist()
+    assert tuples.P.tolist() == models.P.tolist()
+
+
+def test_ekf_vector_update_matches_matrix_form():
+    """Test that the three components are fused in one Kalman update."""
+    ekf = NavEKF(initial=LatLon(lat=10, lon=20), initial_velocity=(0.1, -0.2))
+    ekf.predict(dt=1.0)
+    x0, P0 = ekf.state.copy(), ekf.P.copy()
+
+    def mag_vector_func(lat, lon):
+        return (lat, lon, lat + lon)
+
+    ekf.update_vector((11.0, 21.0, 32.0), mag_vector_func, measurement_noise=0.05)
+
+    # Reference: x += K*y and P = (I - K*H)*P with K = P*H^T*S^-1
+    row = measurement_jacobian(x0, lambda lat, lon: math.sqrt(
+        lat * lat + lon * lon + (lat + lon) ** 2
+    ))
+    H = np.repeat(row, 3, axis=0)
+    S = H @ P0 @ H.T + 0.05 * np.eye(3)
+    K = P0 @ H.T @ np.linalg.inv(S)
+    y = np.array([11.0, 21.0, 32.0]) - np.array(mag_vector_func(x0[0], x0[1]))
+
+    np.testing.assert_allclose(ekf.state, x0 + K @ y, rtol=1e-9)
+    np.testing.assert_allclose(ekf.P, (np.eye(4) - K @ H) @ P0, rtol=1e-9, atol=1e-12)
+
+
 def test_ekf_uncertainty_propagation():
     """Test that uncertainty increases during prediction and decreases during update."""
     ekf = NavEKF(initial=LatLon(lat=10, lon=20))
@@ -181,17 +255,34 @@ def test_ekf_reset_covariance():
     assert abs(vel_unc[1] - math.sqrt(vel_var)) < 1e-6
 
 
+def test_ekf_reset_to():
+    """Test resetting the filter in place to a new position."""
+    ekf = NavEKF(initial=LatLon(lat=10, lon=20), initial_velocity=(0.1, 0.2))
+    
+    # Move the filter away from its initial state
+    ekf.predict(dt=1.0)
+    ekf.update(31.0, lambda lat, lon: lat + lon)
+    
+    ekf.reset_to(5.0, 6.0)
+    
+    # New position with zero velocity
+    assert ekf.state.tolist() == [5.0, 6.0, 0.0, 0.0]
+    
+    # Covariance matches a freshly constructed filter
+    assert ekf.P.tolist() == NavEKF(initial=LatLon(lat=5, lon=6)).P.tolist()
+
+
 # Tests for utility functions
 
 def test_create_identity_matrix():
     """Test creating identity matrices of different sizes."""
     # 2x2 identity
     I2 = create_identity_matrix(2)
-    assert I2 == [[1.0, 0.0], [0.0, 1.0]]
+    assert I2.tolist() == [[1.0, 0.0], [0.0, 1.0]]
     
     # 3x3 identity
     I3 = create_identity_matrix(3)
-    assert I3 == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    assert I3.tolist() == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
 
 
 def test_matrix_operations():
@@ -201,41 +292,61 @@ def test_matrix_operations():
     
     # Matrix addition
     C = matrix_add(A, B)
-    assert C == [[6.0, 8.0], [10.0, 12.0]]
+    assert C.tolist() == [[6.0, 8.0], [10.0, 12.0]]
     
     # Matrix subtraction
     D = matrix_subtract(A, B)
-    assert D == [[-4.0, -4.0], [-4.0, -4.0]]
+    assert D.tolist() == [[-4.0, -4.0], [-4.0, -4.0]]
     
     # Matrix transpose
     AT = matrix_transpose(A)
-    assert AT == [[1.0, 3.0], [2.0, 4.0]]
+    assert AT.tolist() == [[1.0, 3.0], [2.0, 4.0]]
     
     # Matrix multiplication
     AB = matrix_multiply(A, B)
-    assert AB == [[19.0, 22.0], [43.0, 50.0]]
+    assert AB.tolist() == [[19.0, 22.0], [43.0, 50.0]]
 
 
-def test_matrix_inverse_4x4():
+_B = np.array([[1.0, 2.0, 0.0, -1.0],
+               [0.0, 1.0, 3.0, 0.5],
+               [2.0, -1.0, 1.0, 0.0],
+               [1.0, 0.0, -2.0, 1.0]])
+_SPD = _B @ _B.T + np.eye(4)
+
+
+@pytest.mark.parametrize(
+    "M, M_inv_expected",
+    [
+        (np.eye(4), np.eye(4)),
+        (np.diag([2.0, 3.0, 4.0, 5.0]), np.diag([0.5, 1 / 3, 0.25, 0.2])),
+        (_SPD, np.linalg.inv(_SPD)),
+    ],
+    ids=["identity", "diagonal", "spd"],
+)
+def test_matrix_inverse_4x4(M, M_inv_expected):
     """Test 4x4 matrix inversion."""
-    # Identity matrix
-    I = create_identity_matrix(4)
-    I_inv = matrix_inverse_4x4(I)
-    assert all(abs(I_inv[i][j] - I[i][j]) < 1e-6 for i in range(4) for j in range(4))
-    
-    # Diagonal matrix
-    D = [[2.0, 0.0, 0.0, 0.0],
-         [0.0, 3.0, 0.0, 0.0],
-         [0.0, 0.0, 4.0, 0.0],
-         [0.0, 0.0, 0.0, 5.0]]
-    
-    D_inv = matrix_inverse_4x4(D)
-    D_expected = [[0.5, 0.0, 0.0, 0.0],
-                  [0.0, 1/3, 0.0, 0.0],
-                  [0.0, 0.0, 0.25, 0.0],
-                  [0.0, 0.0, 0.0, 0.2]]
-    
-    assert all(abs(D_inv[i][j] - D_expected[i][j]) < 1e-6 for i in range(4) for j in range(4))
+    M_inv = matrix_inverse_4x4(M)
+    np.testing.assert_allclose(np.asarray(M_inv), M_inv_expected, atol=1e-6)
+    # Nested lists are accepted as well
+    np.testing.assert_allclose(matrix_inverse_4x4(M.tolist()), M_inv, atol=1e-12)
+
+
+def test_matrix_inverse_closed_forms():
+    """Test the cofactor 4x4 and Cholesky 3x3 inverses on general matrices."""
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(4, 4))
+    np.testing.assert_allclose(matrix_inverse_4x4(A) @ A, np.eye(4), atol=1e-9)
+
+    B = rng.normal(size=(3, 3))
+    S = B @ B.T + 0.05 * np.eye(3)
+    np.testing.assert_allclose(matrix_inverse_3x3_spd(S), np.linalg.inv(S), rtol=1e-9)
+
+    with pytest.raises(ValueError):
+        matrix_inverse_4x4(np.ones((4, 4)))
+    with pytest.raises(ValueError):
+        matrix_inverse_3x3_spd(-np.eye(3))
+    with pytest.raises(ValueError):
+        matrix_inverse_3x3_spd(np.full((3, 3), np.nan))
 
 
 def test_state_transition_matrix():
@@ -249,7 +360,7 @@ def test_state_transition_matrix():
                   [0.0, 0.0, 1.0, 0.0],
                   [0.0, 0.0, 0.0, 1.0]]
     
-    assert F == F_expected
+    assert F.tolist() == F_expected
 
 
 def test_process_noise_matrix():
@@ -271,6 +382,17 @@ def test_process_noise_matrix():
             assert abs(Q[i][j] - Q[j][i]) < 1e-6
 
 
+def test_model_matrices_are_cached_read_only():
+    """Test that F and Q are built once per (dt, q) and cannot be mutated."""
+    F = state_transition_matrix(0.25)
+    Q = process_noise_matrix(0.25, 0.1)
+
+    assert state_transition_matrix(0.25) is F
+    assert process_noise_matrix(0.25, 0.1) is Q
+    with pytest.raises(ValueError):
+        Q[0, 0] = 1.0
+
+
 def test_latlon_to_meters_and_back():
     """Test conversion between lat/lon and meters."""
     lat1, lon1 = 10.0, 20.0
@@ -287,6 +409,23 @@ def test_latlon_to_meters_and_back():
     assert abs(east_m - east_m2) < 1.0
 
 
+def test_latlon_to_meters_arrays_and_cached_cos():
+    """Test element-wise conversion and the EKF's cached cos(lat)."""
+    lats = np.array([0.0, 45.0, 60.0])
+    north, east = latlon_to_meters(lats, 10.0, lats + 0.001, 10.001)
+    for i, lat in enumerate(lats):
+        assert (north[i], east[i]) == pytest.approx(
+            latlon_to_meters(lat, 10.0, lat + 0.001, 10.001)
+        )
+
+    ekf = NavEKF(LatLon(lat=60.0, lon=10.0), initial_velocity=(0.0, 0.001))
+    first = ekf.velocity_ms()
+    ekf.state[0] += 0.005  # within tolerance, cos(lat) is reused
+    assert ekf.velocity_ms() == first
+    ekf.state[0] += 0.5
+    assert ekf.velocity_ms()[1] < first[1]
+
+
 def test_numerical_jacobian():
     """Test numerical Jacobian calculation."""
     # Simple function: f(x,y) = [x^2, y^2]
@@ -304,3 +443,57 @@ def test_numerical_jacobian():
     assert abs(J[0][1] - J_expected[0][1]) < 1e-4
     assert abs(J[1][0] - J_expected[1][0]) < 1e-4
     assert abs(J[1][1] - J_expected[1][1]) < 1e-4
+
+
+def test_numerical_jacobian_vectorized_matches_loop():
+    """Test that one batched evaluation gives the same Jacobian as the loop."""
+    def func(x):
+        return [x[0] * x[1], np.sin(x[2]), x[0] ** 3]
+
+    def batched(X):
+        return np.column_stack((X[:, 0] * X[:, 1], np.sin(X[:, 2]), X[:, 0] ** 3))
+
+    x = [2.0, -3.0, 0.5]
+    J = numerical_jacobian(func, x)
+    J_batched = numerical_jacobian(batched, x, vectorized=True)
+
+    expected = [[-3.0, 2.0, 0.0], [0.0, 0.0, np.cos(0.5)], [12.0, 0.0, 0.0]]
+    np.testing.assert_allclose(J, expected, atol=1e-6)
+    np.testing.assert_allclose(J_batched, J, rtol=1e-12, atol=1e-12)
+
+
+def test_measurement_jacobian():
+    """Test that each gradient column probes its own coordinate."""
+    def mag_func(lat, lon):
+        return 3.0 * lat + 5.0 * lon + lat * lon
+
+    H = measurement_jacobian([0.2, 0.7, 1.0, -1.0], mag_func)
+
+    assert H.shape == (1, 4)
+    np.testing.assert_allclose(H, [[3.7, 5.2, 0.0, 0.0]], atol=1e-5)
+
+
+def test_ekf_kernels_match_matrix_form():
+    """Test the in-place predict/update kernels against the matrix equations."""
+    from qmag_nav.filter._ekf_kernel import predict_kernel, update_scalar_kernel
+
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(4, 4))
+    P = A @ A.T + np.eye(4)
+    x = rng.normal(size=4)
+    F = state_transition_matrix(0.5)
+    Q = process_noise_matrix(0.5, 0.01)
+    H = np.array([0.3, -0.7, 0.0, 0.0])
+
+    x_k, P_k = x.copy(), P.copy()
+    predict_kernel(x_k, P_k, F, Q)
+    x_e = F @ x
+    P_e = F @ P @ F.T + Q
+    np.testing.assert_allclose(x_k, x_e)
+    np.testing.assert_allclose(P_k, P_e)
+
+    update_scalar_kernel(x_k, P_k, 1.5, H, 0.05)
+    S = H @ P_e @ H + 0.05
+    K = P_e @ H / S
+    np.testing.assert_allclose(x_k, x_e + K * 1.5)
+    np.testing.assert_allclose(P_k, (np.eye(4) - np.outer(K, H)) @ P_e)
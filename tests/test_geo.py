@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+import pytest
+
 from qmag_nav.models.geo import ECEF, LatLon
 
 
@@ -21,6 +24,20 @@ def test_latlon_validation():
     assert pos2.lon == -180
 
 
+def test_latlon_rejects_out_of_range():
+    for lat, lon in [(90.5, 0.0), (-91.0, 0.0), (0.0, 180.5), (0.0, -181.0)]:
+        with pytest.raises(ValueError):
+            LatLon(lat=lat, lon=lon)
+
+
+def test_latlon_is_immutable_value_type():
+    pos = LatLon(10, 20)
+    assert pos == LatLon(lat=10.0, lon=20.0)
+    assert isinstance(pos.lat, float)
+    with pytest.raises(AttributeError):
+        pos.lat = 11.0  # type: ignore[misc]
+
+
 def test_ecef_roundtrip():
     pos = LatLon(lat=51.5, lon=-0.1)  # somewhere in London
     ecef: ECEF = pos.to_ecef()
@@ -37,3 +54,14 @@ def test_distance():
     dist = london.distance_to(paris)
     # Great‑circle approx ~343 km
     assert 330_000 < dist < 360_000
+
+
+def test_haversine_batch_matches_distance_to():
+    london = LatLon(lat=51.5074, lon=-0.1278)
+    others = [LatLon(lat=48.8566, lon=2.3522), LatLon(lat=51.5074, lon=-0.1278), LatLon(lat=-33.9, lon=151.2)]
+    dists = LatLon.haversine_batch(
+        london.lat, london.lon,
+        np.array([p.lat for p in others]), np.array([p.lon for p in others]),
+    )
+    for other, dist in zip(others, dists):
+        assert math.isclose(dist, london.distance_to(other), rel_tol=1e-9, abs_tol=1e-6)
@@ -23,8 +23,10 @@ def test_end_to_end_navigation():
     driver = MockSensorDriver([sensor_value])
     sensor = Magnetometer(driver=driver, calibration=None, filter_window=1)
 
-    # EKF starts with wrong guess
-    ekf = NavEKF(initial=LatLon(lat=0.9, lon=0.1))
+    # EKF starts with wrong guess.  A scalar reading only fixes the field
+    # value, so the update moves along the map gradient (2:1 in lat:lon
+    # here); start on that line through the truth so it is observable.
+    ekf = NavEKF(initial=LatLon(lat=0.65, lon=0.95))
 
     # Run more cycles to ensure convergence
     for _ in range(20):
@@ -38,7 +40,6 @@ def test_end_to_end_navigation():
         ekf.update(expected_anomaly, mag_func)
 
     est = ekf.estimate()
-    # The estimate should show movement toward the truth
-    # Note: Full convergence may not be possible with this simple setup
-    assert abs(est.lat - truth.lat) < abs(0.9 - truth.lat)  # Better than initial
-    assert abs(est.lon - truth.lon) < abs(0.1 - truth.lon)  # Better than initial
+    assert abs(est.lat - truth.lat) < 1e-3
+    assert abs(est.lon - truth.lon) < 1e-3
+    assert abs(m.interpolate(est.lat, est.lon) - expected_anomaly) < 1e-3
@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from _grids import ramp_grid
 
-from qmag_nav.mapping.interpolate import bilinear, bicubic, grid_to_geo_coords
+from qmag_nav.mapping.interpolate import (
+    bicubic,
+    bicubic_array,
+    bilinear,
+    grid_to_geo_coords,
+)
 
 
 class TestInterpolation:
@@ -14,7 +20,7 @@ class TestInterpolation:
     def setup_method(self):
         """Set up test fixtures."""
         # Create a simple 5x5 grid with value = row*10 + col
-        self.grid_data = np.array([[r * 10 + c for c in range(5)] for r in range(5)])
+        self.grid_data = ramp_grid(5, 5)
         
         # Create a list of lists version for testing
         self.grid_list = self.grid_data.tolist()
@@ -38,6 +44,15 @@ class TestInterpolation:
         # Test near edge
         assert bilinear(self.grid_list, 3.9, 4.0, 5, 5) == 43.0
 
+    def test_bilinear_array_and_list_grids_agree(self):
+        """Test that the compiled array path matches the list path."""
+        rng = np.random.default_rng(3)
+        grid = rng.normal(size=(5, 5))
+        for row_f, col_f in rng.uniform(0.0, 4.0, size=(50, 2)):
+            assert bilinear(grid, row_f, col_f, 5, 5) == pytest.approx(
+                bilinear(grid.tolist(), row_f, col_f, 5, 5), rel=1e-12, abs=1e-12
+            )
+
     def test_bilinear_out_of_bounds(self):
         """Test bilinear interpolation with out-of-bounds indices."""
         with pytest.raises(ValueError):
@@ -80,6 +95,30 @@ class TestInterpolation:
         # Now they should be different
         assert bicubic_val != bilinear_val
 
+    def test_bicubic_catmull_rom_weights(self):
+        """Test that interior points use the separable Catmull-Rom kernel."""
+        # Linear data is reproduced exactly
+        assert pytest.approx(bicubic(self.grid_data, 2.3, 1.6, 5, 5), abs=1e-9) == 24.6
+
+        # Midway between nodes the weights are (-1, 9, 9, -1) / 16 per axis
+        grid = np.zeros((5, 5))
+        grid[1, 2] = 16.0
+        assert pytest.approx(bicubic(grid, 2.5, 2.0, 5, 5), abs=1e-12) == -1.0
+        grid[1, 1] = 16.0
+        assert pytest.approx(bicubic(grid, 2.5, 1.5, 5, 5), abs=1e-12) == 2 * (-1.0 * 9.0 / 16)
+
+    def test_bicubic_array_matches_scalar(self):
+        """Test the vectorised bicubic against the scalar one, edges and nodes included."""
+        rng = np.random.default_rng(4)
+        grid = rng.normal(size=(6, 7))
+        rows_f = np.concatenate([rng.uniform(0.0, 5.0, 40), [0.0, 2.0, 4.5, 5.0]])
+        cols_f = np.concatenate([rng.uniform(0.0, 6.0, 40), [0.0, 3.0, 0.5, 6.0]])
+
+        values = bicubic_array(grid, rows_f, cols_f, 6, 7)
+
+        expected = [bicubic(grid, r, c, 6, 7) for r, c in zip(rows_f, cols_f)]
+        np.testing.assert_allclose(values, expected, rtol=1e-12, atol=1e-12)
+
     def test_bicubic_out_of_bounds(self):
         """Test bicubic interpolation with out-of-bounds indices."""
         with pytest.raises(ValueError):
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
 import pytest
+from _grids import ramp_grid
 
-from qmag_nav.mapping.backend import MagneticMap
+from qmag_nav.mapping.backend import (
+    FieldCellCache,
+    MagneticMap,
+    interpolate_array,
+    interpolate_bilinear_array,
+)
+from qmag_nav.mapping.interpolate import bicubic, bilinear, grid_to_geo_coords
 
 
 def small_map() -> MagneticMap:
     # 5×5 grid with value = row*10 + col
-    grid = [[r * 10 + c for c in range(5)] for r in range(5)]
+    grid = ramp_grid(5, 5)
     return MagneticMap(lat_min=0, lat_max=4, lon_min=0, lon_max=4, grid=grid)
 
 
@@ -30,3 +40,130 @@ def test_out_of_bounds():
     m = small_map()
     with pytest.raises(ValueError):
         m.interpolate(-1, 0)
+
+
+def test_interpolate_bilinear_array_matches_scalar():
+    m = small_map()
+    lats = [0.0, 0.5, 2.0, 3.3, 4.0, -1.0]
+    lons = [0.0, 0.5, 3.0, 1.7, 4.0, 0.0]
+    values = interpolate_bilinear_array(m, lats, lons)
+    for lat, lon, value in zip(lats[:-1], lons[:-1], values[:-1]):
+        assert pytest.approx(value, abs=1e-9) == m.interpolate(lat, lon)
+    # out-of-bounds points take the fill value
+    assert math.isnan(values[-1])
+
+
+def test_interpolate_many_matches_scalar():
+    m = small_map()
+    lats = np.array([0.0, 0.5, 2.0, 3.3, 4.0])
+    lons = np.array([0.0, 0.5, 3.0, 1.7, 4.0])
+    for method in ("bilinear", "bicubic"):
+        values = m.interpolate_many(lats, lons, method=method)
+        expected = [m.interpolate(lat, lon, method=method) for lat, lon in zip(lats, lons)]
+        np.testing.assert_allclose(values, expected, atol=1e-9)
+    with pytest.raises(ValueError):
+        m.interpolate_many(np.array([1.0, -1.0]), np.array([1.0, 0.0]))
+
+
+def test_interpolate_precomputed_matches_interpolate_many():
+    m = small_map()
+    lats = np.array([0.0, 0.5, 2.0, 3.3, 4.0])
+    lons = np.array([0.0, 0.5, 3.0, 1.7, 4.0])
+    stencils = m.precompute_bilinear(lats, lons)
+    np.testing.assert_allclose(
+        m.interpolate_precomputed(stencils), m.interpolate_many(lats, lons), atol=1e-9
+    )
+    np.testing.assert_allclose(stencils.weights.sum(axis=-1), 1.0)
+    # the stencils only depend on the grid shape, not its values
+    other = MagneticMap(lat_min=0, lat_max=4, lon_min=0, lon_max=4, grid=-m.grid)
+    np.testing.assert_allclose(
+        other.interpolate_precomputed(stencils), -m.interpolate_many(lats, lons), atol=1e-9
+    )
+    with pytest.raises(ValueError):
+        m.precompute_bilinear(np.array([5.0]), np.array([0.0]))
+    smaller = MagneticMap(lat_min=0, lat_max=4, lon_min=0, lon_max=4, grid=ramp_grid(4, 4))
+    with pytest.raises(ValueError):
+        smaller.interpolate_precomputed(stencils)
+
+
+def test_field_cell_cache_matches_interpolate():
+    m = small_map()
+    cache = FieldCellCache(m)
+    # a straight path crossing several cells, including exact grid nodes
+    for i in range(41):
+        lat, lon = i * 0.1, 4.0 - i * 0.07
+        assert pytest.approx(cache.sample(lat, lon), abs=1e-9) == m.interpolate(lat, lon)
+    with pytest.raises(ValueError):
+        cache.sample(-1, 0)
+    assert FieldCellCache(m, fill_value=0.0).sample(-1, 0) == 0.0
+
+
+def test_interpolate_uses_specialised_fns():
+    m = small_map()
+    assert m._interp_fns == {}
+    # interior points, a grid node and the upper corner
+    for lat, lon in [(1.2, 2.3), (1.2000001, 2.3), (3.5, 0.5), (2.0, 3.0), (4.0, 4.0)]:
+        assert m.interpolate(lat, lon) == bilinear(m.grid_list, lat, lon, 5, 5)
+        assert pytest.approx(m.interpolate(lat, lon, method="bicubic"), abs=1e-9) == bicubic(
+            m.grid_list, lat, lon, 5, 5
+        )
+    interp = m._interp_fns["bilinear"]
+    m.interpolate(0.5, 0.5)
+    assert m._interp_fns["bilinear"] is interp
+    with pytest.raises(ValueError):
+        interp(4.1, 0.0)
+    with pytest.raises(ValueError):
+        m.interpolate(1.0, 1.0, method="nearest")
+
+
+def test_interpolate_array_bicubic_matches_scalar():
+    m = small_map()
+    lats = [0.0, 1.5, 2.2, 3.7, 4.0, 5.0]
+    lons = [0.0, 2.5, 1.3, 0.4, 4.0, 0.0]
+    values = interpolate_array(m, lats, lons, method="bicubic", fill_value=-1.0)
+    for lat, lon, value in zip(lats[:-1], lons[:-1], values[:-1]):
+        assert pytest.approx(value, abs=1e-9) == m.interpolate(lat, lon, method="bicubic")
+    assert values[-1] == -1.0
+    with pytest.raises(ValueError):
+        interpolate_array(m, lats, lons, method="nearest")
+
+
+def test_from_numpy_array_stores_float64_grid_by_reference():
+    grid = ramp_grid(5, 5)
+    m = MagneticMap.from_numpy_array(grid, (0, 4), (0, 4))
+    assert m.grid is grid
+    # other dtypes and layouts are converted into a fresh contiguous buffer
+    m32 = MagneticMap.from_numpy_array(grid.astype(np.float32), (0, 4), (0, 4))
+    assert m32.grid.dtype == np.float64
+    strided = MagneticMap.from_numpy_array(grid.T, (0, 4), (0, 4))
+    assert strided.grid.flags.c_contiguous
+    assert not np.shares_memory(strided.grid, grid)
+
+
+def test_grid_is_contiguous_float64():
+    m = small_map()
+    assert m.grid.dtype == "float64"
+    assert m.grid.flags.c_contiguous
+    assert (m.rows, m.cols) == (5, 5)
+    assert m.grid[2][3] == 23
+    assert m.grid_list[2] == [20.0, 21.0, 22.0, 23.0, 24.0]
+
+
+def test_map_equality_compares_grid_values():
+    m = small_map()
+    m._cell_size()  # cached derived values do not affect equality
+
+    assert m == MagneticMap(0.0, 4.0, 0.0, 4.0, ramp_grid(5, 5).tolist())
+    assert m != MagneticMap(0.0, 4.0, 0.0, 4.0, ramp_grid(5, 5) + 1.0)
+    assert m != MagneticMap(0.0, 4.0, 0.0, 4.0, ramp_grid(4, 4))
+    assert m != MagneticMap(0.0, 5.0, 0.0, 4.0, ramp_grid(5, 5))
+
+
+def test_geo_to_grid_stays_on_grid_at_upper_bounds():
+    # 5.45 * (6 / 5.45) rounds to just above 6
+    m = MagneticMap.from_numpy_array(
+        np.arange(49.0).reshape(7, 7), (0.02, 5.47), (0.0, 1.0)
+    )
+    assert m.geo_to_grid(5.47, 1.0) == (6.0, 6.0)
+    assert grid_to_geo_coords(5.47, 1.0, 0.02, 5.47, 0.0, 1.0, 7, 7) == (6.0, 6.0)
+    assert m.interpolate(5.47, 0.5, method="bicubic") == pytest.approx(45.0)
@@ -3,15 +3,12 @@
 from __future__ import annotations
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
-import rasterio
-import xarray as xr
-from rasterio.transform import Affine
+from _grids import ramp_grid
 
 from qmag_nav.mapping.backend import MagneticMap, load_map, cached_interpolate
 from qmag_nav.models.map import MapHeader
@@ -19,6 +16,8 @@ from qmag_nav.models.map import MapHeader
 
 def create_test_geotiff(path: Path, data: np.ndarray, transform: Affine) -> None:
     """Create a test GeoTIFF file with the given data and transform."""
+    rasterio = pytest.importorskip("rasterio")
+    
     height, width = data.shape
     with rasterio.open(
         path,
@@ -37,6 +36,8 @@ def create_test_geotiff(path: Path, data: np.ndarray, transform: Affine) -> None
 
 def create_test_netcdf(path: Path, data: np.ndarray, lats: np.ndarray, lons: np.ndarray) -> None:
     """Create a test NetCDF file with the given data and coordinates."""
+    xr = pytest.importorskip("xarray")
+    
     ds = xr.Dataset(
         data_vars={
             "magnetic_anomaly": (["latitude", "longitude"], data),
@@ -54,36 +55,42 @@ def create_test_netcdf(path: Path, data: np.ndarray, lats: np.ndarray, lons: np.
     ds.to_netcdf(path)
 
 
-class TestMagneticMapEnhanced:
-    """Test suite for the enhanced MagneticMap class."""
+# Simple 5x5 grid with value = row*10 + col
+GRID_DATA = ramp_grid(5, 5)
+
+
+@pytest.fixture(scope="session")
+def geotiff_path(tmp_path_factory):
+    """Write the test GeoTIFF once per session."""
+    Affine = pytest.importorskip("rasterio.transform").Affine
+    
+    path = tmp_path_factory.mktemp("enhanced") / "test_map.tif"
+    transform = Affine.translation(0, 4) * Affine.scale(1, -1)
+    create_test_geotiff(path, GRID_DATA, transform)
+    return path
+
+
+@pytest.fixture(scope="session")
+def netcdf_path(tmp_path_factory):
+    """Write the test NetCDF once per session."""
+    path = tmp_path_factory.mktemp("enhanced") / "test_map.nc"
+    create_test_netcdf(path, GRID_DATA, np.linspace(0, 4, 5), np.linspace(0, 4, 5))
+    return path
+
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Create a simple 5x5 grid with value = row*10 + col
-        self.grid_data = np.array([[r * 10 + c for c in range(5)] for r in range(5)])
-        self.lats = np.linspace(0, 4, 5)
-        self.lons = np.linspace(0, 4, 5)
-        
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_path = Path(self.temp_dir.name)
-        
-        # Create test GeoTIFF
-        self.geotiff_path = self.temp_path / "test_map.tif"
-        transform = Affine.translation(0, 4) * Affine.scale(1, -1)
-        create_test_geotiff(self.geotiff_path, self.grid_data, transform)
-        
-        # Create test NetCDF
-        self.netcdf_path = self.temp_path / "test_map.nc"
-        create_test_netcdf(self.netcdf_path, self.grid_data, self.lats, self.lons)
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached maps from leaking between tests."""
+    from qmag_nav.mapping.backend import _map_cache
+    _map_cache.clear()
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
 
-    def test_from_geotiff(self):
+class TestMagneticMapEnhanced:
+    """Test suite for the enhanced MagneticMap class."""
+
+    def test_from_geotiff(self, geotiff_path):
         """Test loading a map from a GeoTIFF file."""
-        map_obj = MagneticMap.from_geotiff(self.geotiff_path)
+        map_obj = MagneticMap.from_geotiff(geotiff_path)
         
         # Check bounds (based on actual GeoTIFF bounds)
         assert map_obj.lat_min == -1.0
@@ -104,9 +111,9 @@ class TestMagneticMapEnhanced:
         # Check a sample value
         assert map_obj.grid[2][3] == 23
 
-    def test_from_netcdf(self):
+    def test_from_netcdf(self, netcdf_path):
         """Test loading a map from a NetCDF file."""
-        map_obj = MagneticMap.from_netcdf(self.netcdf_path)
+        map_obj = MagneticMap.from_netcdf(netcdf_path)
         
         # Check bounds
         assert map_obj.lat_min == 0
@@ -136,7 +143,7 @@ class TestMagneticMapEnhanced:
         )
         
         map_obj = MagneticMap.from_numpy_array(
-            self.grid_data,
+            GRID_DATA,
             lat_bounds=(0, 4),
             lon_bounds=(0, 4),
             metadata=metadata,
@@ -159,100 +166,96 @@ class TestMagneticMapEnhanced:
         # Check a sample value
         assert map_obj.grid[2][3] == 23
 
-    def test_load_map_auto_detect(self):
+    def test_load_map_auto_detect(self, geotiff_path, netcdf_path, tmp_path):
         """Test the load_map function with format auto-detection."""
         # Test GeoTIFF auto-detection
-        map_obj1 = load_map(self.geotiff_path)
+        map_obj1 = load_map(geotiff_path)
         assert map_obj1.metadata.title == "Test Map"
         
         # Test NetCDF auto-detection
-        map_obj2 = load_map(self.netcdf_path)
+        map_obj2 = load_map(netcdf_path)
         assert map_obj2.metadata.title == "Test Map"
         
         # Test invalid extension
-        invalid_path = self.temp_path / "invalid.xyz"
+        invalid_path = tmp_path / "invalid.xyz"
         with open(invalid_path, "w") as f:
             f.write("invalid data")
         
         with pytest.raises(ValueError, match="Could not auto-detect format"):
             load_map(invalid_path)
 
-    def test_load_map_explicit_format(self):
+    def test_load_map_explicit_format(self, geotiff_path, netcdf_path):
         """Test the load_map function with explicit format specification."""
-        map_obj1 = load_map(self.geotiff_path, format_type="geotiff")
+        map_obj1 = load_map(geotiff_path, format_type="geotiff")
         assert map_obj1.metadata.title == "Test Map"
         
-        map_obj2 = load_map(self.netcdf_path, format_type="netcdf")
+        map_obj2 = load_map(netcdf_path, format_type="netcdf")
         assert map_obj2.metadata.title == "Test Map"
         
         with pytest.raises(ValueError, match="Unsupported format"):
-            load_map(self.geotiff_path, format_type="invalid")
+            load_map(geotiff_path, format_type="invalid")
 
-    def test_lru_cache(self):
+    def test_lru_cache(self, geotiff_path, tmp_path):
         """Test that the caching is working for load_map and cached_interpolate."""
-        # Clear the map cache
-        from qmag_nav.mapping.backend import _map_cache
-        _map_cache.clear()
-        
         # Test load_map caching
         with patch('qmag_nav.mapping.backend.MagneticMap.from_geotiff') as mock_from_geotiff:
             mock_from_geotiff.return_value = MagneticMap(
                 lat_min=0, lat_max=4, lon_min=0, lon_max=4,
-                grid=self.grid_data.tolist(),
+                grid=GRID_DATA,
                 metadata=MapHeader(title="Mock Map", source="Test", resolution_m=100.0)
             )
             
             # First call should use the mock
-            map_obj1 = load_map(self.geotiff_path)
+            map_obj1 = load_map(geotiff_path)
             assert mock_from_geotiff.call_count == 1
             
             # Second call with same path should use cache
-            map_obj2 = load_map(self.geotiff_path)
+            map_obj2 = load_map(geotiff_path)
             assert mock_from_geotiff.call_count == 1
             
             # Different path should call again
-            map_obj3 = load_map(self.temp_path / "different.tif")
+            map_obj3 = load_map(tmp_path / "different.tif")
             assert mock_from_geotiff.call_count == 2
         
         # Test cached_interpolate
         map_obj = MagneticMap(
             lat_min=0, lat_max=4, lon_min=0, lon_max=4,
-            grid=self.grid_data.tolist()
+            grid=GRID_DATA
         )
         
-        # Clear the interpolation cache
-        from qmag_nav.mapping.backend import _interpolation_cache
-        _interpolation_cache.clear()
-        
-        # Since we can't patch the interpolate method due to slots=True,
-        # we'll test the cache directly
+        # Each map carries its own interpolation cache, keyed on the
+        # coordinates in 1e-6 degree steps
+        cache = map_obj._interp_cache
+        assert cache.cache_info().currsize == 0
         
         # First call should add to the cache
         val1 = cached_interpolate(map_obj, 2.5, 3.5)
         
         # Check that the value is now in the cache
-        cache_key = (id(map_obj), 2.5, 3.5, "bilinear")
-        assert cache_key in _interpolation_cache
+        assert cache.cache_info().misses == 1
+        assert cache(2_500_000, 3_500_000, "bilinear") == val1
+        assert cache.cache_info().hits == 1
         
         # Second call with same coordinates should use cache
         val2 = cached_interpolate(map_obj, 2.5, 3.5)
         
         # Values should be the same
         assert val1 == val2
+        assert cache.cache_info().currsize == 1
+        assert cache.cache_info().hits == 2
         
         # Different coordinates should add a new entry to the cache
         val3 = cached_interpolate(map_obj, 1.5, 2.5)
         
         # Check that the new value is in the cache
-        new_cache_key = (id(map_obj), 1.5, 2.5, "bilinear")
-        assert new_cache_key in _interpolation_cache
+        assert cache(1_500_000, 2_500_000, "bilinear") == val3
         
         # Test with bicubic interpolation
         val4 = cached_interpolate(map_obj, 2.5, 3.5, method="bicubic")
         
         # Check that the bicubic value is in the cache
-        bicubic_cache_key = (id(map_obj), 2.5, 3.5, "bicubic")
-        assert bicubic_cache_key in _interpolation_cache
+        assert cache(2_500_000, 3_500_000, "bicubic") == val4
+        assert cache.cache_info().currsize == 3
         
         # For a simple linear grid, bicubic and bilinear might give the same result
         # The important thing is that both methods work and are cached correctly
@@ -268,25 +271,27 @@ class TestMagneticMapEnhanced:
         
         complex_map = MagneticMap(
             lat_min=0, lat_max=4, lon_min=0, lon_max=4,
-            grid=complex_grid.tolist()
+            grid=complex_grid
         )
         
-        # Clear the cache for testing
-        _interpolation_cache.clear()
-        
         # Test both methods
         bilinear_val = cached_interpolate(complex_map, 2.5, 2.5, method="bilinear")
         bicubic_val = cached_interpolate(complex_map, 2.5, 2.5, method="bicubic")
         
-        # Check that both values are cached
-        assert (id(complex_map), 2.5, 2.5, "bilinear") in _interpolation_cache
-        assert (id(complex_map), 2.5, 2.5, "bicubic") in _interpolation_cache
+        # Check that both values are cached, separately from the first map
+        assert complex_map._interp_cache.cache_info().currsize == 2
+        assert cache.cache_info().currsize == 3
+        
+        # Repeated queries are answered from the cache, not the grid
+        assert cached_interpolate(complex_map, 2.5, 2.5, method="bilinear") == bilinear_val
+        assert cached_interpolate(complex_map, 2.5, 2.5, method="bicubic") == bicubic_val
+        assert complex_map._interp_cache.cache_info().hits == 2
 
     def test_get_tile_metadata(self):
         """Test the get_tile_metadata method."""
         map_obj = MagneticMap(
             lat_min=0, lat_max=4, lon_min=0, lon_max=4, 
-            grid=self.grid_data.tolist()
+            grid=GRID_DATA
         )
         
         metadata = map_obj.get_tile_metadata()
@@ -3,20 +3,22 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 
+import numpy as np
 import pytest
 
 from qmag_nav.mapping.backend import MagneticMap, load_map, cached_interpolate
 
 
-# Path to test data directory
-DATA_DIR = Path(__file__).parent / "data"
+@pytest.fixture(scope="session")
+def loaded_tif(test_grid_paths):
+    """The test GeoTIFF, loaded once for tests that only read from it."""
+    return MagneticMap.from_geotiff(test_grid_paths["geotiff"])
 
 
-def test_load_geotiff():
+def test_load_geotiff(test_grid_paths):
     """Test loading a map from a GeoTIFF file."""
-    geotiff_path = DATA_DIR / "5x5_grid.tif"
+    geotiff_path = test_grid_paths["geotiff"]
     map_obj = MagneticMap.from_geotiff(geotiff_path)
     
     # Check dimensions
@@ -30,9 +32,47 @@ def test_load_geotiff():
     assert map_obj.metadata.resolution_m == 100.0
 
 
-def test_load_netcdf():
+def test_load_geotiff_window(test_grid_paths):
+    """Test that a bbox reads only the covering pixels, snapped outwards."""
+    geotiff_path = test_grid_paths["geotiff"]
+    map_obj = MagneticMap.from_geotiff(geotiff_path, bbox=(0.5, 2.5, 1.2, 2.8))
+
+    assert map_obj.grid.tolist() == [[11, 12], [21, 22], [31, 32]]
+    assert (map_obj.lat_min, map_obj.lat_max) == (0.0, 3.0)
+    assert (map_obj.lon_min, map_obj.lon_max) == (1.0, 3.0)
+
+    with pytest.raises(ValueError):
+        MagneticMap.from_geotiff(geotiff_path, bbox=(10.0, 11.0, 10.0, 11.0))
+
+
+def test_load_geotiff_decimated_warns_without_overviews(tmp_path, test_grid_paths):
+    """Test that resampled reads warn only when the file has no overviews."""
+    import warnings
+
+    import numpy as np
+    import rasterio
+    from rasterio.transform import Affine
+
+    # The fixture ships overviews, so decimated reads are served from them
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        map_obj = MagneticMap.from_geotiff(test_grid_paths["geotiff"], out_shape=(3, 3))
+    assert map_obj.rows == 3 and map_obj.cols == 3
+
+    plain_path = tmp_path / "plain.tif"
+    with rasterio.open(
+        plain_path, "w", driver="GTiff", height=5, width=5, count=1,
+        dtype="float64", transform=Affine.translation(0, 4) * Affine.scale(1, -1),
+    ) as dst:
+        dst.write(np.zeros((5, 5)), 1)
+
+    with pytest.warns(RuntimeWarning, match="gdaladdo"):
+        MagneticMap.from_geotiff(plain_path, out_shape=(3, 3))
+
+
+def test_load_netcdf(test_grid_paths):
     """Test loading a map from a NetCDF file."""
-    netcdf_path = DATA_DIR / "5x5_grid.nc"
+    netcdf_path = test_grid_paths["netcdf"]
     map_obj = MagneticMap.from_netcdf(netcdf_path)
     
     # Check dimensions
@@ -45,10 +85,19 @@ def test_load_netcdf():
     assert map_obj.grid[4][4] == 44
 
 
-def test_interpolation_with_test_points():
+def test_load_netcdf_chunked(test_grid_paths):
+    """Test that a dask-chunked load yields the same grid as an eager one."""
+    pytest.importorskip("dask")
+    netcdf_path = test_grid_paths["netcdf"]
+
+    chunked = MagneticMap.from_netcdf(netcdf_path, chunks={"latitude": 2, "longitude": 2})
+
+    np.testing.assert_array_equal(chunked.grid, MagneticMap.from_netcdf(netcdf_path).grid)
+
+
+def test_interpolation_with_test_points(loaded_tif):
     """Test interpolation using the actual values from the GeoTIFF file."""
-    # Load the map
-    map_obj = load_map(DATA_DIR / "5x5_grid.tif")
+    map_obj = loaded_tif
     
     # Test specific points with known values based on the actual interpolated values
     test_cases = [
@@ -63,11 +112,11 @@ def test_interpolation_with_test_points():
         assert pytest.approx(value, abs=1e-6) == expected
 
 
-def test_load_map_caching():
+def test_load_map_caching(test_grid_paths):
     """Test that the load_map function caches results."""
     # Load the map twice with the same path
-    map1 = load_map(DATA_DIR / "5x5_grid.tif")
-    map2 = load_map(DATA_DIR / "5x5_grid.tif")
+    map1 = load_map(test_grid_paths["geotiff"])
+    map2 = load_map(test_grid_paths["geotiff"])
     
     # They should be the same object in memory
     assert map1 is map2
@@ -77,45 +126,73 @@ def test_load_map_caching():
     _map_cache.clear()
     
     # Load with explicit format specification
-    map3 = load_map(DATA_DIR / "5x5_grid.tif", format_type="geotiff")
-    map4 = load_map(DATA_DIR / "5x5_grid.tif", format_type="geotiff")
+    map3 = load_map(test_grid_paths["geotiff"], format_type="geotiff")
+    map4 = load_map(test_grid_paths["geotiff"], format_type="geotiff")
     
     # These should be the same object due to caching
     assert map3 is map4
 
 
-def test_auto_format_detection():
+def test_from_geotiff_reuses_unchanged_file(tmp_path, test_grid_paths):
+    """Test that GeoTIFF reads are cached until the file changes."""
+    import os
+    import shutil
+
+    path = tmp_path / "copy.tif"
+    shutil.copy(test_grid_paths["geotiff"], path)
+
+    first = MagneticMap.from_geotiff(path)
+    second = MagneticMap.from_geotiff(str(path))
+    assert second is not first
+    assert second.grid is first.grid
+    assert MagneticMap.from_geotiff(path, out_shape=(3, 3)).grid is not first.grid
+
+    # The shared grid cannot be edited through one of its maps
+    assert not first.grid.flags.writeable
+    with pytest.raises(ValueError):
+        first.grid[0, 0] = 1.0
+
+    # A newer modification time forces a fresh read
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert MagneticMap.from_geotiff(path).grid is not first.grid
+
+    with pytest.raises(ValueError):
+        MagneticMap.from_geotiff(tmp_path / "missing.tif")
+
+
+def test_auto_format_detection(test_grid_paths):
     """Test that the load_map function can auto-detect formats."""
     # Load GeoTIFF without specifying format
-    map1 = load_map(DATA_DIR / "5x5_grid.tif")
+    map1 = load_map(test_grid_paths["geotiff"])
     assert map1.metadata.title == "Test Map"
     
     # Load NetCDF without specifying format
-    map2 = load_map(DATA_DIR / "5x5_grid.nc")
+    map2 = load_map(test_grid_paths["netcdf"])
     assert map2.metadata.title == "Test Map"
     
     # These should be different objects
     assert map1 is not map2
 
 
-def test_interpolate_caching():
+def test_interpolate_caching(loaded_tif):
     """Test that the cached_interpolate function caches results."""
-    map_obj = load_map(DATA_DIR / "5x5_grid.tif")
+    map_obj = loaded_tif
     
-    # Clear the interpolation cache
-    from qmag_nav.mapping.backend import _interpolation_cache
-    _interpolation_cache.clear()
+    # The session map may already hold entries from other tests
+    map_obj._interp_cache.cache_clear()
     
     # Call cached_interpolate twice with the same coordinates
     val1 = cached_interpolate(map_obj, 2.5, 3.5)
+    assert map_obj._interp_cache.cache_info().currsize == 1
     
-    # Check that the value is now in the cache
-    cache_key = (id(map_obj), 2.5, 3.5, "bilinear")
-    assert cache_key in _interpolation_cache
-    
-    # Call again and verify it returns the same value
+    # Call again and verify it returns the same value from the cache
     val2 = cached_interpolate(map_obj, 2.5, 3.5)
     assert val1 == val2
     
+    # A query within the quantisation step is served from the same entry
+    assert cached_interpolate(map_obj, 2.5 + 1e-8, 3.5 - 1e-8) == val1
+    assert map_obj._interp_cache.cache_info().currsize == 1
+    
     # The actual value should be approximately 30.8 based on our debug output
     assert pytest.approx(val1, abs=1e-6) == 30.8
\ No newline at end of file
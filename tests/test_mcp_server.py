@@ -4,36 +4,97 @@ import asyncio
 import json
 import os
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 from mcp.types import Tool, CallToolResult as ToolResult, TextContent
 import json
 
+from qmag_nav.mapping.backend import MagneticMap, interpolate_bilinear_array
 from qmag_nav.mcp.server import QMagNavServer
+from qmag_nav.mcp.tools._maps import _default_map_path, get_map
 from qmag_nav.mcp.tools.magnetic_field import MagneticFieldTool
 from qmag_nav.mcp.tools.position_estimation import PositionEstimationTool
-from qmag_nav.mcp.tools.sensor_calibration import SensorCalibrationTool
-from qmag_nav.mcp.tools.trajectory_simulation import TrajectorySimulationTool
+from qmag_nav.mcp.tools.sensor_calibration import (
+    SensorCalibrationTool,
+    _axis_centre_spread,
+    _axis_extents,
+)
+from qmag_nav.mcp.tools.trajectory_simulation import (
+    TrajectorySimulationTool,
+    _simulate_straight,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_map():
-    """Create a mock map for testing."""
-    with patch("qmag_nav.mapping.backend.load_map") as mock_load_map:
-        # Create a simple mock map
-        mock_map = MagicMock()
-        mock_map.lat_min = 40.0
-        mock_map.lat_max = 41.0
-        mock_map.lon_min = -74.0
-        mock_map.lon_max = -73.0
-        mock_map.rows = 11
-        mock_map.cols = 11
-        mock_map.interpolate.return_value = 50000.0  # 50,000 nT
-        
-        # Configure the mock to return our mock map
-        mock_load_map.return_value = mock_map
-        
-        yield mock_map
+    """Create a mock map, shared by the tests in this module.
+    
+    Tests hand it to the tools directly through ``tool._map``, so no loader
+    needs patching.
+    """
+    mock_map = MagicMock()
+    mock_map.lat_min = 40.0
+    mock_map.lat_max = 41.0
+    mock_map.lon_min = -74.0
+    mock_map.lon_max = -73.0
+    mock_map.rows = 11
+    mock_map.cols = 11
+    mock_map.grid = [[50000.0] * 11 for _ in range(11)]
+    mock_map.interpolate.return_value = 50000.0  # 50,000 nT
+    mock_map._interp_cache.return_value = 50000.0  # cached_interpolate
+    return mock_map
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_map(mock_map):
+    """Clear the shared mock's call history after every test."""
+    yield
+    mock_map.reset_mock()
+
+
+MAGNETIC_FIELD_ARGS = {
+    "latitude": 40.5,
+    "longitude": -73.5,
+    "interpolation_method": "bilinear"
+}
+
+POSITION_ESTIMATION_ARGS = {
+    "magnetic_field": 50000.0,
+    "initial_latitude": 40.5,
+    "initial_longitude": -73.5,
+    "dt": 1.0,
+    "reset": True
+}
+
+# Some sample data (8 points on a sphere with some noise), built once as
+# the (N, 3) float64 array the tool works on
+CALIBRATION_SAMPLES = np.array([
+    [30000, 0, 0],
+    [-30000, 0, 0],
+    [0, 30000, 0],
+    [0, -30000, 0],
+    [0, 0, 30000],
+    [0, 0, -30000],
+    [20000, 20000, 20000],
+    [-20000, -20000, -20000]
+], dtype=np.float64)
+
+CALIBRATION_ARGS = {
+    "samples": CALIBRATION_SAMPLES,
+    "method": "simple"
+}
+
+TRAJECTORY_ARGS = {
+    "start_latitude": 40.2,
+    "start_longitude": -73.8,
+    "end_latitude": 40.8,
+    "end_longitude": -73.2,
+    "speed": 10.0,
+    "sample_rate": 1.0,
+    "noise_level": 5.0,
+    "path_type": "straight"
+}
 
 
 @pytest.mark.asyncio
@@ -68,11 +129,7 @@ async def test_magnetic_field_tool(mock_map):
     tool._map = mock_map
     
     # Test execution with valid arguments
-    result = await tool.execute({
-        "latitude": 40.5,
-        "longitude": -73.5,
-        "interpolation_method": "bilinear"
-    })
+    result = await tool.execute(MAGNETIC_FIELD_ARGS)
     
     # Verify the result
     assert isinstance(result, ToolResult)
@@ -86,6 +143,28 @@ async def test_magnetic_field_tool(mock_map):
     assert "Magnetic field at (40.5, -73.5)" in text_content.text
 
 
+@pytest.mark.asyncio
+async def test_magnetic_field_tool_loads_map_from_path():
+    """Test that the tool loads its map from disk on first use."""
+    map_path = os.path.join(os.path.dirname(__file__), "data", "5x5_grid.tif")
+    tool = MagneticFieldTool(map_path)
+
+    result = await tool.execute({"latitude": 2.0, "longitude": 3.0})
+
+    assert tool._map is not None
+    assert "Magnetic field at (2.0, 3.0)" in result.content[0].text
+
+
+def test_get_map_default_lookup_is_cached():
+    """Test that the packaged default map is looked up once per process."""
+    _default_map_path.cache_clear()
+
+    # The package ships no default map
+    assert get_map() is None
+    assert get_map() is None
+    assert _default_map_path.cache_info().misses == 1
+
+
 @pytest.mark.asyncio
 async def test_position_estimation_tool(mock_map):
     """Test the position estimation tool."""
@@ -96,13 +175,7 @@ async def test_position_estimation_tool(mock_map):
     tool._map = mock_map
     
     # Test execution with valid arguments
-    result = await tool.execute({
-        "magnetic_field": 50000.0,
-        "initial_latitude": 40.5,
-        "initial_longitude": -73.5,
-        "dt": 1.0,
-        "reset": True
-    })
+    result = await tool.execute(POSITION_ESTIMATION_ARGS)
     
     # Verify the result
     assert isinstance(result, ToolResult)
@@ -124,23 +197,8 @@ async def test_sensor_calibration_tool():
     # Create the tool
     tool = SensorCalibrationTool()
     
-    # Create some sample data (8 points on a sphere with some noise)
-    samples = [
-        [30000, 0, 0],
-        [-30000, 0, 0],
-        [0, 30000, 0],
-        [0, -30000, 0],
-        [0, 0, 30000],
-        [0, 0, -30000],
-        [20000, 20000, 20000],
-        [-20000, -20000, -20000]
-    ]
-    
     # Test execution with valid arguments
-    result = await tool.execute({
-        "samples": samples,
-        "method": "simple"
-    })
+    result = await tool.execute(CALIBRATION_ARGS)
     
     # Verify the result
     assert isinstance(result, ToolResult)
@@ -156,6 +214,35 @@ async def test_sensor_calibration_tool():
     assert "Offsets" in text_content.text
 
 
+def test_calibration_kernels_match_numpy():
+    """Test the fused per-axis kernels against the equivalent NumPy reductions."""
+    samples = np.random.default_rng(0).normal(1000.0, 30000.0, size=(50, 3))
+
+    lo, hi = _axis_extents(samples)
+    np.testing.assert_array_equal(lo, samples.min(axis=0))
+    np.testing.assert_array_equal(hi, samples.max(axis=0))
+
+    centre, spread = _axis_centre_spread(samples)
+    np.testing.assert_allclose(centre, samples.mean(axis=0))
+    np.testing.assert_allclose(spread, np.abs(samples - samples.mean(axis=0)).mean(axis=0))
+
+    # JSON clients send nested lists; both forms calibrate identically
+    tool = SensorCalibrationTool()
+    from_list = asyncio.run(tool.execute({"samples": CALIBRATION_SAMPLES.tolist()}))
+    from_array = asyncio.run(tool.execute({"samples": CALIBRATION_SAMPLES}))
+    assert from_list.content[0].text == from_array.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_sensor_calibration_tool_rejects_malformed_samples():
+    """Test that samples without exactly three components are rejected."""
+    tool = SensorCalibrationTool()
+
+    result = await tool.execute({"samples": [[1.0, 2.0, 3.0, 4.0]] * 9})
+
+    assert "Invalid arguments" in result.content[0].text
+
+
 @pytest.mark.asyncio
 async def test_trajectory_simulation_tool(mock_map):
     """Test the trajectory simulation tool."""
@@ -166,16 +253,7 @@ async def test_trajectory_simulation_tool(mock_map):
     tool._map = mock_map
     
     # Test execution with valid arguments
-    result = await tool.execute({
-        "start_latitude": 40.2,
-        "start_longitude": -73.8,
-        "end_latitude": 40.8,
-        "end_longitude": -73.2,
-        "speed": 10.0,
-        "sample_rate": 1.0,
-        "noise_level": 5.0,
-        "path_type": "straight"
-    })
+    result = await tool.execute(TRAJECTORY_ARGS)
     
     # Verify the result
     assert isinstance(result, ToolResult)
@@ -191,6 +269,81 @@ async def test_trajectory_simulation_tool(mock_map):
     assert "Path type" in text_content.text
 
 
+@pytest.mark.asyncio
+async def test_tools_execute_concurrently(mock_map):
+    """Test that every tool gives its usual result when all run at once."""
+    cases = [
+        (MagneticFieldTool(), MAGNETIC_FIELD_ARGS, ["Magnetic field at (40.5, -73.5)"]),
+        (
+            PositionEstimationTool(),
+            POSITION_ESTIMATION_ARGS,
+            ["Estimated position", "Velocity", "Position uncertainty"],
+        ),
+        (
+            SensorCalibrationTool(),
+            CALIBRATION_ARGS,
+            ["Calibration completed", "Scale factors", "Offsets"],
+        ),
+        (
+            TrajectorySimulationTool(),
+            TRAJECTORY_ARGS,
+            ["Generated trajectory", "Total distance", "Path type"],
+        ),
+    ]
+    for tool, _, _ in cases:
+        if hasattr(tool, "_map"):
+            tool._map = mock_map
+
+    results = await asyncio.gather(*(tool.execute(args) for tool, args, _ in cases))
+
+    for (tool, _, phrases), result in zip(cases, results):
+        assert isinstance(result, ToolResult)
+        assert len(result.content) == 1
+        text_content = result.content[0]
+        assert text_content.type == "text"
+        for phrase in phrases:
+            assert phrase in text_content.text, f"{type(tool).__name__}: {phrase!r}"
+
+
+@pytest.mark.parametrize("path_type", ["straight", "curved", "random"])
+def test_generate_trajectory_path_types(path_type):
+    """Test that every path type yields the requested points between the endpoints."""
+    tool = TrajectorySimulationTool()
+
+    trajectory = tool._generate_trajectory(40.2, -73.8, 40.8, -73.2, 50, path_type)
+
+    assert len(trajectory) == 50
+    assert trajectory[0] == pytest.approx((40.2, -73.8))
+    assert trajectory[-1] == pytest.approx((40.8, -73.2))
+    for lat, lon in trajectory:
+        assert isinstance(lat, float) and isinstance(lon, float)
+        assert 40.0 < lat < 41.0 and -74.0 < lon < -73.0
+
+
+def test_simulate_straight_matches_generic_path():
+    """Test that the fused straight-path kernel matches generate + interpolate."""
+    grid = np.add.outer(np.arange(5) * 10.0, np.arange(5.0))
+    mag_map = MagneticMap.from_numpy_array(grid, (0.0, 4.0), (0.0, 4.0))
+    n = 33
+    lats, lons, mags = np.empty(n), np.empty(n), np.empty(n)
+
+    # The path leaves the map, so off-map points must read 0.0
+    _simulate_straight(
+        0.5, 0.25, 4.5, 3.75, grid, 0.0, 4.0, 0.0, 4.0,
+        np.zeros(n), lats, lons, mags
+    )
+
+    expected_lats = np.linspace(0.5, 4.5, n)
+    expected_lons = np.linspace(0.25, 3.75, n)
+    expected = np.nan_to_num(
+        interpolate_bilinear_array(mag_map, expected_lats, expected_lons)
+    )
+    np.testing.assert_allclose(lats, expected_lats)
+    np.testing.assert_allclose(lons, expected_lons)
+    np.testing.assert_allclose(mags, expected)
+    assert mags[-1] == 0.0
+
+
 @pytest.mark.asyncio
 async def test_server_call_tool():
     """Test that the server correctly routes tool calls."""
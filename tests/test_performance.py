@@ -3,26 +3,58 @@
 from __future__ import annotations
 
 import time
+import tracemalloc
 from pathlib import Path
 
 import numpy as np
 import pytest
+from _grids import ramp_grid
 
 from qmag_nav.mapping.backend import MagneticMap, cached_interpolate
 
+# Timing assertions are unreliable while other workers compete for the CPU
+pytestmark = pytest.mark.serial
 
 # Path to test data directory
 DATA_DIR = Path(__file__).parent / "data"
 
 
-def test_interpolation_performance():
+@pytest.fixture(scope="module")
+def geotiff_map():
+    """The 5x5 test GeoTIFF, loaded once so no test times the file I/O."""
+    return MagneticMap.from_geotiff(DATA_DIR / "5x5_grid.tif")
+
+
+def _grid_points(lo, hi, n=10):
+    """Return flat latitude and longitude arrays of an n×n lattice over [lo, hi]²."""
+    axis = np.linspace(lo, hi, n)
+    lats, lons = np.meshgrid(axis, axis, indexing="ij")
+    return lats.ravel(), lons.ravel()
+
+
+def _best_of(fn, repeats=20):
+    """Return the shortest of *repeats* wall-clock timings of ``fn()``, in seconds."""
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+
+@pytest.mark.parametrize(
+    "rows, cols",
+    [
+        (100, 100),
+        # Larger than L2, so cache effects in the kernels show up
+        (512, 512),
+        pytest.param(2048, 2048, marks=pytest.mark.slow),
+    ],
+)
+def test_interpolation_performance(rows, cols):
     """Test the performance of interpolation methods."""
-    # Create a larger grid for performance testing (100x100)
-    rows, cols = 100, 100
-    grid_data = np.zeros((rows, cols))
-    for r in range(rows):
-        for c in range(cols):
-            grid_data[r, c] = r * cols + c
+    # Value = row * cols + col
+    grid_data = np.arange(rows * cols, dtype=np.float64).reshape(rows, cols)
     
     # Create a map
     map_obj = MagneticMap(
@@ -30,35 +62,25 @@ def test_interpolation_performance():
         lat_max=10.0,
         lon_min=0.0,
         lon_max=10.0,
-        grid=grid_data.tolist(),
+        grid=grid_data,
     )
     
-    # Test points
-    test_points = [
-        (lat, lon) for lat in np.linspace(0.1, 9.9, 10) for lon in np.linspace(0.1, 9.9, 10)
-    ]
-    
-    # Measure bilinear interpolation performance
-    start_time = time.perf_counter()
-    for lat, lon in test_points:
-        map_obj.interpolate(lat, lon, method="bilinear")
-    end_time = time.perf_counter()
-    
-    # Calculate average time per interpolation
-    bilinear_time = (end_time - start_time) * 1_000_000 / len(test_points)  # in microseconds
-    
-    # Measure bicubic interpolation performance
-    start_time = time.perf_counter()
-    for lat, lon in test_points:
-        map_obj.interpolate(lat, lon, method="bicubic")
-    end_time = time.perf_counter()
+    # Test points, as arrays for the batched call and as floats for the scalar one
+    lats, lons = _grid_points(0.1, 9.9)
+    test_points = list(zip(lats.tolist(), lons.tolist()))
     
-    # Calculate average time per interpolation
-    bicubic_time = (end_time - start_time) * 1_000_000 / len(test_points)  # in microseconds
+    # Best of repeated runs, in microseconds per interpolation; the first
+    # run also warms the per-map interpolators
+    bilinear_time = _best_of(
+        lambda: map_obj.interpolate_many(lats, lons, method="bilinear")
+    ) * 1_000_000 / len(test_points)
+    bicubic_time = _best_of(
+        lambda: [map_obj.interpolate(lat, lon, method="bicubic") for lat, lon in test_points]
+    ) * 1_000_000 / len(test_points)
     
     # Print performance results
-    print(f"\nBilinear interpolation: {bilinear_time:.2f} µs per call")
-    print(f"Bicubic interpolation: {bicubic_time:.2f} µs per call")
+    print(f"\n{rows}x{cols} bilinear interpolation: {bilinear_time:.2f} µs per call")
+    print(f"{rows}x{cols} bicubic interpolation: {bicubic_time:.2f} µs per call")
     
     # Verify that bilinear interpolation meets the performance criteria
     assert bilinear_time <= 100, f"Bilinear interpolation too slow: {bilinear_time:.2f} µs (target: ≤ 100 µs)"
@@ -67,19 +89,62 @@ def test_interpolation_performance():
     assert bicubic_time <= 1000, f"Bicubic interpolation too slow: {bicubic_time:.2f} µs (target: ≤ 1000 µs)"
 
 
-def test_cached_interpolation_performance():
+def test_boundary_interpolation_performance():
+    """Test that points on the map edges are no slower than interior points."""
+    map_obj = MagneticMap(
+        lat_min=0.0, lat_max=10.0, lon_min=0.0, lon_max=10.0, grid=ramp_grid(100, 100)
+    )
+    ticks = np.linspace(0.0, 10.0, 25).tolist()
+    edge_points = (
+        [(0.0, t) for t in ticks] + [(10.0, t) for t in ticks]
+        + [(t, 0.0) for t in ticks] + [(t, 10.0) for t in ticks]
+    )
+    lats, lons = _grid_points(0.1, 9.9)
+    interior_points = list(zip(lats.tolist(), lons.tolist()))
+    
+    edge_time = _best_of(
+        lambda: [map_obj.interpolate(lat, lon) for lat, lon in edge_points]
+    ) / len(edge_points)
+    interior_time = _best_of(
+        lambda: [map_obj.interpolate(lat, lon) for lat, lon in interior_points]
+    ) / len(interior_points)
+    
+    print(f"\nEdge interpolation: {edge_time * 1e6:.2f} µs per call")
+    print(f"Interior interpolation: {interior_time * 1e6:.2f} µs per call")
+    
+    # The cell index is clamped with min/max, so edges take the same path
+    assert edge_time <= 2 * interior_time, "Edge points take a slower path"
+    assert edge_time * 1e6 <= 100
+
+
+def test_precomputed_interpolation_performance():
+    """Test that precomputed bilinear stencils beat per-point interpolation."""
+    map_obj = MagneticMap(
+        lat_min=0.0, lat_max=10.0, lon_min=0.0, lon_max=10.0, grid=ramp_grid(100, 100)
+    )
+    lats, lons = _grid_points(0.1, 9.9)
+    points = list(zip(lats.tolist(), lons.tolist()))
+    stencils = map_obj.precompute_bilinear(lats, lons)
+    
+    per_point_time = _best_of(lambda: [map_obj.interpolate(lat, lon) for lat, lon in points])
+    precomputed_time = _best_of(lambda: map_obj.interpolate_precomputed(stencils))
+    
+    print(f"\nPer-point interpolation: {per_point_time * 1e6:.2f} µs per batch")
+    print(f"Precomputed interpolation: {precomputed_time * 1e6:.2f} µs per batch")
+    
+    assert precomputed_time * 5 <= per_point_time, "Precomputed stencils not ≥5x faster"
+
+
+def test_cached_interpolation_performance(geotiff_map):
     """Test the performance of cached interpolation."""
-    # Create a map from the test GeoTIFF
-    map_obj = MagneticMap.from_geotiff(DATA_DIR / "5x5_grid.tif")
+    map_obj = geotiff_map
     
-    # Clear the cache
-    from qmag_nav.mapping.backend import _interpolation_cache
-    _interpolation_cache.clear()
+    # Start from an empty cache
+    map_obj._interp_cache.cache_clear()
     
     # Test points
-    test_points = [
-        (lat, lon) for lat in np.linspace(0.1, 3.9, 10) for lon in np.linspace(0.1, 3.9, 10)
-    ]
+    lats, lons = _grid_points(0.1, 3.9)
+    test_points = list(zip(lats.tolist(), lons.tolist()))
     
     # First run - uncached
     start_time = time.perf_counter()
@@ -108,39 +173,48 @@ def test_cached_interpolation_performance():
     assert cached_time <= 10, f"Cached lookup too slow: {cached_time:.2f} µs (target: ≤ 10 µs)"
 
 
+def _traced_peak_mb(fn):
+    """Call ``fn()`` and return its result and its peak traced allocation in MB.
+
+    tracemalloc sees NumPy's buffer allocations too, and unlike an RSS delta
+    its peak is exact and not blurred by the allocator or other threads.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return result, peak / (1024 * 1024)
+
+
 def test_memory_usage():
     """Test the memory usage of the MagneticMap class."""
-    # This is a simple approximation - for a more accurate measurement,
-    # we would need to use a memory profiler
-    
     # Create a 1000x1000 grid (simulating a 1° global grid)
     rows, cols = 1000, 1000
     grid_data = np.zeros((rows, cols))
     
-    # Measure memory before
-    import psutil
-    process = psutil.Process()
-    memory_before = process.memory_info().rss / (1024 * 1024)  # in MB
-    
-    # Create the map
-    map_obj = MagneticMap(
-        lat_min=0.0,
-        lat_max=1.0,
-        lon_min=0.0,
-        lon_max=1.0,
-        grid=grid_data.tolist(),
-    )
-    
-    # Measure memory after
-    memory_after = process.memory_info().rss / (1024 * 1024)  # in MB
+    def build(grid):
+        return MagneticMap(lat_min=0.0, lat_max=1.0, lon_min=0.0, lon_max=1.0, grid=grid)
     
-    # Calculate memory usage
-    memory_usage = memory_after - memory_before
+    map_obj, memory_usage = _traced_peak_mb(lambda: build(grid_data))
     
     # Print memory usage
-    print(f"\nMemory usage for 1000x1000 grid: {memory_usage:.2f} MB")
-    
-    # Check against the requirement (≤ 200 MB for 1° global grid)
-    # This test may be skipped if psutil is not available or on CI systems
-    if memory_usage > 0:  # Only check if we got a valid measurement
-        assert memory_usage <= 200, f"Memory usage too high: {memory_usage:.2f} MB (target: ≤ 200 MB)"
\ No newline at end of file
+    print(f"\nPeak memory while building 1000x1000 map: {memory_usage:.2f} MB")
+    
+    # The grid is held as one contiguous float64 buffer, never as nested lists
+    grid_mb = map_obj.grid.nbytes / (1024 * 1024)
+    assert map_obj.grid.flags.c_contiguous
+    assert grid_mb <= 10, f"Grid storage too large: {grid_mb:.2f} MB (target: ≤ 10 MB)"
+    
+    # A float64 array is adopted as is rather than copied
+    assert np.shares_memory(map_obj.grid, grid_data)
+    assert memory_usage <= 10, f"Memory usage too high: {memory_usage:.2f} MB (target: ≤ 10 MB)"
+    
+    # Nested lists are converted straight into the one buffer, with no
+    # intermediate copies on the way
+    grid_list = grid_data.tolist()
+    _, list_usage = _traced_peak_mb(lambda: build(grid_list))
+    print(f"Peak memory while building it from nested lists: {list_usage:.2f} MB")
+    assert list_usage <= 10, f"Memory usage too high: {list_usage:.2f} MB (target: ≤ 10 MB)"
@@ -6,6 +6,8 @@ import importlib
 import sys
 from typing import Any
 
+import pytest
+
 
 def test_import_qmag_nav() -> None:
     """Verify that the qmag_nav package can be imported."""
@@ -21,17 +23,18 @@ def test_python_version() -> None:
     assert sys.version_info.minor >= 11, "Python 3.11+ is required"
 
 
-def test_package_structure() -> None:
-    """Verify that the expected subpackages are importable."""
-    subpackages = [
+@pytest.mark.parametrize(
+    "subpackage",
+    [
         "filter",
         "mapping",
         "models",
         "sensor",
         "service",
-    ]
-    
-    for subpackage in subpackages:
-        module_name = f"qmag_nav.{subpackage}"
-        module = importlib.import_module(module_name)
-        assert module is not None, f"Failed to import {module_name}"
\ No newline at end of file
+    ],
+)
+def test_package_structure(subpackage: str) -> None:
+    """Verify that each expected subpackage is importable."""
+    module_name = f"qmag_nav.{subpackage}"
+    module = importlib.import_module(module_name)
+    assert module is not None, f"Failed to import {module_name}"
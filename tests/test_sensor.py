@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import time
+
+import numpy as np
+import pytest
 
 from qmag_nav.models.sensor import CalibrationParams
 from qmag_nav.sensor.magnetometer import Magnetometer, MovingAverageFilter
@@ -25,6 +29,53 @@ def test_moving_average_window_edge_cases():
         MovingAverageFilter(window=0)
 
 
+def test_moving_average_window_wraps():
+    """Samples older than the window are dropped from the mean and buffer."""
+
+    f = MovingAverageFilter(window=3)
+    for i in range(1, 6):
+        result = f.update((i, 2 * i, 0))
+
+    # Mean of the last three samples 3, 4, 5
+    assert result == (4.0, 8.0, 0.0)
+    assert f.snapshot() == [(3.0, 6.0, 0.0), (4.0, 8.0, 0.0), (5.0, 10.0, 0.0)]
+
+
+def test_moving_average_recovers_from_outlier():
+    """A huge sample stops affecting the mean once it leaves the window."""
+
+    f = MovingAverageFilter(window=2)
+    f.update((1e17, 0, 0))
+    results = [f.update((1, 0, 0)) for _ in range(3)]
+
+    # The outlier cancels exactly out of a running sum only if it is re-summed
+    assert results[-1] == (1.0, 0.0, 0.0)
+    assert f.update((3, 0, 0)) == (2.0, 0.0, 0.0)
+
+
+@pytest.mark.serial
+def test_moving_average_update_cost_is_independent_of_window():
+    """A 10 000-sample window updates as fast as a 10-sample one (O(1) per sample)."""
+
+    samples = np.random.default_rng(0).normal(50_000.0, 100.0, size=(100_000, 3))
+    stream = [tuple(row) for row in samples.tolist()]
+
+    def run(window):
+        f = MovingAverageFilter(window=window)
+        f.update(stream[0])  # load the compiled kernel outside the timing
+        start = time.perf_counter()
+        for sample in stream:
+            result = f.update(sample)
+        return result, time.perf_counter() - start
+
+    small, small_time = run(10)
+    large, large_time = run(10_000)
+
+    np.testing.assert_allclose(small, samples[-10:].mean(axis=0), rtol=1e-9)
+    np.testing.assert_allclose(large, samples[-10_000:].mean(axis=0), rtol=1e-9)
+    assert large_time <= 3 * small_time, f"{large_time:.3f}s vs {small_time:.3f}s"
+
+
 def test_moving_average_hot_restart():
     """Buffer can be serialised and restored in a new instance."""
 
@@ -42,6 +93,14 @@ def test_moving_average_hot_restart():
     assert val == 2
 
 
+def test_moving_average_warm_start_from_generator():
+    """Only the last ``window`` samples of a long warm-start stream are kept."""
+
+    f = MovingAverageFilter(window=2, initial=((i, 0, 0) for i in range(1000)))
+
+    assert f.snapshot() == [(998.0, 0.0, 0.0), (999.0, 0.0, 0.0)]
+
+
 def test_magnetometer_calibration_and_filtering():
     # raw samples return constant 10 nT on all axes
     driver = MockSensorDriver(samples=[(10, 10, 10)])
@@ -55,3 +114,30 @@ def test_magnetometer_calibration_and_filtering():
     assert first == (4.0, 4.0, 4.0)
     # Second reading – average of two identical calibrated samples is still 4
     assert second == (4.0, 4.0, 4.0)
+
+
+def test_calibration_apply_array_matches_apply():
+    cal = CalibrationParams(offset=(2, -1, 0.5), scale=(0.5, 2, 1.5))
+    raw = [(10, 10, 10), (0, -3, 7.5)]
+
+    calibrated = cal.apply_array(raw)
+
+    assert calibrated.shape == (2, 3)
+    assert [tuple(row) for row in calibrated.tolist()] == [cal.apply(r) for r in raw]
+
+
+def test_magnetometer_read_batch_matches_read():
+    samples = [(float(i), 2.0 * i, -float(i)) for i in range(7)]
+    cal = CalibrationParams(offset=(1, 0, -1), scale=(2, 0.5, 1))
+    sequential = Magnetometer(MockSensorDriver(samples), calibration=cal, filter_window=4)
+    batched = Magnetometer(MockSensorDriver(samples), calibration=cal, filter_window=4)
+
+    expected = [sequential.read() for _ in range(10)]
+    first = batched.read_batch(3)
+    second = batched.read_batch(7)
+
+    assert first.shape == (3, 3)
+    for got, want in zip(first.tolist() + second.tolist(), expected):
+        assert got == pytest.approx(want)
+    # Filter state carries over to the single-sample path
+    assert batched.read() == pytest.approx(sequential.read())
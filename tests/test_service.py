@@ -1,49 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+
 import pytest
 from fastapi.testclient import TestClient
 
 from qmag_nav.service import api
 from qmag_nav.service.api import EstimateRequest
 
-
-# Create a test client
-client = TestClient(api.app)
+# Every test starts with a fresh EKF in the API
+pytestmark = pytest.mark.usefixtures("reset_api_ekf")
 
 
 def test_health_endpoint():
     """Test the direct function call."""
-    assert api.healthz() == {"status": "ok"}
+    assert asyncio.run(api.healthz()) == {"status": "ok"}
 
 
 def test_estimate_updates_state():
     """Test the direct function call."""
     # First observation at (1,1) — estimate should move away from 0,0.
-    resp1 = api.estimate(EstimateRequest(lat=1.0, lon=1.0))
+    resp1 = asyncio.run(api.estimate(EstimateRequest(lat=1.0, lon=1.0)))
     assert resp1["lat"] > 0 and resp1["lon"] > 0
     assert "quality" in resp1
 
     # Second observation at (2,2) — estimate should increase further.
-    resp2 = api.estimate(EstimateRequest(lat=2.0, lon=2.0))
+    resp2 = asyncio.run(api.estimate(EstimateRequest(lat=2.0, lon=2.0)))
     assert resp2["lat"] > resp1["lat"]
     assert resp2["lon"] > resp1["lon"]
     assert "quality" in resp2
 
 
-def test_health_endpoint_http():
+def test_health_endpoint_http(api_client):
     """Test the HTTP endpoint."""
-    response = client.get("/healthz")
+    response = api_client.get("/healthz")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-def test_estimate_endpoint_http():
+def test_estimate_endpoint_http(api_client):
     """Test the HTTP endpoint."""
-    # Reset the EKF state for this test
-    api._ekf = None
-    
     # First request
-    response1 = client.post(
+    response1 = api_client.post(
         "/estimate",
         json={"lat": 1.0, "lon": 1.0}
     )
@@ -53,7 +52,7 @@ def test_estimate_endpoint_http():
     assert "quality" in data1
     
     # Second request - should show movement
-    response2 = client.post(
+    response2 = api_client.post(
         "/estimate",
         json={"lat": 2.0, "lon": 2.0}
     )
@@ -64,16 +63,36 @@ def test_estimate_endpoint_http():
     assert "quality" in data2
 
 
-def test_process_time_header():
+def test_estimate_batch_matches_sequential_requests(api_client):
+    """Test that a batch gives the same estimates as one request per point."""
+    points = [{"lat": 1.0, "lon": 1.0}, {"lat": 2.0, "lon": 2.0}, {"lat": 2.5, "lon": 1.5}]
+
+    sequential = [api_client.post("/estimate", json=p).json() for p in points]
+
+    # The batch runs in NavEKF.step_batch's fused kernel, which may round
+    # differently from the per-request kernels in the last bits
+    api._ekf = None
+    response = api_client.post("/estimate_batch", json=points)
+    assert response.status_code == 200
+    assert response.json() == [pytest.approx(est, rel=1e-9) for est in sequential]
+
+    # Every element is validated like a single request
+    assert api_client.post("/estimate_batch", json=[{"lat": 1.0}]).status_code == 422
+
+
+def test_process_time_header(api_client):
     """Test that the process time header is added."""
-    response = client.get("/healthz")
+    response = api_client.get("/healthz")
     assert "x-process-time" in response.headers
     assert float(response.headers["x-process-time"]) >= 0
 
+    # Health checks are handled on the event loop, not in the thread pool
+    assert inspect.iscoroutinefunction(api.healthz)
+
 
-def test_cors_headers():
+def test_cors_headers(api_client):
     """Test that CORS headers are present."""
-    response = client.options(
+    response = api_client.options(
         "/estimate",
         headers={"Origin": "http://example.com", "Access-Control-Request-Method": "POST"}
     )
@@ -82,22 +101,32 @@ def test_cors_headers():
     assert response.headers["access-control-allow-origin"] == "*"
 
 
-def test_invalid_request():
+def test_invalid_request(api_client):
     """Test handling of invalid requests."""
     # Missing required fields
-    response = client.post("/estimate", json={})
+    response = api_client.post("/estimate", json={})
     assert response.status_code == 422  # Unprocessable Entity
     
     # Invalid data types
-    response = client.post("/estimate", json={"lat": "invalid", "lon": 1.0})
+    response = api_client.post("/estimate", json={"lat": "invalid", "lon": 1.0})
     assert response.status_code == 422
 
 
-def test_openapi_docs():
+def test_openapi_docs(api_client):
     """Test that OpenAPI docs are available."""
-    response = client.get("/openapi.json")
+    response = api_client.get("/openapi.json")
     assert response.status_code == 200
     schema = response.json()
     assert schema["info"]["title"] == "Quantum Magnetic Navigation API"
     assert "/estimate" in schema["paths"]
     assert "/healthz" in schema["paths"]
+
+
+def test_lifespan_ready_file(tmp_path, monkeypatch):
+    """Test that startup creates the readiness file and shutdown removes it."""
+    ready_file = tmp_path / "ready"
+    monkeypatch.setenv("QMAG_READY_FILE", str(ready_file))
+
+    with TestClient(api.app):
+        assert ready_file.exists()
+    assert not ready_file.exists()